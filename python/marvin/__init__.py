@@ -15,8 +15,8 @@ import sys
 import contextlib
 import yaml
 import six
+import importlib
 from collections import OrderedDict
-from astropy.wcs import FITSFixedWarning
 
 # Set the Marvin version
 __version__ = '2.3.7dev'
@@ -43,7 +43,9 @@ log = initLog(logFilePath)
 warnings.simplefilter('once')
 warnings.filterwarnings('ignore', 'Skipped unsupported reflection of expression-based index')
 # warnings.filterwarnings('ignore', '(.)+size changed, may indicate binary incompatibility(.)+')
-warnings.filterwarnings('ignore', category=FITSFixedWarning)
+# Ignores astropy's FITSFixedWarning. Matches the message instead of the category so that
+# astropy.wcs, which is slow to import, is not imported with marvin.
+warnings.filterwarnings('ignore', r"'\w+fix' made the change")
 
 # This warning seems harmless (see https://github.com/astropy/astropy/issues/6025) so
 # will ignore it for now.
@@ -83,6 +85,50 @@ class MarvinConfig(object):
         xyorig (str):
             Globally set the origin point for all your spaxel selections.  Either 'center' or 'lower'.
             Default is 'center'
+        array_transport (str):
+            How the API sends array data back to you.  Either 'binary' (raw array buffers) or
+            'json'.  Default is 'binary'.
+        array_compression (str):
+            Compression for binary array transport.  Either None or 'zlib'.  Default is None.
+        api_pool_size (int):
+            The number of connections to the API server kept alive for reuse.  Default is 20.
+        api_concurrency (int):
+            The maximum number of API calls run at the same time by the asynchronous
+            methods (e.g., ``Maps.aopen``).  Default is 10.
+        api_retries (int):
+            The number of times an asynchronous API call is retried after a connection
+            error or a temporary server error.  Default is 3.
+        api_backoff (float):
+            The delay, in seconds, before the first retry.  It is doubled after each
+            retry.  Default is 0.5.
+        use_remote_cache (bool):
+            Set to keep the data retrieved remotely by the Tools in an on-disk cache, so it does
+            not need to be downloaded again in future sessions.  Default is False.
+        remote_cache_dir (str):
+            The directory of the remote data cache.  Default is ~/.marvin/cache
+        remote_cache_size (int):
+            The maximum size of the remote data cache, in bytes.  Default is 2 GB.
+        cache_bytes (int):
+            The maximum size, in bytes, of the data (e.g., cube extensions and maps) that
+            the Tools keep in memory.  The least recently used data is discarded, and
+            retrieved again when needed.  Default is 2 GB.
+        max_open_files (int):
+            The maximum number of FITS files that the Tools keep open at the same time.  The
+            least recently used files are closed, and reopened when accessed.  Default is 100.
+        drpall_index_dir (str):
+            If set, the indices of the drpall files, used to look up plate-ifus and mangaids,
+            are saved in this directory and reused in later sessions.  Default is None.
+        datamodel_cache_dir (str):
+            If set, the DAP datamodels are saved in this directory the first time they are
+            built and loaded from it in later sessions.  Default is None.
+        use_gunzip_cache (bool):
+            Set to keep decompressed copies of the gzipped cube and model cube files in a
+            scratch directory, so that they are only decompressed once and can be opened
+            memory-mapped.  Default is True.
+        gunzip_cache_dir (str):
+            The directory of the decompressed files.  Default is ~/.marvin/scratch
+        gunzip_cache_size (int):
+            The maximum size of the decompressed files, in bytes.  Default is 10 GB.
     '''
     def __init__(self):
 
@@ -100,6 +146,22 @@ class MarvinConfig(object):
         self.download = False
         self.use_sentry = True
         self.add_github_message = True
+        self.array_transport = 'binary'
+        self.array_compression = None
+        self.api_pool_size = 20
+        self.api_concurrency = 10
+        self.api_retries = 3
+        self.api_backoff = 0.5
+        self.use_remote_cache = False
+        self.remote_cache_dir = os.path.join(os.path.expanduser('~'), '.marvin', 'cache')
+        self.remote_cache_size = 2 * 1024 ** 3
+        self.cache_bytes = 2 * 1024 ** 3
+        self.max_open_files = 100
+        self.drpall_index_dir = None
+        self.datamodel_cache_dir = None
+        self.use_gunzip_cache = True
+        self.gunzip_cache_dir = os.path.join(os.path.expanduser('~'), '.marvin', 'scratch')
+        self.gunzip_cache_size = 10 * 1024 ** 3
         self._allowed_releases = {}
 
         # Allow DAP queries
@@ -325,6 +387,7 @@ class MarvinConfig(object):
         """Retrieves the URLMap the first time it is needed."""
 
         if self._urlmap is None or (isinstance(self._urlmap, dict) and len(self._urlmap) == 0):
+            from marvin.api.api import Interaction
             try:
                 response = Interaction('/marvin/api/general/getroutemap', request_type='get', auth='netrc')
             except Exception as e:
@@ -340,7 +403,11 @@ class MarvinConfig(object):
     def urlmap(self, value):
         """Manually sets the URLMap."""
         self._urlmap = value
-        arg_validate.urlmap = self._urlmap
+
+        # The API is imported lazily and its arg_validate gets the URLMap when it is.
+        api_base = sys.modules.get('marvin.api.base')
+        if api_base is not None:
+            api_base.arg_validate.urlmap = self._urlmap
 
     @property
     def xyorig(self):
@@ -714,6 +781,7 @@ class MarvinConfig(object):
 
             # send token request
             url = self.urlmap['api']['login']['url']
+            from marvin.api.api import Interaction
             try:
                 resp = Interaction(url, params=data, auth='netrc')
             except Exception as e:
@@ -738,10 +806,37 @@ if not marvindir:
     marvindir = moduledir.rsplit('/', 2)[0]
     os.environ['MARVIN_DIR'] = marvindir
 
-from marvin.api.api import Interaction
-from marvin.api.base import arg_validate
+# Provide access to base submodules from the marvin namespace. These are imported the
+# first time they are accessed, so that ``import marvin`` does not import the tools,
+# the DB models, the API, or their dependencies (matplotlib, scipy, flask, ...).
+_lazy_attributes = {'tools': ('marvin.tools', None),
+                    'db': ('marvin.db', None),
+                    'utils': ('marvin.utils', None),
+                    'Interaction': ('marvin.api.api', 'Interaction'),
+                    'arg_validate': ('marvin.api.base', 'arg_validate')}
+
+
+def __getattr__(name):
+    """Imports the lazy attributes of marvin the first time they are accessed."""
+
+    if name not in _lazy_attributes:
+        raise AttributeError('module {0!r} has no attribute {1!r}'.format(__name__, name))
+
+    module_name, attribute = _lazy_attributes[name]
+    value = importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_attributes))
+
 
-# Provide access to base submodules from the marvin namespace
-from . import tools
-from . import db
-from . import utils
+# Module-level __getattr__ is only supported from Python 3.7 (PEP 562).
+if sys.version_info < (3, 7):
+    for _name in list(_lazy_attributes):
+        __getattr__(_name)
@@ -77,6 +77,13 @@ params = {'query': {'searchfilter': fields.String(allow_none=True),
                     'caching': fields.Boolean(allow_none=True),
                     'query_type': fields.String(allow_none=True, validate=validate.OneOf(['raw', 'core', 'orm']))
                     },
+          'subcube': {'x_start': fields.Integer(allow_none=True, validate=validate.Range(min=0)),
+                      'x_stop': fields.Integer(allow_none=True, validate=validate.Range(min=0)),
+                      'y_start': fields.Integer(allow_none=True, validate=validate.Range(min=0)),
+                      'y_stop': fields.Integer(allow_none=True, validate=validate.Range(min=0)),
+                      'wave_start': fields.Integer(allow_none=True, validate=validate.Range(min=0)),
+                      'wave_stop': fields.Integer(allow_none=True, validate=validate.Range(min=0))
+                      },
           'search': {'searchbox': fields.String(required=True),
                      'parambox': fields.DelimitedList(fields.String(), allow_none=True)
                      },
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# encoding: utf-8
+#
+# Licensed under a 3-clause BSD license.
+#
+
+'''
+Asynchronous access to the Marvin API.
+
+Requires Python 3.5+.  The blocking calls (`~marvin.api.api.Interaction` and
+the initialisation of the Tools in remote mode) are run in a pool of threads
+sharing the pooled API session, so that many of them can be awaited
+concurrently from an asyncio event loop.  The number of calls running at the
+same time is limited by ``config.api_concurrency``, and calls failing with a
+connection error, a timeout, or a temporary server error are retried up to
+``config.api_retries`` times with an exponential backoff starting at
+``config.api_backoff`` seconds.
+
+Example:
+    >>> import asyncio
+    >>> from marvin.tools.maps import Maps
+    >>>
+    >>> async def get_halpha(plateifu):
+    >>>     maps = await Maps.aopen(plateifu, mode='remote')
+    >>>     return await maps.agetMap('emline_gflux', channel='ha_6564')
+    >>>
+    >>> async def main(plateifus):
+    >>>     return await asyncio.gather(*[get_halpha(plateifu) for plateifu in plateifus])
+    >>>
+    >>> halpha_maps = asyncio.run(main(plateifus))
+
+'''
+
+from __future__ import print_function, division, absolute_import
+
+import asyncio
+import functools
+import re
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+from marvin import config, log
+from marvin.api.api import Interaction
+
+
+__all__ = ['run_in_executor', 'AsyncInteraction']
+
+
+_retryable = re.compile(r'(Timeout Error|Connection Error|\b(429|502|503|504) '
+                        r'(Client|Server) Error|Rate Limit Exceeded)')
+
+_executor = None
+_executor_size = None
+_semaphores = weakref.WeakKeyDictionary()
+
+
+def _get_executor():
+    ''' Returns the thread pool in which the blocking calls are run '''
+
+    global _executor, _executor_size
+
+    if _executor is None or _executor_size != config.api_concurrency:
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+        _executor = ThreadPoolExecutor(max_workers=config.api_concurrency)
+        _executor_size = config.api_concurrency
+
+    return _executor
+
+
+def _get_semaphore(loop):
+    ''' Returns the semaphore limiting the concurrent calls in an event loop '''
+
+    # Keyed on the loop and the concurrency, so changing config.api_concurrency takes effect.
+    semaphores = _semaphores.setdefault(loop, {})
+
+    if config.api_concurrency not in semaphores:
+        semaphores[config.api_concurrency] = asyncio.Semaphore(config.api_concurrency)
+
+    return semaphores[config.api_concurrency]
+
+
+def is_retryable(error):
+    ''' True if ``error`` is a connection error or a temporary server error '''
+
+    return _retryable.search(str(error)) is not None
+
+
+async def run_in_executor(func, *args, **kwargs):
+    ''' Runs a blocking call to the API without blocking the event loop
+
+    Parameters:
+        func (callable):
+            The blocking function or class to call.
+        args, kwargs:
+            The arguments to pass to ``func``.
+
+    Returns:
+        The value returned by ``func``.
+
+    '''
+
+    # get_running_loop is only available from Python 3.7.
+    loop = getattr(asyncio, 'get_running_loop', asyncio.get_event_loop)()
+    call = functools.partial(func, *args, **kwargs)
+
+    async with _get_semaphore(loop):
+
+        delay = config.api_backoff
+
+        for attempt in range(config.api_retries + 1):
+            try:
+                return await loop.run_in_executor(_get_executor(), call)
+            except Exception as ee:
+                if attempt == config.api_retries or not is_retryable(ee):
+                    raise
+                log.debug('retrying {0} in {1}s after error: {2}'.format(func, delay, ee))
+
+            await asyncio.sleep(delay)
+            delay *= 2
+
+
+async def AsyncInteraction(route, **kwargs):
+    ''' The asynchronous counterpart of `~marvin.api.api.Interaction`
+
+    Accepts the same parameters as `~marvin.api.api.Interaction` and returns
+    the completed Interaction.
+
+    Example:
+        >>> response = await AsyncInteraction(url.format(name='8485-1901'))
+        >>> data = response.getData()
+
+    '''
+
+    return await run_in_executor(Interaction, route, **kwargs)
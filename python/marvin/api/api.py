@@ -12,11 +12,75 @@ Revision History:
 '''
 from __future__ import print_function
 from __future__ import division
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from brain import bconfig
 from brain.api.api import BrainInteraction
-from marvin import config
+from brain.utils.general import uncompress_data
+from marvin import config, log
+from marvin.api import transport
 
 configkeys = ['release', 'session_id', 'compression']
 
+_session_lock = threading.Lock()
+
+
+def get_session():
+    ''' Returns the process-wide requests Session shared by all Interactions
+
+    The session keeps connections to the API server alive and pools them, so
+    consecutive or concurrent calls do not pay the TCP and TLS setup again.
+    The number of connections kept per host is set by ``config.api_pool_size``.
+
+    '''
+
+    with _session_lock:
+        if bconfig.request_session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=config.api_pool_size,
+                                  pool_maxsize=config.api_pool_size)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            bconfig.request_session = session
+
+        return bconfig.request_session
+
+
+def close_session():
+    ''' Closes the shared requests Session and all its pooled connections '''
+
+    with _session_lock:
+        if bconfig.request_session is not None:
+            bconfig.request_session.close()
+            bconfig.request_session = None
+
+
+class PooledSession(object):
+    ''' A view of the shared Session for a single Interaction
+
+    Requests are sent through the shared, pooled Session, but the
+    authentication is kept per Interaction rather than set on the shared
+    Session, so that Interactions can run safely from several threads.
+
+    '''
+
+    def __init__(self, session):
+        self._session = session
+        self.auth = None
+
+    def get(self, url, **kwargs):
+        kwargs.setdefault('auth', self.auth)
+        return self._session.get(url, **kwargs)
+
+    def post(self, url, **kwargs):
+        kwargs.setdefault('auth', self.auth)
+        return self._session.post(url, **kwargs)
+
+    def close(self):
+        pass
+
 
 class Interaction(BrainInteraction):
     ''' Marvins Interaction class, subclassed from Brain
@@ -59,6 +123,22 @@ class Interaction(BrainInteraction):
         base (str):
             Optional replacement for domain API url.
 
+    By default, the Interaction asks the server for the binary array transport
+    (see `marvin.api.transport`), so routes returning large arrays send them as
+    raw buffers rather than JSON lists.  Set ``config.array_transport = 'json'`` to
+    disable it, or ``config.array_compression = 'zlib'`` to compress the buffers.
+    Arrays decoded from a binary response are read-only.
+
+    All Interactions share a pooled, keep-alive session (see `get_session`).
+    After each call, ``timing`` contains a breakdown, in seconds, of where the
+    time was spent: ``wait`` until the response headers arrived (including
+    connection setup and server processing), ``transfer`` of the response
+    body, ``decode`` of the content, and the ``total``.
+
+    Routes streaming their results row by row (e.g. ``/query/stream/``) can be
+    iterated without loading the whole response in memory, by creating the
+    Interaction with ``send=False`` and calling `iterData`.
+
     Returns:
         results (dict):
             The **Response JSON object** from the API call.  If the API is successful, the json data is extracted
@@ -98,6 +178,116 @@ class Interaction(BrainInteraction):
         else:
             self.params = {k: config.__getattribute__(k) for k in configkeys}
 
+    def _setRequestSession(self):
+        ''' Sets the shared, pooled requests Session '''
+
+        self.session = PooledSession(get_session())
+        self.timing = None
+        self._decode_time = 0.
+        self._iterate = False
+
+    def _closeRequestSession(self):
+        ''' Keeps the shared Session open when a request fails
+
+        Broken connections are discarded by the pool, so there is no need to
+        drop the connections to the server for every failed call.
+
+        '''
+
+        pass
+
+    def _sendRequest(self, request_type):
+        ''' Sends the request, asking for binary arrays if enabled in the config '''
+
+        if config.array_transport == 'binary' and 'Accept' not in self.headers:
+            self.headers.update(transport.accept_header(compression=config.array_compression))
+
+        t0 = time.time()
+        try:
+            super(Interaction, self)._sendRequest(request_type)
+        finally:
+            self._set_timing(time.time() - t0)
+
+    def _set_timing(self, total):
+        ''' Stores the time breakdown of the request '''
+
+        response = getattr(self, '_response', None)
+        wait = response.elapsed.total_seconds() if response is not None else total
+        self.timing = {'wait': wait,
+                       'transfer': max(total - wait - self._decode_time, 0.),
+                       'decode': self._decode_time,
+                       'total': total}
+
+        log.debug('{0!r} timing: {1}'.format(self, ', '.join(
+            '{0}={1:.3f}s'.format(key, self.timing[key])
+            for key in ['wait', 'transfer', 'decode', 'total'])))
+
+    def _get_content(self, response):
+        ''' Gets the response content, decoding the binary array transport '''
+
+        # the content of a successful, iterated response is read in iterData
+        if self._iterate and response.ok:
+            return {'data': None}
+
+        t0 = time.time()
+        try:
+            if transport.is_binary(response.headers.get('Content-Type')):
+                return transport.decode(response.content)
+
+            return super(Interaction, self)._get_content(response)
+        finally:
+            self._decode_time += time.time() - t0
+
+    def iterData(self, request_type='post', chunksize=64 * 1024):
+        ''' Sends the request and iterates over the rows of a streamed response
+
+        The response is read in chunks of ``chunksize`` bytes and each row is
+        decoded as soon as it has been received, so the memory used does not
+        depend on the size of the response.  Rows are always sent as JSON.
+
+        Parameters:
+            request_type (str):
+                The method type of the API call, either "get" or "post".
+            chunksize (int):
+                The size, in bytes, of the chunks read from the response.
+
+        Returns:
+            A generator over the decoded rows of the response.
+
+        Example:
+            >>> url = config.urlmap['api']['stream']['url']
+            >>> ii = Interaction(url, params={'searchfilter': 'nsa.z < 0.1'}, send=False)
+            >>> for row in ii.iterData():
+            >>>     print(row)
+
+        '''
+
+        self.params = self.params if self.params else {}
+        self.params['compression'] = self.compression = 'json'
+        self.stream = True
+        self.datastream = True
+        self._iterate = True
+
+        self._sendRequest(request_type)
+
+        return self._iter_rows(self._response, chunksize)
+
+    def _iter_rows(self, response, chunksize):
+        ''' Splits a streamed response into decoded rows '''
+
+        pending = b''
+        try:
+            for chunk in response.iter_content(chunk_size=chunksize):
+                rows = (pending + chunk).split(b';\n')
+                pending = rows.pop()
+                for row in rows:
+                    if row:
+                        yield uncompress_data(row.decode('utf-8'), uncompress_with='json')
+            if pending.strip():
+                yield uncompress_data(pending.decode('utf-8'), uncompress_with='json')
+        finally:
+            response.close()
+
     def setAuth(self, authtype=None):
         ''' Set the authorization '''
 
@@ -11,14 +11,16 @@ Revision History:
 '''
 from __future__ import print_function
 from __future__ import division
+import json
 from brain.api.base import BrainBaseView
 from brain.utils.general import build_routemap
 from marvin import config
 from marvin.api import ArgValidator, set_api_decorators
-from flask import current_app
+from marvin.api import transport
+from flask import current_app, request, Response
 
 
-arg_validate = ArgValidator(urlmap=None)
+arg_validate = ArgValidator(urlmap=config._urlmap)
 
 
 class BaseView(BrainBaseView):
@@ -38,6 +40,27 @@ class BaseView(BrainBaseView):
 
         return kwargs
 
+    def array_response(self):
+        ''' Returns the results, with any numpy arrays in them, as a Response
+
+        If the client accepts the binary array transport (see
+        `marvin.api.transport`) the arrays are sent as raw buffers, optionally
+        compressed as requested in the ``X-Marvin-Array-Compression`` header.
+        Otherwise falls back to JSON, converting the arrays to lists.
+
+        '''
+
+        best = request.accept_mimetypes.best_match([transport.JSON_MIMETYPE,
+                                                    transport.NDARRAY_MIMETYPE])
+        if best == transport.NDARRAY_MIMETYPE:
+            compression = request.headers.get(transport.COMPRESSION_HEADER, None)
+            compression = compression if compression == 'zlib' else None
+            return Response(transport.encode(self.results, compression=compression),
+                            mimetype=transport.NDARRAY_MIMETYPE)
+
+        return Response(json.dumps(transport.to_json_safe(self.results)),
+                        mimetype=transport.JSON_MIMETYPE)
+
     def before_request(self, *args, **kwargs):
 
         # try to get a local version of the urlmap for the arg_validator
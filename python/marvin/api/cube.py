@@ -237,7 +237,8 @@ class CubeView(BaseView):
         :resjson string traceback: traceback of an error, null if None
         :resjson json data: dictionary of returned data
         :json string cube_extension: the data for the specified extension
-        :resheader Content-Type: application/json
+        :reqheader Accept: application/x-marvin-ndarray to receive the data as binary arrays
+        :resheader Content-Type: application/json or application/x-marvin-ndarray
         :statuscode 200: no error
         :statuscode 422: invalid input parameters
 
@@ -278,9 +279,93 @@ class CubeView(BaseView):
             if extension_data is None:
                 self.results['data'] = {'extension_data': None}
             else:
-                self.results['data'] = {'extension_data': extension_data.tolist()}
+                self.results['data'] = {'extension_data': extension_data}
 
-        return Response(json.dumps(self.results), mimetype='application/json')
+        return self.array_response()
+
+    @route('/<name>/extensions/<cube_extension>/subcube/', methods=['GET', 'POST'],
+           endpoint='getSubCube')
+    @av.check_args(use_params='subcube')
+    def getSubCube(self, args, name, cube_extension):
+        """Returns a slice of a cube extension given a plateifu/mangaid.
+
+        .. :quickref: Cube; Gets a spatial and/or spectral slice of a cube extension
+
+        Only the requested hyperslab is read from the cube file.  Slices follow
+        the Python convention, with ``start`` inclusive and ``stop`` exclusive.
+        Any limit that is not set defaults to the edge of the cube.  For
+        extensions that are spectra, only the wavelength limits are used.
+
+        :param name: The name of the cube as plate-ifu or mangaid
+        :param cube_extension: The name of the cube extension.  Either flux, ivar, or mask.
+        :form release: the release of MaNGA
+        :form x_start: the first x pixel (origin is ``lower``)
+        :form x_stop: the last x pixel, exclusive
+        :form y_start: the first y pixel (origin is ``lower``)
+        :form y_stop: the last y pixel, exclusive
+        :form wave_start: the first wavelength pixel
+        :form wave_stop: the last wavelength pixel, exclusive
+        :resjson int status: status of response. 1 if good, -1 if bad.
+        :resjson string error: error message, null if None
+        :resjson json inconfig: json of incoming configuration
+        :resjson json utahconfig: json of outcoming configuration
+        :resjson string traceback: traceback of an error, null if None
+        :resjson json data: dictionary of returned data
+        :json string extension_data: the data for the specified slice of the extension
+        :reqheader Accept: application/x-marvin-ndarray to receive the data as binary arrays
+        :resheader Content-Type: application/json or application/x-marvin-ndarray
+        :statuscode 200: no error
+        :statuscode 422: invalid input parameters
+
+        **Example request**:
+
+        .. sourcecode:: http
+
+           GET /marvin/api/cubes/8485-1901/extensions/flux/subcube/?wave_start=2800&wave_stop=2900 HTTP/1.1
+           Host: api.sdss.org
+           Accept: application/json, */*
+
+        **Example response**:
+
+        .. sourcecode:: http
+
+           HTTP/1.1 200 OK
+           Content-Type: application/json
+           {
+              "status": 1,
+              "error": null,
+              "inconfig": {"release": "MPL-5"},
+              "utahconfig": {"release": "MPL-5", "mode": "local"},
+              "traceback": null,
+              "data": {"extension_data": [[0,0,..0], [], ... [0, 0, 0,... 0]]
+              }
+           }
+        """
+
+        limits = {key: args.pop(key, None) for key in ['x_start', 'x_stop', 'y_start',
+                                                       'y_stop', 'wave_start', 'wave_stop']}
+
+        # Pass the args in and get the cube
+        args = self._pop_args(args, arglist=['name', 'cube_extension'])
+        cube, res = _getCube(name, use_file=True, **args)
+        self.update_results(res)
+
+        if cube:
+
+            hdu = cube.data[cube_extension.upper()]
+            wave_slice = slice(limits['wave_start'], limits['wave_stop'])
+
+            if hdu.header['NAXIS'] == 0:
+                self.results['data'] = {'extension_data': None}
+            elif hdu.header['NAXIS'] == 1:
+                self.results['data'] = {'extension_data': hdu.section[wave_slice]}
+            else:
+                self.results['data'] = {'extension_data': hdu.section[
+                    wave_slice,
+                    slice(limits['y_start'], limits['y_stop']),
+                    slice(limits['x_start'], limits['x_stop'])]}
+
+        return self.array_response()
 
     @route('/<name>/quantities/<x>/<y>/', methods=['GET', 'POST'],
            endpoint='getCubeQuantitiesSpaxel')
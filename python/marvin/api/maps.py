@@ -229,7 +229,8 @@ class MapsView(marvin.api.base.BaseView):
         :json list mask: the mask values of this map
         :json string unit: the unit on this channel for the given map property
         :json dict header: a dictionary of the header for this map
-        :resheader Content-Type: application/json
+        :reqheader Accept: application/x-marvin-ndarray to receive the data as binary arrays
+        :resheader Content-Type: application/json or application/x-marvin-ndarray
         :statuscode 200: no error
         :statuscode 422: invalid input parameters
 
@@ -278,14 +279,89 @@ class MapsView(marvin.api.base.BaseView):
         try:
             mmap = maps.getMap(property_name=str(property_name), channel=str(channel))
             self.results['data'] = {}
-            self.results['data']['value'] = mmap.value.tolist()
-            self.results['data']['ivar'] = mmap.ivar.tolist() if mmap.ivar is not None else None
-            self.results['data']['mask'] = mmap.mask.tolist() if mmap.mask is not None else None
+            self.results['data']['value'] = mmap.value
+            self.results['data']['ivar'] = mmap.ivar
+            self.results['data']['mask'] = mmap.mask
             self.results['data']['unit'] = mmap.unit.to_string()
         except Exception as ee:
             self.results['error'] = 'Failed to parse input name {0}: {1}'.format(name, str(ee))
 
-        return jsonify(self.results)
+        return self.array_response()
+
+    @route('/<name>/<bintype>/<template>/extensions/',
+           methods=['GET', 'POST'], endpoint='getMapsExtensions')
+    @marvin.api.base.arg_validate.check_args()
+    def getMapsExtensions(self, args, name, bintype, template):
+        """Returns the data, ivar, and mask of all the maps at once.
+
+        .. :quickref: Maps; Get all the extensions of a maps given a name, bintype, and template
+
+        Intended to be used with the binary array transport. Each multi-channel
+        extension is returned as a 3D array with the channels in the first axis.
+
+        :param name: The name of the maps as plate-ifu or mangaid
+        :param bintype: The bintype associated with this maps.  If not defined, the default is used
+        :param template: The template associated with this maps.  If not defined, the default is used
+        :form release: the release of MaNGA data
+        :resjson int status: status of response. 1 if good, -1 if bad.
+        :resjson string error: error message, null if None
+        :resjson json inconfig: json of incoming configuration
+        :resjson json utahconfig: json of outcoming configuration
+        :resjson string traceback: traceback of an error, null if None
+        :resjson json data: dictionary of returned data
+        :json dict extensions: the arrays of each extension, keyed by lowercase extension name
+        :reqheader Accept: application/x-marvin-ndarray to receive the data as binary arrays
+        :resheader Content-Type: application/json or application/x-marvin-ndarray
+        :statuscode 200: no error
+        :statuscode 422: invalid input parameters
+
+        **Example request**:
+
+        .. sourcecode:: http
+
+           GET /marvin/api/maps/8485-1901/SPX/GAU-MILESHC/extensions/ HTTP/1.1
+           Host: api.sdss.org
+           Accept: application/x-marvin-ndarray, */*
+
+        **Example response**:
+
+        .. sourcecode:: http
+
+           HTTP/1.1 200 OK
+           Content-Type: application/json
+           {
+              "status": 1,
+              "error": null,
+              "inconfig": {"release": "MPL-5"},
+              "utahconfig": {"release": "MPL-5", "mode": "local"},
+              "traceback": null,
+              "data": {"extensions": {"binid": [[[-1, -1, ...], ...], ...],
+                                      "emline_gflux": [[[0.0, 0.0, ...], ...], ...],
+                                      "emline_gflux_ivar": [[[0.0, 0.0, ...], ...], ...],
+                                      ...
+                                     }
+                      }
+           }
+
+        """
+
+        # Pop any args we don't want going into Maps
+        args = self._pop_args(args, arglist=['name'])
+
+        # Initialises the Maps object
+        maps, results = _getMaps(name, **args)
+        self.update_results(results)
+
+        if maps is None:
+            return jsonify(self.results)
+
+        try:
+            self.results['data'] = {'extensions': maps.to_cube()}
+        except Exception as ee:
+            self.results['error'] = 'Failed to get the extensions of {0}: {1}'.format(name,
+                                                                                      str(ee))
+
+        return self.array_response()
 
     @route('/<name>/dapall', defaults={'bintype': None, 'template': None},
            methods=['GET', 'POST'], endpoint='dapall')
@@ -216,7 +216,8 @@ class ModelCubeView(BaseView):
         :resjson string traceback: traceback of an error, null if None
         :resjson json data: dictionary of returned data
         :json string modelcube_extension: the data for the specified extension
-        :resheader Content-Type: application/json
+        :reqheader Accept: application/x-marvin-ndarray to receive the data as binary arrays
+        :resheader Content-Type: application/json or application/x-marvin-ndarray
         :statuscode 200: no error
         :statuscode 422: invalid input parameters
 
@@ -257,9 +258,9 @@ class ModelCubeView(BaseView):
             if extension_data is None:
                 self.results['data'] = {'extension_data': None}
             else:
-                self.results['data'] = {'extension_data': extension_data.tolist()}
+                self.results['data'] = {'extension_data': extension_data}
 
-        return Response(json.dumps(self.results), mimetype='application/json')
+        return self.array_response()
 
     @route('/<name>/binids/<modelcube_extension>/',
            defaults={'bintype': None, 'template': None},
@@ -287,7 +288,8 @@ class ModelCubeView(BaseView):
         :resjson string traceback: traceback of an error, null if None
         :resjson json data: dictionary of returned data
         :json string binid: the binid data
-        :resheader Content-Type: application/json
+        :reqheader Accept: application/x-marvin-ndarray to receive the data as binary arrays
+        :resheader Content-Type: application/json or application/x-marvin-ndarray
         :statuscode 200: no error
         :statuscode 422: invalid input parameters
 
@@ -325,11 +327,11 @@ class ModelCubeView(BaseView):
             try:
                 model = modelcube.datamodel.from_fits_extension(modelcube_extension)
                 binid_data = modelcube.get_binid(model)
-                self.results['data'] = {'binid': binid_data.value.tolist()}
+                self.results['data'] = {'binid': binid_data.value}
             except Exception as ee:
                 self.results['error'] = str(ee)
 
-        return Response(json.dumps(self.results), mimetype='application/json')
+        return self.array_response()
 
     @route('/<name>/<bintype>/<template>/quantities/<x>/<y>/',
            methods=['GET', 'POST'], endpoint='getModelCubeQuantitiesSpaxel')
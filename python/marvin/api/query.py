@@ -216,14 +216,17 @@ class QueryView(BaseView):
 
         release = args.pop('release', None)
         args['return_params'] = args.pop('returnparams', None)
+        args['default_params'] = args.pop('defaults', None)
         args['return_type'] = args.pop('rettype', None)
+        for key in ['start', 'end', 'query_type']:
+            args.pop(key, None)
         q = Query(search_filter=searchfilter, release=release, **args)
 
-        output = dict(data=None, chunk=q.limit, query=q.show(),
-                      filter=searchfilter, params=q.params, returnparams=q.return_params, runtime=None,
-                      queryparams_order=q._query_params_order, count=None, totalcount=None)
+        # stream the rows from a server-side cursor, in chunks of limit rows
+        q._sort_query()
+        query = q.query.execution_options(stream_results=True).yield_per(q.limit)
 
-        return Response(stream_with_context(gen(q.query, compression=compression, params=q.params)), mimetype='application/{0}'.format(mimetype))
+        return Response(stream_with_context(gen(query, compression=compression, params=q.params)), mimetype='application/{0}'.format(mimetype))
 
     @route('/cubes/', methods=['GET', 'POST'], endpoint='querycubes')
     @av.check_args(use_params='query', required='searchfilter')
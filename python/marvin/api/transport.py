@@ -0,0 +1,207 @@
+#!/usr/bin/env python
+# encoding: utf-8
+#
+# Licensed under a 3-clause BSD license.
+#
+
+'''
+Binary transport of numpy arrays for the Marvin API.
+
+Responses containing large arrays (cube extensions, maps) are expensive to
+serialise as JSON lists.  This module defines a small container format,
+negotiated via the ``Accept`` header, that ships the arrays as raw
+little-endian buffers alongside a JSON header describing the rest of the
+response.  The layout is::
+
+    MAGIC | header length (uint32, little-endian) | JSON header | padding | buffers
+
+Each array in the response is replaced in the JSON header by a descriptor
+``{"__ndarray__": index}`` pointing into the header's ``arrays`` list, which
+records the dtype, shape, byte offset, size and compression of each buffer.
+Buffers are aligned to 8 bytes so they can be decoded in place with
+`numpy.frombuffer`.
+
+'''
+
+from __future__ import print_function, division, absolute_import
+
+import json
+import struct
+import sys
+import zlib
+
+import numpy as np
+import six
+
+
+NDARRAY_MIMETYPE = 'application/x-marvin-ndarray'
+JSON_MIMETYPE = 'application/json'
+COMPRESSION_HEADER = 'X-Marvin-Array-Compression'
+
+MAGIC = b'MRVNDA\x00\x01'
+_ALIGN = 8
+_valid_compression = [None, 'zlib']
+
+
+def _little_endian(array):
+    ''' Returns a C-contiguous, little-endian version of ``array`` '''
+
+    # ascontiguousarray promotes 0-d arrays to 1-d, so the shape is restored
+    shape = np.shape(array)
+
+    array = np.ascontiguousarray(array)
+    byteorder = array.dtype.byteorder
+    if byteorder == '>' or (byteorder == '=' and sys.byteorder == 'big'):
+        array = array.astype(array.dtype.newbyteorder('<'))
+
+    return array.reshape(shape)
+
+
+def _json_default(obj):
+    ''' Serialises numpy scalars that json does not know about '''
+
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError('{0!r} is not JSON serializable'.format(obj))
+
+
+def _replace_arrays(obj, arrays):
+    ''' Recursively swaps numpy arrays in ``obj`` by descriptors '''
+
+    if isinstance(obj, np.ndarray):
+        if obj.dtype.hasobject:
+            return obj.tolist()
+        arrays.append(_little_endian(np.ma.getdata(obj)))
+        return {'__ndarray__': len(arrays) - 1}
+    elif isinstance(obj, dict):
+        return {key: _replace_arrays(value, arrays) for key, value in obj.items()}
+    elif isinstance(obj, (list, tuple)):
+        return [_replace_arrays(value, arrays) for value in obj]
+
+    return obj
+
+
+def to_json_safe(obj):
+    ''' Recursively converts numpy arrays in ``obj`` to lists
+
+    This is the JSON fallback for clients that do not accept the binary
+    transport.
+
+    '''
+
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    elif isinstance(obj, dict):
+        return {key: to_json_safe(value) for key, value in obj.items()}
+    elif isinstance(obj, (list, tuple)):
+        return [to_json_safe(value) for value in obj]
+
+    return obj
+
+
+def encode(results, compression=None):
+    ''' Encodes a response dictionary into the binary array transport
+
+    Parameters:
+        results (dict):
+            The response dictionary.  Any `numpy.ndarray` nested in it (at any
+            depth within dictionaries and lists) is sent as a raw buffer.
+        compression (str):
+            Either None or ``'zlib'``.  The compression applied to each buffer.
+
+    Returns:
+        The encoded response as bytes.
+
+    '''
+
+    assert compression in _valid_compression, \
+        'compression must be one of {0}'.format(_valid_compression)
+
+    arrays = []
+    body = _replace_arrays(results, arrays)
+
+    buffers = []
+    descriptors = []
+    offset = 0
+    for array in arrays:
+        buff = array.tobytes() if compression is None else zlib.compress(array.tobytes())
+        descriptors.append({'dtype': array.dtype.str, 'shape': list(array.shape),
+                            'offset': offset, 'nbytes': len(buff), 'compression': compression})
+        padding = -len(buff) % _ALIGN
+        buffers.append(buff + b'\x00' * padding)
+        offset += len(buff) + padding
+
+    header = json.dumps({'body': body, 'arrays': descriptors},
+                        default=_json_default).encode('utf-8')
+    header += b' ' * (-(len(MAGIC) + 4 + len(header)) % _ALIGN)
+
+    return b''.join([MAGIC, struct.pack('<I', len(header)), header] + buffers)
+
+
+def decode(content):
+    ''' Decodes a response encoded with `encode`
+
+    Uncompressed arrays are returned as read-only views of ``content`` built
+    with `numpy.frombuffer`, so no copy of the data is made.  Copy them if you
+    need to modify them in place.
+
+    Parameters:
+        content (bytes):
+            The raw response content.
+
+    Returns:
+        The response dictionary, with the original arrays restored.
+
+    '''
+
+    content = memoryview(content)
+    nmagic = len(MAGIC)
+    if content[:nmagic].tobytes() != MAGIC:
+        raise ValueError('content is not a valid Marvin binary array response')
+
+    hlen = struct.unpack('<I', content[nmagic:nmagic + 4].tobytes())[0]
+    start = nmagic + 4 + hlen
+    header = json.loads(content[nmagic + 4:start].tobytes().decode('utf-8'))
+
+    arrays = []
+    for desc in header['arrays']:
+        dtype = np.dtype(desc['dtype'])
+        offset = start + desc['offset']
+        if desc['compression'] == 'zlib':
+            buff = zlib.decompress(content[offset:offset + desc['nbytes']].tobytes())
+            array = np.frombuffer(buff, dtype=dtype)
+        else:
+            array = np.frombuffer(content, dtype=dtype, count=desc['nbytes'] // dtype.itemsize,
+                                  offset=offset)
+        arrays.append(array.reshape(desc['shape']))
+
+    return _restore_arrays(header['body'], arrays)
+
+
+def _restore_arrays(obj, arrays):
+    ''' Recursively swaps descriptors in ``obj`` by their arrays '''
+
+    if isinstance(obj, dict):
+        if len(obj) == 1 and '__ndarray__' in obj:
+            return arrays[obj['__ndarray__']]
+        return {key: _restore_arrays(value, arrays) for key, value in obj.items()}
+    elif isinstance(obj, list):
+        return [_restore_arrays(value, arrays) for value in obj]
+
+    return obj
+
+
+def accept_header(compression=None):
+    ''' Returns the request headers used to ask for the binary transport '''
+
+    headers = {'Accept': '{0}, {1};q=0.9'.format(NDARRAY_MIMETYPE, JSON_MIMETYPE)}
+    if compression:
+        headers[COMPRESSION_HEADER] = compression
+
+    return headers
+
+
+def is_binary(content_type):
+    ''' True if ``content_type`` is the binary array transport '''
+
+    return isinstance(content_type, six.string_types) and NDARRAY_MIMETYPE in content_type
@@ -15,6 +15,8 @@ import os
 import time
 import six
 
+import numpy as np
+
 import marvin
 import marvin.tools.plate
 from marvin.core.exceptions import MarvinError
@@ -26,7 +28,7 @@ import sdss_access.path
 import sdss_access.sync
 
 
-__ALL__ = ['VACContainer', 'VACMixIn']
+__ALL__ = ['VACContainer', 'VACMixIn', 'VACTarget', 'VACFile', 'get_vac_file']
 
 
 def check_for_vac(f):
@@ -272,6 +274,148 @@ class VACMixIn(object, six.with_metaclass(abc.ABCMeta)):
         return path
 
 
+class VACFile(object):
+    ''' A shared, memory-mapped reader of a VAC FITS file
+
+    The file is opened memory-mapped the first time it is needed, so that
+    extensions are not read into memory until rows are selected from them.
+    For each extension and target column, an index of the sorted target ids
+    and their row numbers is built on first use and saved next to the file
+    (``<vacfile>.<ext>-<column>.index.npz``), if the directory is writable.
+    Use `get_vac_file` to get the reader shared by all the targets.
+
+    Parameters:
+        path (str):
+            The path to the VAC FITS file.
+
+    '''
+
+    def __init__(self, path):
+        self.path = path
+        self._hdulist = None
+        self._indices = {}
+
+    def __repr__(self):
+        return '<VACFile (path={0!r})>'.format(self.path)
+
+    @property
+    def hdulist(self):
+        ''' The memory-mapped ``HDUList`` of the file '''
+
+        if self._hdulist is None:
+            self._hdulist = fits.open(self.path, memmap=True)
+
+        return self._hdulist
+
+    def close(self):
+        ''' Closes the file. It is reopened if its data is accessed again '''
+
+        if self._hdulist is not None:
+            self._hdulist.close()
+            self._hdulist = None
+
+    def get_data(self, ext=1):
+        ''' Returns the memory-mapped data of an extension '''
+
+        return self.hdulist[ext].data
+
+    def _signature(self):
+        ''' Returns the modification time and size of the file '''
+
+        stat = os.stat(self.path)
+        return np.array([stat.st_mtime, stat.st_size], dtype=np.float64)
+
+    def _index_path(self, ext, column):
+        return '{0}.{1}-{2}.index.npz'.format(self.path, ext, column.lower())
+
+    def _load_index(self, ext, column):
+        ''' Loads a saved index, or returns None if missing or outdated '''
+
+        index_path = self._index_path(ext, column)
+        if not os.path.exists(index_path):
+            return None
+
+        try:
+            with np.load(index_path, allow_pickle=False) as data:
+                if not np.array_equal(data['signature'], self._signature()):
+                    return None
+                return data['targetids'], data['rows']
+        except Exception as ee:
+            marvin.log.debug('failed loading VAC index {0}: {1}'.format(index_path, ee))
+            return None
+
+    def _save_index(self, ext, column, targetids, rows):
+        ''' Saves an index next to the file, if possible '''
+
+        index_path = self._index_path(ext, column)
+        tmp_path = '{0}.{1}.tmp.npz'.format(index_path, os.getpid())
+
+        try:
+            np.savez(tmp_path, signature=self._signature(), targetids=targetids, rows=rows)
+            os.rename(tmp_path, index_path)
+        except (IOError, OSError) as ee:
+            marvin.log.debug('failed saving VAC index {0}: {1}'.format(index_path, ee))
+
+    def get_index(self, ext, column):
+        ''' Returns the sorted target ids of a column and their row numbers '''
+
+        if (ext, column) not in self._indices:
+
+            index = self._load_index(ext, column)
+
+            if index is None:
+                values = np.asarray(self.get_data(ext)[column])
+                if values.dtype.kind == 'S':
+                    values = np.char.decode(values, 'utf-8')
+                values = np.char.strip(values.astype(str))
+
+                rows = np.argsort(values, kind='mergesort')
+                index = (values[rows], rows)
+                self._save_index(ext, column, *index)
+
+            self._indices[(ext, column)] = index
+
+        return self._indices[(ext, column)]
+
+    def get_rows(self, targetid, column, ext=1):
+        ''' Returns the sorted row numbers of ``targetid`` in an extension '''
+
+        targetids, rows = self.get_index(ext, column)
+
+        targetid = str(targetid).strip()
+        start = np.searchsorted(targetids, targetid, side='left')
+        stop = np.searchsorted(targetids, targetid, side='right')
+
+        return np.sort(rows[start:stop])
+
+
+_vac_files = {}
+
+
+def get_vac_file(path):
+    ''' Returns the `VACFile` for a path, shared by the whole process
+
+    The reader is recreated, and the previous one closed, if the file has
+    been modified.
+
+    '''
+
+    stat = os.stat(path)
+    realpath = os.path.realpath(path)
+    signature = (stat.st_mtime, stat.st_size)
+
+    if realpath in _vac_files:
+        old_signature, vac_file = _vac_files[realpath]
+        if old_signature == signature:
+            return vac_file
+        vac_file.close()
+
+    vac_file = VACFile(path)
+    _vac_files[realpath] = (signature, vac_file)
+
+    return vac_file
+
+
 class VACTarget(object):
     ''' Customization Class to allow for returning complex target data
 
@@ -326,8 +470,8 @@ class VACTarget(object):
         self._ttype = parseIdentifier(targetid)
         assert self._ttype in ['plateifu', 'mangaid'], 'Input targetid must be a valid plateifu or mangaid'
         self._vacfile = vacfile
-        self._data = self._get_data(self._vacfile)
-        self._indata = targetid in self._data[self._ttype]
+        self._rows = self._get_rows(self._ttype)
+        self._indata = len(self._rows) > 0
 
     def __repr__(self):
         return 'Target({0})'.format(self.targetid)
@@ -338,8 +482,12 @@ class VACTarget(object):
         if not self._indata:
             return "No data exists for {0}".format(self.targetid)
 
-        idx = self._data[self._ttype] == self.targetid
-        return self._data[idx]
+        return self._data[self._rows]
+
+    @property
+    def _data(self):
+        ''' The memory-mapped data of the first data HDU of the VAC file '''
+        return self._get_data(self._vacfile)
 
     @staticmethod
     def _open_file(vacfile):
@@ -347,8 +495,23 @@ class VACTarget(object):
         return fits.open(vacfile)
 
     def _get_data(self, vacfile=None, ext=1):
-        ''' Get only the data from the VAC file from a given extension '''
-        if not vacfile:
-            vacfile = self._vacfile
+        ''' Get only the data from the VAC file from a given extension
+
+        The data of the VAC summary file is memory-mapped, so that only the
+        rows selected from it are read.  Other files (e.g., the spectrum of
+        a target) are read without keeping them open.
+
+        '''
+        if not vacfile or vacfile == self._vacfile:
+            return get_vac_file(self._vacfile).get_data(ext)
         return fits.getdata(vacfile, ext)
 
+    def _get_rows(self, column, ext=1):
+        ''' Get the row numbers of the targetid in a column of an extension
+
+        Uses the index of the column (see `VACFile`), instead of comparing
+        the targetid with the whole column.
+
+        '''
+        return get_vac_file(self._vacfile).get_rows(self.targetid, column, ext=ext)
+
@@ -99,8 +99,8 @@ class FFlyTarget(VACTarget):
         self._image_sz = imagesz
         self._parameters = ['lw_age', 'mw_age', 'lw_z', 'mw_z']
 
-        # select the index of the targetid from the main VAC extension
-        self._idx = self._get_data(ext='GALAXY_INFO')['plateifu'] == targetid
+        # select the rows of the targetid from the index of the main VAC extension
+        self._idx = self._get_rows('plateifu', ext='GALAXY_INFO')
 
     def stellar_pops(self, parameter=None):
         ''' Returns the global stellar population properties
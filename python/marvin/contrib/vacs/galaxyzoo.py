@@ -5,10 +5,9 @@
 
 from __future__ import print_function, division, absolute_import
 
-import astropy
 import marvin.tools
 
-from .base import VACMixIn
+from .base import VACMixIn, get_vac_file
 
 
 class GZVAC(VACMixIn):
@@ -58,14 +57,12 @@ class GZVAC(VACMixIn):
         if not self.file_exists(self.summary_file):
             self.summary_file = self.download_vac("mangagalaxyzoo", path_params=self.path_params)
 
-        # Open the file using fits.getdata for extension 1
-        data = astropy.io.fits.getdata(self.summary_file, 1)
-
-        # Return selected line(s)
-        indata = mangaid in data["mangaid"]
-        if not indata:
+        # Find the rows of the target in extension 1 using the index of the file
+        vacfile = get_vac_file(self.summary_file)
+        rows = vacfile.get_rows(mangaid, "mangaid", ext=1)
+        if len(rows) == 0:
             return "No Galaxy Zoo data exists for {0}".format(mangaid)
 
-        idx = data["mangaid"] == mangaid
-        return data[idx]
+        # Return selected line(s)
+        return vacfile.get_data(1)[rows]
 
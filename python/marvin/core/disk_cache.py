@@ -0,0 +1,445 @@
+#!/usr/bin/env python
+# encoding: utf-8
+#
+# disk_cache.py
+#
+# Licensed under a 3-clause BSD license.
+
+
+from __future__ import absolute_import, division, print_function
+
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import warnings
+
+import numpy as np
+
+import marvin
+from marvin.core.exceptions import MarvinUserWarning
+
+
+__ALL__ = ['DiskCache', 'GunzipCache', 'get_remote_cache', 'get_gunzip_cache', 'is_gzipped']
+
+
+def _split_arrays(obj, arrays):
+    """Recursively swaps numpy arrays in ``obj`` by placeholders."""
+
+    if isinstance(obj, np.ndarray) and not obj.dtype.hasobject:
+        arrays.append(obj)
+        return {'__ndarray__': len(arrays) - 1}
+    elif isinstance(obj, np.ndarray):
+        return obj.tolist()
+    elif isinstance(obj, np.generic):
+        return obj.item()
+    elif isinstance(obj, dict):
+        return {key: _split_arrays(value, arrays) for key, value in obj.items()}
+    elif isinstance(obj, (list, tuple)):
+        return [_split_arrays(value, arrays) for value in obj]
+
+    return obj
+
+
+def _join_arrays(obj, arrays):
+    """Recursively swaps placeholders in ``obj`` by their arrays."""
+
+    if isinstance(obj, dict):
+        if len(obj) == 1 and '__ndarray__' in obj:
+            return arrays[obj['__ndarray__']]
+        return {key: _join_arrays(value, arrays) for key, value in obj.items()}
+    elif isinstance(obj, list):
+        return [_join_arrays(value, arrays) for value in obj]
+
+    return obj
+
+
+class DiskCache(object):
+    """A persistent, size-limited cache of API data.
+
+    Each entry is a dictionary, as returned by
+    `~marvin.api.api.Interaction.getData`, identified by a key that is a
+    tuple of strings. Entries are stored in a subdirectory of ``path`` named
+    after the hash of the key. Numpy arrays in the dictionary are saved as
+    ``.npy`` files and returned memory-mapped and read-only; everything else
+    is saved as JSON.
+
+    The total size of the cache is read from disk on the first write and
+    then updated with the size of each new entry. When it exceeds
+    ``max_bytes``, the least recently used entries are removed until the
+    cache is below ``low_water * max_bytes``, so that the directory is only
+    scanned once every several writes.
+
+    Parameters:
+        path (str):
+            The directory in which to store the cache.
+        max_bytes (int):
+            The maximum size of the cache, in bytes.
+        low_water (float):
+            The fraction of ``max_bytes`` to which the cache is reduced when
+            entries are removed.
+
+    """
+
+    _meta_file = 'entry.json'
+
+    def __init__(self, path, max_bytes, low_water=0.9):
+
+        self.path = os.path.realpath(os.path.expanduser(path))
+        self.max_bytes = int(max_bytes)
+        self.low_water = low_water
+
+        self._size = None
+        self._lock = threading.RLock()
+
+    def __repr__(self):
+        return '<DiskCache path={0!r}, max_bytes={1}>'.format(self.path, self.max_bytes)
+
+    @staticmethod
+    def _hash_key(key):
+        """Returns the hash identifying a key."""
+
+        return hashlib.sha1(json.dumps([str(item) for item in key]).encode('utf-8')).hexdigest()
+
+    def _entry_path(self, key):
+        return os.path.join(self.path, self._hash_key(key))
+
+    def get(self, key):
+        """Returns the entry for ``key``, or None if it is not cached."""
+
+        entry_path = self._entry_path(key)
+        meta_path = os.path.join(entry_path, self._meta_file)
+
+        try:
+            with open(meta_path, 'r') as meta_file:
+                meta = json.load(meta_file)
+            if meta['key'] != [str(item) for item in key]:
+                return None
+            arrays = [np.load(os.path.join(entry_path, 'array_{0}.npy'.format(ii)), mmap_mode='r')
+                      for ii in range(meta['n_arrays'])]
+        except (IOError, OSError, ValueError, KeyError):
+            return None
+
+        # Marks the entry as recently used.
+        try:
+            os.utime(meta_path, None)
+        except OSError:
+            pass
+
+        return _join_arrays(meta['data'], arrays)
+
+    def set(self, key, data):
+        """Stores ``data`` in the cache as the entry for ``key``."""
+
+        arrays = []
+        meta = {'key': [str(item) for item in key],
+                'data': _split_arrays(data, arrays),
+                'n_arrays': len(arrays)}
+
+        entry_path = self._entry_path(key)
+        tmp_path = None
+
+        try:
+            if not os.path.exists(self.path):
+                os.makedirs(self.path)
+
+            # Writes the entry to a temporary directory that is then renamed,
+            # so that readers never see a partially written entry.
+            tmp_path = tempfile.mkdtemp(dir=self.path, prefix='.tmp')
+            for ii, array in enumerate(arrays):
+                np.save(os.path.join(tmp_path, 'array_{0}.npy'.format(ii)), array)
+            with open(os.path.join(tmp_path, self._meta_file), 'w') as meta_file:
+                json.dump(meta, meta_file)
+
+            with self._lock:
+
+                # The size of the entry that is replaced, if any.
+                try:
+                    old_size = self._entry_size(entry_path)
+                except OSError:
+                    old_size = 0
+
+                if os.path.exists(entry_path):
+                    shutil.rmtree(entry_path, ignore_errors=True)
+                os.rename(tmp_path, entry_path)
+
+                self._update_size(entry_path, old_size)
+
+        except (IOError, OSError, TypeError, ValueError) as ee:
+            if tmp_path is not None:
+                shutil.rmtree(tmp_path, ignore_errors=True)
+            warnings.warn('failed writing to the remote cache: {0}'.format(ee), MarvinUserWarning)
+
+    def _update_size(self, entry_path, old_size):
+        """Adds a new entry to the size of the cache and evicts entries if needed.
+
+        ``old_size`` is the size of the entry it replaced, if any.
+
+        Must be called with the lock held.
+
+        """
+
+        try:
+            if self._size is None:
+                self._size = self.size
+            else:
+                self._size += self._entry_size(entry_path) - old_size
+
+            if self._size > self.max_bytes:
+                self.evict()
+
+        except (IOError, OSError) as ee:
+            # Other processes may be writing or removing entries at the same time.
+            self._size = None
+            warnings.warn('failed evicting from the remote cache: {0}'.format(ee),
+                          MarvinUserWarning)
+
+    @staticmethod
+    def _entry_size(entry_path):
+        """Returns the size of the files of an entry, in bytes."""
+
+        return sum(os.path.getsize(os.path.join(entry_path, fn))
+                   for fn in os.listdir(entry_path))
+
+    def _entries(self):
+        """Returns a list of (last access, size, path) for each entry."""
+
+        entries = []
+
+        try:
+            names = os.listdir(self.path)
+        except OSError:
+            return entries
+
+        for name in names:
+            entry_path = os.path.join(self.path, name)
+            meta_path = os.path.join(entry_path, self._meta_file)
+            if name.startswith('.'):
+                continue
+            # Entries can be removed by another process while they are listed.
+            try:
+                entries.append((os.path.getmtime(meta_path), self._entry_size(entry_path),
+                                entry_path))
+            except OSError:
+                continue
+
+        return entries
+
+    @property
+    def size(self):
+        """The total size of the cache, in bytes."""
+
+        return sum(entry[1] for entry in self._entries())
+
+    def evict(self):
+        """Removes the least recently used entries if the cache exceeds ``max_bytes``.
+
+        Entries are removed until the cache is below ``low_water * max_bytes``.
+
+        """
+
+        with self._lock:
+
+            entries = sorted(self._entries())
+            total = sum(entry[1] for entry in entries)
+
+            if total > self.max_bytes:
+                while entries and total > self.low_water * self.max_bytes:
+                    __, size, entry_path = entries.pop(0)
+                    shutil.rmtree(entry_path, ignore_errors=True)
+                    total -= size
+
+            self._size = total
+
+    def clear(self):
+        """Removes all the entries in the cache."""
+
+        with self._lock:
+
+            for __, __, entry_path in self._entries():
+                shutil.rmtree(entry_path, ignore_errors=True)
+
+            self._size = 0
+
+
+_remote_caches = {}
+
+
+def get_remote_cache():
+    """Returns the `.DiskCache` for remote data, or None if disabled.
+
+    The cache is configured with ``config.use_remote_cache``,
+    ``config.remote_cache_dir``, and ``config.remote_cache_size``.
+
+    """
+
+    config = marvin.config
+
+    if not config.use_remote_cache:
+        return None
+
+    # The cache is shared, so that its size is only read from disk once.
+    key = (config.remote_cache_dir, config.remote_cache_size)
+    if key not in _remote_caches:
+        _remote_caches[key] = DiskCache(*key)
+
+    return _remote_caches[key]
+
+
+def is_gzipped(filename):
+    """Returns True if ``filename`` is gzip-compressed."""
+
+    with open(filename, 'rb') as ff:
+        return ff.read(2) == b'\x1f\x8b'
+
+
+class GunzipCache(object):
+    """A persistent, size-limited cache of decompressed gzipped files.
+
+    The decompressed copy of a file is stored in ``path`` and named after the
+    hash of the real path, modification time, and size of the original, so
+    that it is reused by other objects and processes, and decompressed again
+    if the original changes. Copies are written to a temporary file that is
+    then renamed, so several processes can share the cache.
+
+    When the total size of the cache exceeds ``max_bytes``, the least
+    recently used copies are removed. Processes that have them open can
+    continue reading them.
+
+    Parameters:
+        path (str):
+            The directory in which to store the decompressed files.
+        max_bytes (int):
+            The maximum size of the cache, in bytes.
+
+    """
+
+    _chunk_size = 16 * 1024 ** 2
+
+    def __init__(self, path, max_bytes):
+
+        self.path = os.path.realpath(os.path.expanduser(path))
+        self.max_bytes = int(max_bytes)
+
+    def __repr__(self):
+        return '<GunzipCache path={0!r}, max_bytes={1}>'.format(self.path, self.max_bytes)
+
+    def _entry_path(self, filename):
+        """Returns the path of the decompressed copy of ``filename``."""
+
+        realpath = os.path.realpath(filename)
+        stat = os.stat(realpath)
+        key = json.dumps([realpath, stat.st_mtime, stat.st_size])
+
+        basename = os.path.basename(realpath)
+        basename = basename[:-3] if basename.endswith('.gz') else basename
+
+        return os.path.join(self.path, '{0}-{1}'.format(
+            hashlib.sha1(key.encode('utf-8')).hexdigest()[:16], basename))
+
+    def get(self, filename):
+        """Returns the path of the decompressed copy of ``filename``.
+
+        The file is decompressed if it is not already in the cache.
+
+        """
+
+        entry_path = self._entry_path(filename)
+
+        if os.path.exists(entry_path):
+            # Marks the entry as recently used.
+            try:
+                os.utime(entry_path, None)
+            except OSError:
+                pass
+            return entry_path
+
+        if not os.path.exists(self.path):
+            os.makedirs(self.path)
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, prefix='.tmp')
+
+        try:
+            with os.fdopen(fd, 'wb') as tmp_file:
+                with gzip.open(filename, 'rb') as gzip_file:
+                    shutil.copyfileobj(gzip_file, tmp_file, self._chunk_size)
+            os.rename(tmp_path, entry_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        self.evict(keep=entry_path)
+
+        return entry_path
+
+    def _entries(self):
+        """Returns a list of (last access, size, path) for each file."""
+
+        entries = []
+
+        if not os.path.exists(self.path):
+            return entries
+
+        for name in os.listdir(self.path):
+            entry_path = os.path.join(self.path, name)
+            if name.startswith('.') or not os.path.isfile(entry_path):
+                continue
+            entries.append((os.path.getmtime(entry_path), os.path.getsize(entry_path),
+                            entry_path))
+
+        return entries
+
+    @property
+    def size(self):
+        """The total size of the cache, in bytes."""
+
+        return sum(entry[1] for entry in self._entries())
+
+    def evict(self, keep=None):
+        """Removes the least recently used files until the cache fits in ``max_bytes``.
+
+        The file ``keep`` is never removed.
+
+        """
+
+        entries = sorted(self._entries())
+        total = sum(entry[1] for entry in entries)
+
+        while entries and total > self.max_bytes:
+            __, size, entry_path = entries.pop(0)
+            if entry_path == keep:
+                continue
+            try:
+                os.remove(entry_path)
+            except OSError:
+                pass
+            total -= size
+
+    def clear(self):
+        """Removes all the files in the cache."""
+
+        for __, __, entry_path in self._entries():
+            try:
+                os.remove(entry_path)
+            except OSError:
+                pass
+
+
+def get_gunzip_cache():
+    """Returns the `.GunzipCache` for gzipped files, or None if disabled.
+
+    The cache is configured with ``config.use_gunzip_cache``,
+    ``config.gunzip_cache_dir``, and ``config.gunzip_cache_size``.
+
+    """
+
+    config = marvin.config
+
+    if not config.use_gunzip_cache:
+        return None
+
+    return GunzipCache(config.gunzip_cache_dir, config.gunzip_cache_size)
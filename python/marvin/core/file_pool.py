@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+# encoding: utf-8
+#
+# file_pool.py
+#
+# Licensed under a 3-clause BSD license.
+
+
+from __future__ import absolute_import, division, print_function
+
+import threading
+import warnings
+from collections import OrderedDict
+
+import marvin
+from marvin.core.exceptions import MarvinUserWarning
+
+
+__ALL__ = ['FileHandle', 'FilePool', 'get_file_pool']
+
+
+class FilePool(object):
+    """A process-wide pool of open files, shared by all the Tools.
+
+    Keeps at most ``max_files`` files open. When the limit is reached, the
+    least recently used file is closed. Files are opened through a
+    `.FileHandle`, which reopens its file the next time it is accessed.
+
+    Parameters:
+        max_files (int or None):
+            The maximum number of open files. If ``None``, uses
+            ``config.max_open_files``.
+
+    """
+
+    def __init__(self, max_files=None):
+
+        self._max_files = max_files
+        self._open = OrderedDict()
+        self._lock = threading.RLock()
+
+        self.opened = 0
+        self.closed = 0
+
+    def __repr__(self):
+        return '<FilePool n_open={0}, max_files={1}>'.format(len(self), self.max_files)
+
+    def __len__(self):
+        return len(self._open)
+
+    def __contains__(self, handle):
+        return handle in self._open
+
+    @property
+    def max_files(self):
+        """The maximum number of open files."""
+
+        if self._max_files is not None:
+            return self._max_files
+
+        return marvin.config.max_open_files
+
+    @max_files.setter
+    def max_files(self, value):
+
+        self._max_files = value
+        self.evict()
+
+    def open(self, handle):
+        """Returns the open file for ``handle``, opening it if needed."""
+
+        with self._lock:
+
+            if handle in self._open:
+                # Reinserts the file as the most recently used.
+                fileobj = self._open.pop(handle)
+                self._open[handle] = fileobj
+                return fileobj
+
+            fileobj = handle.opener(handle.filename)
+            self.opened += 1
+
+            self._open[handle] = fileobj
+            self.evict(keep=handle)
+
+            return fileobj
+
+    def close(self, handle):
+        """Closes the file for ``handle``, if it is open."""
+
+        with self._lock:
+            if handle in self._open:
+                self._close(self._open.pop(handle))
+
+    def evict(self, keep=None):
+        """Closes the least recently used files until there are at most ``max_files`` open.
+
+        The file for the handle ``keep`` is never closed.
+
+        """
+
+        max_files = self.max_files
+        if max_files is None:
+            return
+
+        with self._lock:
+            for handle in list(self._open):
+                if len(self._open) <= max(max_files, 1):
+                    break
+                if handle is not keep:
+                    self._close(self._open.pop(handle))
+
+    def clear(self):
+        """Closes all the files."""
+
+        with self._lock:
+            while self._open:
+                self._close(self._open.popitem(last=False)[1])
+
+    def _close(self, fileobj):
+
+        self.closed += 1
+
+        try:
+            fileobj.close()
+        except Exception as ee:
+            warnings.warn('failed to close file: {0}'.format(ee), MarvinUserWarning)
+
+
+class FileHandle(object):
+    """A handle to a file in the `.FilePool`.
+
+    The file is opened with ``opener(filename)`` the first time it is
+    accessed (see `.fileobj`) and reopened if the pool has closed it since.
+    Pickling a `.FileHandle` keeps only the filename and the opener.
+
+    Parameters:
+        filename (str):
+            The path of the file.
+        opener (callable):
+            The function used to open the file, e.g., `astropy.io.fits.open`.
+        pool (`.FilePool` or None):
+            The pool of open files. If ``None``, uses `.get_file_pool`.
+
+    """
+
+    def __init__(self, filename, opener, pool=None):
+
+        self.filename = filename
+        self.opener = opener
+        self._pool = pool
+
+    def __repr__(self):
+        return '<FileHandle filename={0!r}, is_open={1}>'.format(self.filename, self.is_open)
+
+    @property
+    def pool(self):
+        """The `.FilePool` of this handle."""
+
+        return self._pool if self._pool is not None else get_file_pool()
+
+    @property
+    def fileobj(self):
+        """The open file, reopened if needed."""
+
+        return self.pool.open(self)
+
+    @property
+    def is_open(self):
+        """True if the file is currently open."""
+
+        return self in self.pool
+
+    def close(self):
+        """Closes the file. It will be reopened if accessed again."""
+
+        self.pool.close(self)
+
+    def __getstate__(self):
+        return {'filename': self.filename, 'opener': self.opener, '_pool': None}
+
+
+_file_pool = FilePool()
+
+
+def get_file_pool():
+    """Returns the process-wide `.FilePool`.
+
+    The number of open files is limited by ``config.max_open_files``.
+
+    """
+
+    return _file_pool
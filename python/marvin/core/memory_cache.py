@@ -0,0 +1,251 @@
+#!/usr/bin/env python
+# encoding: utf-8
+#
+# memory_cache.py
+#
+# Licensed under a 3-clause BSD license.
+
+
+from __future__ import absolute_import, division, print_function
+
+import sys
+import threading
+import uuid
+from collections import OrderedDict
+
+import numpy as np
+
+import marvin
+
+
+__ALL__ = ['MemoryCache', 'ToolCache', 'get_memory_cache']
+
+
+def _nbytes(value):
+    """Returns the approximate size of ``value``, in bytes."""
+
+    if isinstance(value, np.ndarray):
+        # Quantities (e.g., a DataCube) also carry their ivar, mask, and wavelength arrays.
+        extra = getattr(value, '__dict__', {}).values()
+        return value.nbytes + sum(_nbytes(item) for item in extra
+                                  if isinstance(item, np.ndarray))
+    elif isinstance(value, dict):
+        return sum(_nbytes(item) for item in value.values())
+    elif isinstance(value, (list, tuple)):
+        return sum(_nbytes(item) for item in value)
+    elif value is None:
+        return 0
+
+    return sys.getsizeof(value)
+
+
+class MemoryCache(object):
+    """A process-wide, size-limited cache of the data of the Tools.
+
+    Stores the arrays read by the Tools (e.g., cube extensions or maps) so
+    that they do not need to be retrieved again. When the total size of the
+    entries exceeds ``max_bytes``, the least recently used entries are
+    removed. The Tools retrieve evicted data again from the file, DB, or API
+    the next time it is needed.
+
+    The cache is thread-safe and keeps count of its hits, misses, and
+    evictions (see `.stats`).
+
+    Parameters:
+        max_bytes (int or None):
+            The maximum size of the cache, in bytes. If ``None``, uses
+            ``config.cache_bytes``. A value of ``0`` disables the cache.
+
+    """
+
+    def __init__(self, max_bytes=None):
+
+        self._max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.RLock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __repr__(self):
+        return '<MemoryCache size={0}, max_bytes={1}, n_entries={2}>'.format(
+            self.size, self.max_bytes, len(self))
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    @property
+    def max_bytes(self):
+        """The maximum size of the cache, in bytes."""
+
+        if self._max_bytes is not None:
+            return self._max_bytes
+
+        return marvin.config.cache_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value):
+
+        self._max_bytes = value
+        self.evict()
+
+    @property
+    def size(self):
+        """The total size of the entries in the cache, in bytes."""
+
+        return self._size
+
+    @property
+    def stats(self):
+        """A dictionary with the statistics of the cache."""
+
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                'size': self.size, 'max_bytes': self.max_bytes, 'n_entries': len(self)}
+
+    def __getitem__(self, key):
+
+        with self._lock:
+            try:
+                value, __ = self._entries.pop(key)
+            except KeyError:
+                self.misses += 1
+                raise
+
+            # Reinserts the entry as the most recently used.
+            self._entries[key] = (value, __)
+            self.hits += 1
+
+            return value
+
+    def get(self, key, default=None):
+        """Returns the entry for ``key``, or ``default`` if not cached."""
+
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __setitem__(self, key, value):
+
+        nbytes = _nbytes(value)
+
+        with self._lock:
+
+            self.discard(key)
+
+            # Values that do not fit in the cache are not stored.
+            if self.max_bytes is not None and nbytes > self.max_bytes:
+                return
+
+            self._entries[key] = (value, nbytes)
+            self._size += nbytes
+
+            self.evict()
+
+    def discard(self, key):
+        """Removes the entry for ``key``, if it exists."""
+
+        with self._lock:
+            if key in self._entries:
+                __, nbytes = self._entries.pop(key)
+                self._size -= nbytes
+
+    def discard_namespace(self, namespace):
+        """Removes all the entries whose key starts with ``namespace``."""
+
+        with self._lock:
+            for key in list(self._entries):
+                if isinstance(key, tuple) and len(key) > 0 and key[0] == namespace:
+                    self.discard(key)
+
+    def evict(self):
+        """Removes the least recently used entries until the cache fits in ``max_bytes``."""
+
+        max_bytes = self.max_bytes
+        if max_bytes is None:
+            return
+
+        with self._lock:
+            while self._entries and self._size > max_bytes:
+                __, (__, nbytes) = self._entries.popitem(last=False)
+                self._size -= nbytes
+                self.evictions += 1
+
+    def clear(self):
+        """Removes all the entries and resets the statistics."""
+
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self.hits = self.misses = self.evictions = 0
+
+
+class ToolCache(object):
+    """A dictionary-like view of the `.MemoryCache` for the data of one object.
+
+    Keys are stored in the process-wide cache prefixed by a random namespace,
+    so that the data of different objects never collide. Copying or
+    unpickling a `.ToolCache` returns a new, empty one.
+
+    """
+
+    def __init__(self, cache=None):
+
+        self.namespace = uuid.uuid4().hex
+        self._cache = cache
+
+    def __repr__(self):
+        return '<ToolCache namespace={0!r}>'.format(self.namespace)
+
+    @property
+    def cache(self):
+        """The `.MemoryCache` in which the data is stored."""
+
+        return self._cache if self._cache is not None else get_memory_cache()
+
+    def __getitem__(self, key):
+        return self.cache[(self.namespace, key)]
+
+    def __setitem__(self, key, value):
+        self.cache[(self.namespace, key)] = value
+
+    def __contains__(self, key):
+        return (self.namespace, key) in self.cache
+
+    def get(self, key, default=None):
+        """Returns the entry for ``key``, or ``default`` if not cached."""
+
+        return self.cache.get((self.namespace, key), default)
+
+    def clear(self):
+        """Removes all the entries of this object from the cache."""
+
+        self.cache.discard_namespace(self.namespace)
+
+    def __copy__(self):
+        return ToolCache(cache=self._cache)
+
+    def __deepcopy__(self, memo):
+        return ToolCache(cache=self._cache)
+
+    def __reduce__(self):
+        return (ToolCache, ())
+
+
+_memory_cache = MemoryCache()
+
+
+def get_memory_cache():
+    """Returns the process-wide `.MemoryCache`.
+
+    Its size is limited by ``config.cache_bytes``. Use ``get_memory_cache().stats``
+    to get the numbers of hits, misses, and evictions.
+
+    """
+
+    return _memory_cache
@@ -12,7 +12,12 @@ Revision History:
 '''
 from __future__ import print_function
 from __future__ import division
-from sqlalchemy import type_coerce
+
+import struct
+
+import numpy as np
+from sqlalchemy import func, type_coerce
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.dialects.postgresql import *
 
 
@@ -49,3 +54,196 @@ class ARRAY_D(ARRAY):
                 )
             return super_
     comparator_factory = Comparator
+
+
+# Binary COPY of spaxel arrays
+#
+# COPY ... TO STDOUT WITH (FORMAT binary) sends every row as a 16-bit field
+# count followed by, for each field, its 32-bit length and its raw value.
+# Postgres arrays are sent as a header (number of dimensions, null flag,
+# element type oid, size and lower bound of each dimension) followed by the
+# elements, each preceded by its length. For arrays without nulls the elements
+# can be read by numpy with a structured dtype, without creating Python
+# objects. See https://www.postgresql.org/docs/current/static/sql-copy.html
+
+_copy_signature = b'PGCOPY\n\xff\r\n\x00'
+
+# element type oid: big-endian numpy dtype
+_pg_array_types = {21: '>i2', 23: '>i4', 20: '>i8', 700: '>f4', 701: '>f8'}
+
+
+def decode_pg_array(raw):
+    ''' Decodes a Postgres array in binary format into a numpy array '''
+
+    ndim, hasnull, oid = struct.unpack_from('>iiI', raw, 0)
+
+    if oid not in _pg_array_types:
+        raise ValueError('unsupported array element type with oid {0}'.format(oid))
+
+    dtype = np.dtype(_pg_array_types[oid])
+
+    if ndim == 0:
+        return np.array([], dtype=dtype.newbyteorder('='))
+
+    dims = struct.unpack_from('>' + 'ii' * ndim, raw, 12)[::2]
+    size = int(np.prod(dims))
+    offset = 12 + 8 * ndim
+
+    if not hasnull:
+        items = np.frombuffer(raw, dtype=[('length', '>i4'), ('value', dtype)],
+                              count=size, offset=offset)
+        values = items['value'].astype(dtype.newbyteorder('='))
+    else:
+        values = np.full(size, np.nan if dtype.kind == 'f' else 0,
+                         dtype=dtype.newbyteorder('='))
+        for ii in range(size):
+            length = struct.unpack_from('>i', raw, offset)[0]
+            offset += 4
+            if length == -1:
+                continue
+            values[ii] = np.frombuffer(raw, dtype=dtype, count=1, offset=offset)[0]
+            offset += length
+
+    return values.reshape(dims)
+
+
+class SpaxelArrayReader(object):
+    ''' Parses the binary COPY of (x, y, array) rows into a 3D array
+
+    An instance is a writable file-like object to pass to psycopg2's
+    ``cursor.copy_expert``. The output is written, as it is received, into
+    ``data``, a preallocated array of shape ``(nwave, ny, nx)`` so that
+    ``data[:, y, x]`` is the array of spaxel ``(x, y)``.
+
+    Parameters:
+        shape (tuple):
+            The spatial ``(ny, nx)`` shape of the cube.
+
+    '''
+
+    def __init__(self, shape):
+
+        self.shape = tuple(shape)
+        self.data = None
+        self._buffer = bytearray()
+        self._header = False
+        self._done = False
+
+    def write(self, chunk):
+        ''' Receives a chunk of the COPY output '''
+
+        self._buffer.extend(chunk)
+
+        pos = 0 if self._header else self._read_header()
+        if pos is None:
+            return
+
+        while not self._done:
+            newpos = self._read_row(pos)
+            if newpos is None:
+                break
+            pos = newpos
+
+        del self._buffer[:pos]
+
+    def _read_header(self):
+        ''' Returns the position after the header or None if incomplete '''
+
+        buf = self._buffer
+        if len(buf) < len(_copy_signature) + 8:
+            return None
+
+        if bytes(buf[:len(_copy_signature)]) != _copy_signature:
+            raise ValueError('invalid binary COPY signature')
+
+        extension = struct.unpack_from('>i', buf, len(_copy_signature) + 4)[0]
+        pos = len(_copy_signature) + 8 + extension
+        if len(buf) < pos:
+            return None
+
+        self._header = True
+        return pos
+
+    def _read_row(self, pos):
+        ''' Parses the row at ``pos`` and returns the next position or None if incomplete '''
+
+        buf = self._buffer
+        if len(buf) < pos + 2:
+            return None
+
+        nfields = struct.unpack_from('>h', buf, pos)[0]
+        if nfields == -1:
+            self._done = True
+            return pos + 2
+
+        fields = []
+        pos += 2
+        for __ in range(nfields):
+            if len(buf) < pos + 4:
+                return None
+            length = struct.unpack_from('>i', buf, pos)[0]
+            pos += 4
+            if length == -1:
+                fields.append(None)
+                continue
+            if len(buf) < pos + length:
+                return None
+            fields.append(bytes(buf[pos:pos + length]))
+            pos += length
+
+        xraw, yraw, arrayraw = fields
+        if arrayraw is None:
+            return pos
+
+        x = int(np.frombuffer(xraw, dtype='>i{0}'.format(len(xraw)))[0])
+        y = int(np.frombuffer(yraw, dtype='>i{0}'.format(len(yraw)))[0])
+        values = decode_pg_array(arrayraw)
+
+        if self.data is None:
+            self.data = np.zeros((len(values),) + self.shape, dtype=values.dtype)
+
+        self.data[:, y, x] = values
+
+        return pos
+
+
+def get_spaxel_cube(session, model, column, *criteria):
+    ''' Returns a 3D cube from an array column of a table of spaxels
+
+    Streams the ``x``, ``y``, and ``column`` values of the rows of ``model``
+    matching ``criteria`` using a binary COPY, and writes them into an array
+    of shape ``(nwave, ny, nx)`` without creating ORM objects. The spatial
+    shape is taken from the maximum ``x`` and ``y`` so that cubes do not need
+    to be square.
+
+    Parameters:
+        session (Session):
+            The SQLAlchemy session.
+        model (class):
+            The ModelClass of the spaxel table, e.g., ``Spaxel``.
+        column (str):
+            The name of the array column to retrieve.
+        criteria:
+            The filter criteria selecting the spaxels of a cube.
+
+    Returns:
+        The 3D numpy array, or None if there are no matching spaxels.
+
+    '''
+
+    xmax, ymax = session.query(func.max(model.x), func.max(model.y)).filter(*criteria).one()
+    if xmax is None or ymax is None:
+        return None
+
+    query = session.query(model.x, model.y, getattr(model, column)).filter(*criteria)
+    sql = query.statement.compile(dialect=postgresql.dialect(),
+                                  compile_kwargs={'literal_binds': True})
+
+    reader = SpaxelArrayReader((ymax + 1, xmax + 1))
+    cursor = session.connection().connection.cursor()
+    try:
+        cursor.copy_expert('COPY ({0}) TO STDOUT WITH (FORMAT binary)'.format(sql), reader)
+    finally:
+        cursor.close()
+
+    return reader.data
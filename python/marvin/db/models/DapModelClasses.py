@@ -11,9 +11,9 @@ from __future__ import division, print_function
 import re
 
 import marvin.db.models.DataModelClasses as datadb
-import numpy as np
 from astropy.io import fits
 from marvin.core.caching_query import RelationshipCache
+from marvin.db.ArrayUtils import get_spaxel_cube
 from marvin.db.database import db
 from marvin.utils.datamodel.dap import datamodel
 from sqlalchemy import Float, ForeignKeyConstraint, and_, case, cast, select
@@ -346,22 +346,14 @@ class ModelCube(Base):
         For example, ``modelcube.get3DCube('flux')`` will return the original
         flux cube with the same ordering as the FITS data cube.
 
-        Note that this method seems to be really slow retrieving arrays (this
-        is especially serious for large IFUs).
+        The arrays are streamed from the database with a binary COPY into a
+        preallocated array, without creating ORM objects. Cubes do not need to
+        be square.
 
         """
 
         session = db.Session.object_session(self)
-        spaxels = session.query(getattr(ModelSpaxel, extension)).filter(
-            ModelSpaxel.modelcube_pk == self.pk).order_by(ModelSpaxel.x, ModelSpaxel.y).all()
-
-        # Assumes cubes are always square (!)
-        nx = ny = int(np.sqrt(len(spaxels)))
-        nwave = len(spaxels[0][0])
-
-        spArray = np.array(spaxels)
-
-        return spArray.transpose().reshape((nwave, ny, nx)).transpose(0, 2, 1)
+        return get_spaxel_cube(session, ModelSpaxel, extension, ModelSpaxel.modelcube_pk == self.pk)
 
 
 class ModelSpaxel(Base):
@@ -15,7 +15,7 @@ import numpy as np
 from astropy.io import fits
 from flask_login import UserMixin
 from marvin.core.caching_query import RelationshipCache
-from marvin.db.ArrayUtils import ARRAY_D
+from marvin.db.ArrayUtils import ARRAY_D, get_spaxel_cube
 from marvin.db.database import db
 from sqlalchemy import and_, func, select  # for aggregate, other functions
 from sqlalchemy.dialects.postgresql import *
@@ -334,22 +334,14 @@ class Cube(Base, ArrayOps):
         For example, ``cube.get3DCube('flux')`` will return the original
         flux cube with the same ordering as the FITS data cube.
 
-        Note that this method seems to be really slow retrieving arrays (this
-        is especially serious for large IFUs).
+        The arrays are streamed from the database with a binary COPY into a
+        preallocated array, without creating ORM objects. Cubes do not need to
+        be square.
 
         """
 
         session = Session.object_session(self)
-        spaxels = session.query(getattr(Spaxel, extension)).filter(
-            Spaxel.cube_pk == self.pk).order_by(Spaxel.x, Spaxel.y).all()
-
-        # Assumes cubes are always square (!)
-        nx = ny = int(np.sqrt(len(spaxels)))
-        nwave = len(spaxels[0][0])
-
-        spArray = np.array(spaxels)
-
-        return spArray.transpose().reshape((nwave, ny, nx)).transpose(0, 2, 1)
+        return get_spaxel_cube(session, Spaxel, extension, Spaxel.cube_pk == self.pk)
 
     @hybrid_property
     def plateifu(self):
@@ -23,10 +23,33 @@ def _import_module(name, relpath):
         return None
 
 
+def _add_module_path(name, relpath):
+    """Makes a module in a path relative to this one's importable, without importing it.
+
+    The path is appended to ``sys.path`` so that an installed version of the
+    module takes precedence.
+
+    """
+
+    try:
+        imp.find_module(name)
+        return
+    except ImportError:
+        pass
+
+    path = os.path.join(os.path.dirname(__file__), relpath)
+    if os.path.exists(path):
+        if path not in sys.path:
+            sys.path.append(path)
+    else:
+        warnings.warn('Marvin cannot import {0}'.format(name), ImportWarning)
+
+
 # Imports the external packages (some of them don't have __init__ in the right places and can
 # not be imported normally).
 # sdss_access = _import_module('sdss_access', 'sdss_access/python/')
-sqlalchemy_boolean_search = _import_module(
-    'sqlalchemy_boolean_search', 'sqlalchemy-boolean-search/')
-wtforms_alchemy = _import_module('wtforms_alchemy', 'wtforms-alchemy/')
 brain = _import_module('brain', 'marvin_brain/python')
+
+# These are only needed by the DB queries and the web, so they are imported when first used.
+_add_module_path('sqlalchemy_boolean_search', 'sqlalchemy-boolean-search/')
+_add_module_path('wtforms_alchemy', 'wtforms-alchemy/')
@@ -0,0 +1,87 @@
+# !usr/bin/env python2
+# -*- coding: utf-8 -*-
+#
+# Licensed under a 3-clause BSD license.
+#
+
+from __future__ import print_function, division, absolute_import
+from marvin import config
+from brain.core.exceptions import BrainError
+import pytest
+import sys
+
+pytestmark = pytest.mark.skipif(sys.version_info < (3, 5), reason='requires python 3.5+')
+
+
+def run(coro):
+    import asyncio
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class Flaky(object):
+
+    def __init__(self, nfails, error):
+        self.calls = 0
+        self.nfails = nfails
+        self.error = error
+
+    def __call__(self, value):
+        self.calls += 1
+        if self.calls <= self.nfails:
+            raise BrainError(self.error)
+        return value
+
+
+class TestAsync(object):
+
+    def test_gather_keeps_order(self):
+        import asyncio
+        from marvin.api.aio import run_in_executor
+
+        async def main():
+            return await asyncio.gather(*[run_in_executor(pow, ii, 2) for ii in range(20)])
+
+        assert run(main()) == [ii ** 2 for ii in range(20)]
+
+    @pytest.mark.parametrize('monkeyconfig', [('api_backoff', 0)], indirect=True)
+    def test_retry(self, monkeyconfig):
+        from marvin.api.aio import run_in_executor
+        flaky = Flaky(2, 'Requests Connection Error: connection refused')
+        assert run(run_in_executor(flaky, 42)) == 42
+        assert flaky.calls == 3
+
+    @pytest.mark.parametrize('monkeyconfig', [('api_backoff', 0)], indirect=True)
+    def test_retry_exhausted(self, monkeyconfig):
+        from marvin.api.aio import run_in_executor
+        flaky = Flaky(10, 'Requests Http Status Error: 503 Server Error: Service Unavailable')
+        with pytest.raises(BrainError):
+            run(run_in_executor(flaky, 42))
+        assert flaky.calls == config.api_retries + 1
+
+    def test_no_retry(self):
+        from marvin.api.aio import run_in_executor
+        flaky = Flaky(1, 'Requests Http Status 404 Error: not found')
+        with pytest.raises(BrainError):
+            run(run_in_executor(flaky, 42))
+        assert flaky.calls == 1
+
+    def test_concurrency_change(self, monkeypatch):
+        import asyncio
+        from marvin.api.aio import _get_executor, _get_semaphore
+
+        loop = asyncio.new_event_loop()
+        try:
+            monkeypatch.setattr(config, 'api_concurrency', 2)
+            executor, semaphore = _get_executor(), _get_semaphore(loop)
+            assert _get_semaphore(loop) is semaphore
+
+            monkeypatch.setattr(config, 'api_concurrency', 3)
+            assert _get_executor() is not executor
+            assert _get_semaphore(loop) is not semaphore
+            assert executor._shutdown
+        finally:
+            loop.close()
@@ -71,3 +71,23 @@ class TestCubeExtension(object):
         else:
             page.route_no_valid_params(page.url.format(**params), missing, reqtype=reqtype, params=params, errmsg=errmsg)
 
+
+@pytest.mark.parametrize('page', [('api', 'getSubCube')], ids=['getsubcube'], indirect=True)
+class TestSubCube(object):
+
+    @pytest.mark.parametrize('reqtype', [('get'), ('post')])
+    @pytest.mark.parametrize('cubeext', [('flux'), ('ivar'), ('mask')])
+    def test_subcube_success(self, galaxy, page, params, reqtype, cubeext):
+        params.update({'name': galaxy.plateifu, 'cube_extension': cubeext,
+                       'wave_start': 100, 'wave_stop': 110, 'x_start': 5, 'x_stop': 8})
+        page.load_page(reqtype, page.url.format(**params), params=params)
+        page.assert_success()
+        extension_data = page.json['data']['extension_data']
+        assert len(extension_data) == 10
+        assert len(extension_data[0][0]) == 3
+
+    @pytest.mark.parametrize('reqtype', [('get'), ('post')])
+    def test_subcube_failure(self, galaxy, page, params, reqtype):
+        params.update({'name': galaxy.plateifu, 'cube_extension': 'flux', 'wave_start': -1})
+        page.route_no_valid_params(page.url.format(**params), 'wave_start', reqtype=reqtype,
+                                   params=params, errmsg='Must be at least 0.')
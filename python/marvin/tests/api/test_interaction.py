@@ -9,7 +9,8 @@
 # @Last Modified time: 2018-11-20 18:20:59
 
 from __future__ import print_function, division, absolute_import
-from marvin.api.api import Interaction
+from marvin.api.api import Interaction, get_session, close_session
+from brain import bconfig
 import pytest
 
 
@@ -42,4 +43,40 @@ class TestInteraction(object):
         errmsg = 'Must have an authorization type set for collab access to MPLs!'
         assert errmsg in str(cm.value)
 
+    def test_shared_session(self):
+        base = 'https://lore.sdss.utah.edu/'
+        url = '/marvin/api/general/getroutemap/'
+        ii = Interaction(url, auth='token', send=False, base=base)
+        jj = Interaction(url, auth='netrc', send=False, base=base)
+        assert ii.session._session is jj.session._session
+        assert ii.session._session is get_session()
+        assert ii.session.auth.authtype == 'token'
+        assert jj.session.auth.authtype == 'netrc'
+        assert get_session().auth is None
+
+    def test_iter_rows(self):
+        class Response(object):
+            closed = False
+
+            def iter_content(self, chunk_size=None):
+                content = b'["cube.mangaid", "nsa.z"];\n["1-209232", 0.04];\n["1-209113", 0.03];\n'
+                for ii in range(0, len(content), chunk_size):
+                    yield content[ii:ii + chunk_size]
+
+            def close(self):
+                self.closed = True
+
+        base = 'https://lore.sdss.utah.edu/'
+        url = '/marvin/api/query/stream/'
+        ii = Interaction(url, auth='token', send=False, base=base)
+        response = Response()
+        rows = list(ii._iter_rows(response, chunksize=7))
+        assert rows == [['cube.mangaid', 'nsa.z'], ['1-209232', 0.04], ['1-209113', 0.03]]
+        assert response.closed
+
+    def test_close_session(self):
+        session = get_session()
+        close_session()
+        assert bconfig.request_session is None
+        assert get_session() is not session
 
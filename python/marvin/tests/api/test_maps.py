@@ -91,3 +91,19 @@ class TestGetSingleMap(object):
             url = page.url.format(**params)
             url = url.replace('None/', '') if missing == 'channel' else url
             page.route_no_valid_params(url, missing, reqtype='post', params=params, errmsg=errmsg)
+
+
+@pytest.mark.parametrize('page', [('api', 'getMapsExtensions')], ids=['getmapsextensions'],
+                         indirect=True)
+class TestGetMapsExtensions(object):
+
+    @pytest.mark.parametrize('reqtype', [('get'), ('post')])
+    def test_extensions_success(self, galaxy, page, params, reqtype):
+        params.update({'name': galaxy.plateifu, 'bintype': galaxy.bintype.name,
+                       'template': galaxy.template.name})
+        page.load_page(reqtype, page.url.format(**params), params=params)
+        page.assert_success()
+        extensions = page.json['data']['extensions']
+        assert len(extensions['emline_gflux']) > 1
+        assert len(extensions['emline_gflux'][0]) == galaxy.shape[0]
+        assert len(extensions['stellar_vel']) == galaxy.shape[0]
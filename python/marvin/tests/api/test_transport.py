@@ -0,0 +1,69 @@
+# !usr/bin/env python2
+# -*- coding: utf-8 -*-
+#
+# Licensed under a 3-clause BSD license.
+#
+
+from __future__ import print_function, division, absolute_import
+from marvin.api import transport
+from marvin.api.base import BaseView
+import numpy as np
+import json
+import pytest
+
+
+@pytest.fixture()
+def results():
+    flux = np.arange(2 * 3 * 4, dtype='>f4').reshape(2, 3, 4)
+    mask = np.array([[0, 1024], [4, 0]], dtype=np.int32)
+    yield {'status': 1, 'error': None, 'data': {'flux': flux, 'mask': mask, 'ivar': None,
+                                                'unit': '1e-17 erg / (Angstrom cm2 s spaxel)'}}
+
+
+class TestTransport(object):
+
+    @pytest.mark.parametrize('compression', [(None), ('zlib')])
+    def test_roundtrip(self, results, compression):
+        decoded = transport.decode(transport.encode(results, compression=compression))
+        assert decoded['status'] == 1
+        assert decoded['data']['ivar'] is None
+        assert decoded['data']['unit'] == results['data']['unit']
+        for name in ['flux', 'mask']:
+            assert decoded['data'][name].shape == results['data'][name].shape
+            assert decoded['data'][name].dtype == results['data'][name].dtype.newbyteorder('<')
+            assert np.array_equal(decoded['data'][name], results['data'][name])
+
+    @pytest.mark.parametrize('compression', [(None), ('zlib')])
+    def test_scalar(self, compression):
+        results = {'data': {'redshift': np.array(0.05, dtype='>f8'), 'binid': np.array(3)}}
+        decoded = transport.decode(transport.encode(results, compression=compression))
+        for name in ['redshift', 'binid']:
+            assert decoded['data'][name].shape == ()
+            assert decoded['data'][name] == results['data'][name]
+
+    def test_zero_copy(self, results):
+        decoded = transport.decode(transport.encode(results))
+        assert decoded['data']['flux'].flags.writeable is False
+
+    def test_bad_content(self):
+        with pytest.raises(ValueError) as cm:
+            transport.decode(b'{"status": 1}')
+        assert 'not a valid Marvin binary array response' in str(cm.value)
+
+    @pytest.mark.parametrize('accept, mimetype',
+                             [('application/json', transport.JSON_MIMETYPE),
+                              ('*/*', transport.JSON_MIMETYPE),
+                              (transport.accept_header()['Accept'], transport.NDARRAY_MIMETYPE)])
+    def test_array_response(self, app, results, accept, mimetype):
+        baseview = BaseView()
+        baseview.results = results
+        with app.test_request_context(headers={'Accept': accept}):
+            response = baseview.array_response()
+
+        assert response.mimetype == mimetype
+        if mimetype == transport.JSON_MIMETYPE:
+            data = json.loads(response.get_data())['data']
+            assert data['flux'] == results['data']['flux'].tolist()
+        else:
+            data = transport.decode(response.get_data())['data']
+            assert np.array_equal(data['flux'], results['data']['flux'])
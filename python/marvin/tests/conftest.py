@@ -40,14 +40,19 @@ def pytest_addoption(parser):
     """Add new options"""
     # run slow tests
     parser.addoption('--runslow', action='store_true', default=False, help='Run slow tests.')
+    # run timing benchmarks
+    parser.addoption('--benchmark', action='store_true', default=False,
+                     help='Run timing benchmarks.')
     # control releases run
     parser.addoption('--travis-only', action='store_true', default=False, help='Run a Travis only subset')
 
 
 def pytest_runtest_setup(item):
-    """Skip slow tests."""
+    """Skip slow tests and benchmarks."""
     if 'slow' in item.keywords and not item.config.getoption('--runslow'):
         pytest.skip('Requires --runslow option to run.')
+    if 'benchmark' in item.keywords and not item.config.getoption('--benchmark'):
+        pytest.skip('Requires --benchmark option to run.')
 
 
 def pytest_configure(config):
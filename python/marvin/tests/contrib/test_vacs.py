@@ -10,11 +10,16 @@
 # @Last modified time: 2018-07-09 17:27:59
 
 import importlib
+import os
 
 import astropy.io.fits
+import astropy.table
+import numpy as np
 import pytest
 
 from marvin.contrib.vacs import VACMixIn
+from marvin.contrib.vacs import base
+from marvin.contrib.vacs.base import VACTarget, get_vac_file
 from marvin.tools.maps import Maps
 
 
@@ -55,6 +60,61 @@ class TestVACs(object):
                 assert getattr(obj.vacs, vac.name) is not None
 
 
+@pytest.fixture()
+def vacfile(temp_scratch):
+    path = str(temp_scratch.join('vac.fits'))
+    table = astropy.table.Table({'plateifu': ['8485-1901', '7443-12701', '8485-1901'],
+                                 'mangaid': ['1-209232', '12-98126', '1-209232'],
+                                 'value': [1., 2., 3.]})
+    table.write(path, format='fits')
+    yield path
+
+
+class TestVACFile(object):
+
+    def test_rows(self, vacfile):
+        vac = get_vac_file(vacfile)
+        assert get_vac_file(vacfile) is vac
+        assert vac.get_rows('8485-1901', 'plateifu').tolist() == [0, 2]
+        assert vac.get_rows('1-1', 'mangaid').tolist() == []
+
+    def test_index_saved(self, vacfile):
+        get_vac_file(vacfile).get_rows('8485-1901', 'plateifu')
+        assert os.path.exists(vacfile + '.1-plateifu.index.npz')
+
+        targetids, rows = get_vac_file(vacfile)._load_index(1, 'plateifu')
+        assert targetids.tolist() == ['7443-12701', '8485-1901', '8485-1901']
+
+    def test_modified(self, vacfile):
+        vac = get_vac_file(vacfile)
+        assert vac.get_data()['value'][0] == 1.
+
+        table = astropy.table.Table({'plateifu': ['8485-1901'], 'mangaid': ['1-209232'],
+                                     'value': [4.]})
+        table.write(vacfile, format='fits', overwrite=True)
+        os.utime(vacfile, (0, 0))
+
+        new_vac = get_vac_file(vacfile)
+        assert new_vac is not vac
+        assert vac._hdulist is None
+        assert new_vac.get_data()['value'][0] == 4.
+
+    def test_other_file(self, vacfile, temp_scratch):
+        specfile = str(temp_scratch.join('spec.fits'))
+        astropy.table.Table({'VHI': [[1., 2.]], 'FHI': [[3., 4.]]}).write(specfile, format='fits')
+
+        target = VACTarget('7443-12701', vacfile)
+        assert target._get_data(specfile)['FHI'][0].tolist() == [3., 4.]
+        assert os.path.realpath(specfile) not in base._vac_files
+
+    def test_target(self, vacfile):
+        target = VACTarget('7443-12701', vacfile)
+        assert target._indata
+        assert np.array_equal(target.data['value'], [2.])
+
+        assert not VACTarget('1-1', vacfile)._indata
+
+
 @pytest.mark.xfail(reason="will not work with tested releases it does not have")
 class TestMangaHI(object):
 
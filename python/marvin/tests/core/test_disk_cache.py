@@ -0,0 +1,143 @@
+# !usr/bin/env python2
+# -*- coding: utf-8 -*-
+#
+# Licensed under a 3-clause BSD license.
+#
+
+from __future__ import print_function, division, absolute_import
+from marvin import config
+from marvin.core.disk_cache import DiskCache, GunzipCache, get_remote_cache, is_gzipped
+from marvin.core.exceptions import MarvinUserWarning
+import gzip
+import numpy as np
+import os
+import pytest
+
+key = ('Cube', 'MPL-6', 'v2_3_1', '2.1.3', '8485-1901', None, None, 'extension', 'FLUX')
+
+
+@pytest.fixture()
+def disk_cache(temp_scratch):
+    yield DiskCache(str(temp_scratch.join('cache')), max_bytes=1024 ** 2)
+
+
+class TestDiskCache(object):
+
+    def test_roundtrip(self, disk_cache):
+        data = {'extension_data': np.arange(12, dtype=np.float32).reshape(3, 4),
+                'header': 'SIMPLE = T', 'shape': [3, 4], 'ivar': None}
+        disk_cache.set(key, data)
+        cached = disk_cache.get(key)
+        assert cached['header'] == data['header']
+        assert cached['shape'] == data['shape']
+        assert cached['ivar'] is None
+        assert isinstance(cached['extension_data'], np.memmap)
+        assert cached['extension_data'].flags.writeable is False
+        assert np.array_equal(cached['extension_data'], data['extension_data'])
+
+    def test_miss(self, disk_cache):
+        assert disk_cache.get(key) is None
+        disk_cache.set(key, {'value': 1})
+        assert disk_cache.get(key[:-1] + ('IVAR',)) is None
+
+    def test_eviction(self, disk_cache):
+        disk_cache.max_bytes = 1024 * 100
+        for ii in range(3):
+            disk_cache.set(key + (ii,), {'value': np.zeros(5000)})
+            os.utime(os.path.join(disk_cache._entry_path(key + (ii,)), disk_cache._meta_file),
+                     (ii, ii))
+
+        disk_cache.set(key + (3,), {'value': np.zeros(5000)})
+        assert disk_cache.size <= disk_cache.max_bytes
+        assert disk_cache.get(key + (0,)) is None
+        assert disk_cache.get(key + (3,)) is not None
+
+    def test_size_tracked(self, disk_cache, monkeypatch):
+        disk_cache.set(key, {'value': np.zeros(10)})
+        size = disk_cache.size
+
+        scans = []
+        entries = disk_cache._entries
+        monkeypatch.setattr(disk_cache, '_entries', lambda: scans.append(1) or entries())
+
+        disk_cache.set(key + (1,), {'value': np.zeros(10)})
+        disk_cache.set(key, {'value': np.zeros(20)})
+        assert scans == []
+        assert disk_cache._size == disk_cache.size > size
+
+    def test_eviction_error(self, disk_cache, monkeypatch):
+        disk_cache.max_bytes = 0
+
+        def entries():
+            raise OSError('entry removed by another process')
+
+        monkeypatch.setattr(disk_cache, '_entries', entries)
+
+        with pytest.warns(MarvinUserWarning):
+            disk_cache.set(key, {'value': np.zeros(10)})
+
+    def test_clear(self, disk_cache):
+        disk_cache.set(key, {'value': np.zeros(10)})
+        disk_cache.clear()
+        assert disk_cache.size == 0
+        assert disk_cache.get(key) is None
+
+    @pytest.mark.parametrize('monkeyconfig', [('use_remote_cache', False)], indirect=True)
+    def test_disabled(self, monkeyconfig):
+        assert get_remote_cache() is None
+
+    def test_enabled(self, monkeypatch, temp_scratch):
+        monkeypatch.setattr(config, 'use_remote_cache', True)
+        monkeypatch.setattr(config, 'remote_cache_dir', str(temp_scratch))
+        remote_cache = get_remote_cache()
+        assert remote_cache.path == os.path.realpath(str(temp_scratch))
+        assert remote_cache.max_bytes == config.remote_cache_size
+
+
+@pytest.fixture()
+def gzipped(temp_scratch):
+    filename = str(temp_scratch.join('manga-8485-1901-LOGCUBE.fits.gz'))
+    with gzip.open(filename, 'wb') as ff:
+        ff.write(b'x' * 1000)
+    yield filename
+
+
+class TestGunzipCache(object):
+
+    def test_get(self, gzipped, temp_scratch):
+        gunzip_cache = GunzipCache(str(temp_scratch.join('scratch')), max_bytes=1024 ** 2)
+        path = gunzip_cache.get(gzipped)
+
+        assert is_gzipped(gzipped) and not is_gzipped(path)
+        assert path.endswith('-manga-8485-1901-LOGCUBE.fits')
+        with open(path, 'rb') as ff:
+            assert ff.read() == b'x' * 1000
+
+        mtime = os.path.getmtime(path)
+        assert gunzip_cache.get(gzipped) == path
+        assert os.path.getmtime(path) >= mtime
+        assert gunzip_cache.size == 1000
+
+    def test_modified(self, gzipped, temp_scratch):
+        gunzip_cache = GunzipCache(str(temp_scratch.join('scratch')), max_bytes=1024 ** 2)
+        path = gunzip_cache.get(gzipped)
+
+        with gzip.open(gzipped, 'wb') as ff:
+            ff.write(b'y' * 2000)
+        os.utime(gzipped, (0, 0))
+
+        assert gunzip_cache.get(gzipped) != path
+
+    def test_eviction(self, gzipped, temp_scratch):
+        gunzip_cache = GunzipCache(str(temp_scratch.join('scratch')), max_bytes=1500)
+        path = gunzip_cache.get(gzipped)
+        os.utime(path, (0, 0))
+
+        with gzip.open(gzipped, 'wb') as ff:
+            ff.write(b'y' * 1000)
+        os.utime(gzipped, (1, 1))
+
+        new_path = gunzip_cache.get(gzipped)
+        assert os.path.exists(new_path)
+        assert not os.path.exists(path)
+        assert gunzip_cache.size == 1000
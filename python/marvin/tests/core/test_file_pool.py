@@ -0,0 +1,67 @@
+# !usr/bin/env python2
+# -*- coding: utf-8 -*-
+#
+# Licensed under a 3-clause BSD license.
+#
+
+from __future__ import print_function, division, absolute_import
+from marvin.core.file_pool import FileHandle, FilePool
+import pickle
+import pytest
+
+
+@pytest.fixture()
+def filenames(temp_scratch):
+    paths = []
+    for ii in range(3):
+        path = temp_scratch.join('file_{0}.txt'.format(ii))
+        path.write(str(ii))
+        paths.append(str(path))
+    yield paths
+
+
+class TestFilePool(object):
+
+    def test_open(self, filenames):
+        pool = FilePool(max_files=2)
+        handle = FileHandle(filenames[0], open, pool=pool)
+
+        assert handle.fileobj.read() == '0'
+        assert handle.fileobj is handle.fileobj
+        assert handle.is_open and pool.opened == 1
+
+        handle.close()
+        assert not handle.is_open
+        assert handle.fileobj.closed is False
+        assert pool.opened == 2
+
+    def test_eviction(self, filenames):
+        pool = FilePool(max_files=2)
+        handles = [FileHandle(filename, open, pool=pool) for filename in filenames]
+
+        fileobjs = [handle.fileobj for handle in handles[0:2]]
+        handles[0].fileobj
+        handles[2].fileobj
+
+        assert len(pool) == 2
+        assert handles[0].is_open and not handles[1].is_open and handles[2].is_open
+        assert fileobjs[1].closed
+        assert handles[1].fileobj.read() == '1'
+        assert pool.closed == 2
+
+    def test_clear(self, filenames):
+        pool = FilePool(max_files=2)
+        handle = FileHandle(filenames[0], open, pool=pool)
+        fileobj = handle.fileobj
+
+        pool.clear()
+        assert len(pool) == 0
+        assert fileobj.closed
+
+    def test_pickle(self, filenames):
+        handle = FileHandle(filenames[0], open, pool=FilePool())
+        handle.fileobj
+
+        restored = pickle.loads(pickle.dumps(handle))
+        assert restored.filename == handle.filename
+        assert not restored.is_open
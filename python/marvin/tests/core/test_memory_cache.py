@@ -0,0 +1,94 @@
+# !usr/bin/env python2
+# -*- coding: utf-8 -*-
+#
+# Licensed under a 3-clause BSD license.
+#
+
+from __future__ import print_function, division, absolute_import
+from marvin import config
+from marvin.core.memory_cache import MemoryCache, ToolCache
+import copy
+import numpy as np
+import pickle
+import pytest
+
+
+class Quantity(np.ndarray):
+    """An array with extra attributes, like a `.DataCube`."""
+
+
+@pytest.fixture()
+def memory_cache():
+    yield MemoryCache(max_bytes=1000)
+
+
+class TestMemoryCache(object):
+
+    def test_roundtrip(self, memory_cache):
+        data = np.arange(10, dtype=np.float64)
+        memory_cache['flux'] = data
+        assert memory_cache['flux'] is data
+        assert memory_cache.size == 80
+        assert memory_cache.stats['hits'] == 1
+
+    def test_miss(self, memory_cache):
+        with pytest.raises(KeyError):
+            memory_cache['flux']
+        assert memory_cache.get('flux') is None
+        assert memory_cache.stats['misses'] == 2
+
+    def test_eviction(self, memory_cache):
+        for key in ['a', 'b', 'c']:
+            memory_cache[key] = np.zeros(40)
+        memory_cache['a']
+        memory_cache['d'] = np.zeros(40)
+
+        assert 'b' not in memory_cache
+        assert 'a' in memory_cache and 'c' in memory_cache and 'd' in memory_cache
+        assert memory_cache.size <= memory_cache.max_bytes
+        assert memory_cache.stats['evictions'] == 1
+
+    def test_too_large(self, memory_cache):
+        memory_cache['flux'] = np.zeros(1000)
+        assert 'flux' not in memory_cache
+        assert memory_cache.size == 0
+
+    def test_nbytes(self, memory_cache):
+        memory_cache['map'] = (np.zeros(10), np.zeros(10), None)
+        assert memory_cache.size == 160
+
+    def test_nbytes_quantity(self, memory_cache):
+        datacube = np.zeros(10).view(Quantity)
+        datacube.ivar = np.zeros(10)
+        memory_cache['flux'] = datacube
+        assert memory_cache.size == 160
+
+    def test_config(self, monkeypatch):
+        monkeypatch.setattr(config, 'cache_bytes', 0)
+        memory_cache = MemoryCache()
+        memory_cache['flux'] = np.zeros(10)
+        assert len(memory_cache) == 0
+
+
+class TestToolCache(object):
+
+    def test_namespace(self, memory_cache):
+        cache_a = ToolCache(cache=memory_cache)
+        cache_b = ToolCache(cache=memory_cache)
+        cache_a['flux'] = np.zeros(10)
+
+        assert 'flux' in cache_a
+        assert 'flux' not in cache_b
+
+        cache_a.clear()
+        assert 'flux' not in cache_a
+        assert memory_cache.size == 0
+
+    def test_copy(self, memory_cache):
+        tool_cache = ToolCache(cache=memory_cache)
+        tool_cache['flux'] = np.zeros(10)
+
+        for new_cache in [copy.copy(tool_cache), copy.deepcopy(tool_cache),
+                          pickle.loads(pickle.dumps(tool_cache))]:
+            assert new_cache.namespace != tool_cache.namespace
+            assert 'flux' not in new_cache
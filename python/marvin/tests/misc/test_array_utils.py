@@ -0,0 +1,74 @@
+# !usr/bin/env python2
+# -*- coding: utf-8 -*-
+#
+# Licensed under a 3-clause BSD license.
+#
+
+from __future__ import print_function, division, absolute_import
+from marvin.db.ArrayUtils import SpaxelArrayReader, decode_pg_array
+import numpy as np
+import pytest
+import struct
+
+
+def pg_array(values, oid=700, null=None):
+    ''' Encodes a 1D array in the Postgres binary format '''
+
+    raw = struct.pack('>iiIii', 1, int(null is not None), oid, len(values), 0)
+    fmt = '>f' if oid == 700 else '>i'
+    for ii, value in enumerate(values):
+        if ii == null:
+            raw += struct.pack('>i', -1)
+        else:
+            raw += struct.pack('>i', 4) + struct.pack(fmt, value)
+    return raw
+
+
+def pg_copy(rows, oid=700):
+    ''' Encodes (x, y, values) rows as the output of a binary COPY '''
+
+    raw = b'PGCOPY\n\xff\r\n\x00' + struct.pack('>ii', 0, 0)
+    for x, y, values in rows:
+        array = pg_array(values, oid=oid)
+        raw += struct.pack('>hiiii', 3, 4, x, 4, y)
+        raw += struct.pack('>i', len(array)) + array
+    return raw + struct.pack('>h', -1)
+
+
+class TestDecodeArray(object):
+
+    def test_float(self):
+        values = decode_pg_array(pg_array([1.5, 2.5, 3.5]))
+        assert values.dtype == np.float32
+        assert values.tolist() == [1.5, 2.5, 3.5]
+
+    def test_int(self):
+        values = decode_pg_array(pg_array([1, 2, 1024], oid=23))
+        assert values.dtype == np.int32
+        assert values.tolist() == [1, 2, 1024]
+
+    def test_null(self):
+        values = decode_pg_array(pg_array([1.5, 2.5, 3.5], null=1))
+        assert values[0] == 1.5 and values[2] == 3.5
+        assert np.isnan(values[1])
+
+
+class TestSpaxelArrayReader(object):
+
+    @pytest.mark.parametrize('chunksize', [7, 64, 100000])
+    def test_read(self, chunksize):
+        nx, ny, nwave = 3, 2, 4
+        cube = np.arange(nwave * ny * nx, dtype=np.float32).reshape(nwave, ny, nx)
+        rows = [(x, y, cube[:, y, x].tolist()) for x in range(nx) for y in range(ny)]
+        raw = pg_copy(rows)
+
+        reader = SpaxelArrayReader((ny, nx))
+        for ii in range(0, len(raw), chunksize):
+            reader.write(raw[ii:ii + chunksize])
+
+        assert reader.data.shape == (nwave, ny, nx)
+        assert np.array_equal(reader.data, cube)
+
+    def test_bad_signature(self):
+        with pytest.raises(ValueError):
+            SpaxelArrayReader((2, 2)).write(b'COPY' * 10)
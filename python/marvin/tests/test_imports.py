@@ -9,9 +9,36 @@
 # @Last modified by:   Brian Cherinka
 # @Last modified time: 2018-07-09 12:11:48
 
+import subprocess
+import sys
+
+import pytest
+
 import marvin
 
 
+# The maximum time, in seconds, that ``import marvin`` may take. Only checked with --benchmark.
+IMPORT_TIME_BUDGET = 0.2
+
+# Modules that are slow to import and must only be imported when first used.
+LAZY_MODULES = ['marvin.tools', 'marvin.utils', 'marvin.api.api', 'matplotlib.pyplot',
+                'scipy.interpolate', 'flask_jwt_extended', 'astropy.wcs', 'PIL.Image',
+                'sqlalchemy_boolean_search', 'wtforms_alchemy']
+
+# Loading the DB models imports most of marvin.
+nodb = pytest.mark.skipif(bool(marvin.config.db), reason='import marvin loads the DB models')
+
+# Before Python 3.7 modules cannot define __getattr__, so import marvin loads every submodule.
+lazy_imports = pytest.mark.skipif(sys.version_info < (3, 7),
+                                  reason='lazy imports require Python 3.7 or newer')
+
+
+def run_python(code):
+    """Runs ``code`` in a new Python process and returns its output."""
+
+    return subprocess.check_output([sys.executable, '-c', code], universal_newlines=True)
+
+
 class TestImports(object):
 
     def test_access_tools_full_path(self):
@@ -31,3 +58,35 @@ class TestImports(object):
         assert marvin.tools.ModelCube is not None
         assert marvin.tools.Spaxel is not None
         assert marvin.tools.Image is not None
+
+    def test_access_lazy_attributes(self):
+
+        assert marvin.Interaction is marvin.api.api.Interaction
+        assert marvin.arg_validate is marvin.api.base.arg_validate
+        assert 'tools' in dir(marvin)
+
+        with pytest.raises(AttributeError):
+            marvin.not_an_attribute
+
+
+@nodb
+@lazy_imports
+class TestImportTime(object):
+
+    def test_lazy_modules(self):
+
+        code = ('import sys; import marvin; '
+                'print([name for name in {0!r} if name in sys.modules])'.format(LAZY_MODULES))
+
+        assert run_python(code).splitlines()[-1] == '[]'
+
+    @pytest.mark.benchmark
+    def test_import_time(self):
+
+        code = 'import time; t0 = time.time(); import marvin; print(time.time() - t0)'
+
+        # Uses the best of several runs, so that the load of the machine does not affect the test.
+        elapsed = min(float(run_python(code).splitlines()[-1]) for __ in range(3))
+
+        assert elapsed < IMPORT_TIME_BUDGET, \
+            'import marvin took {0:.3f} s (budget: {1} s)'.format(elapsed, IMPORT_TIME_BUDGET)
@@ -163,6 +163,24 @@ class TestCube(object):
 
         assert 'filename {0} cannot be found'.format(cube.filename) in str(ee.value)
 
+    def test_context_manager(self, galaxy):
+        with Cube(filename=galaxy.cubepath) as cube:
+            flux = cube.flux
+            assert cube._file_handle.is_open
+
+        assert not cube._file_handle.is_open
+        assert flux.shape[0] == cube.data['FLUX'].data.shape[0]
+        assert cube._file_handle.is_open
+
+    def test_file_pool(self, galaxy, monkeypatch):
+        monkeypatch.setattr(config, 'max_open_files', 1)
+        cube_a = Cube(filename=galaxy.cubepath)
+        cube_b = Cube(filename=galaxy.cubepath)
+
+        assert not cube_a._file_handle.is_open
+        assert cube_a.data['FLUX'].header == cube_b.data['FLUX'].header
+        assert not cube_b._file_handle.is_open
+
     def test_load_cube_from_file_filever_ne_release(self, galaxy):
         release_wrong = 'MPL-4' if galaxy.release != 'MPL-4' else galaxy.release
         with pytest.warns(MarvinUserWarning) as record:
@@ -203,6 +221,26 @@ class TestCube(object):
         assert cube.mangaid == rss.mangaid
         assert cube.release == rss.release
 
+    def test_get_subcube(self, cube):
+
+        subcube = cube.get_subcube('flux', wave=(6500, 6650), x=(10, 15), y=(12, 20))
+        wavelength = cube._wavelength
+        wave_idx = np.where((wavelength >= 6500) & (wavelength <= 6650))[0]
+
+        assert subcube.shape == (len(wave_idx), 8, 5)
+        assert subcube.unit == cube.flux.unit
+        assert subcube.ivar.shape == subcube.shape
+        assert subcube.mask.shape == subcube.shape
+        assert subcube.wavelength.value == pytest.approx(wavelength[wave_idx])
+        assert subcube.value == pytest.approx(cube.flux.value[wave_idx[0]:wave_idx[-1] + 1,
+                                                              12:20, 10:15])
+
+    def test_get_subcube_bad_wave(self, cube):
+
+        with pytest.raises(MarvinError) as cm:
+            cube.get_subcube('flux', wave=(20000, 30000))
+        assert 'does not overlap with the cube' in str(cm.value)
+
 
 class TestWCS(object):
 
@@ -0,0 +1,94 @@
+# !usr/bin/env python2
+# -*- coding: utf-8 -*-
+#
+# Licensed under a 3-clause BSD license.
+#
+
+from __future__ import print_function, division, absolute_import
+from astropy.table import Table
+from marvin import config
+from marvin.core.exceptions import MarvinError
+from marvin.tools import file_query
+from marvin.tools.file_query import FileQuery, parse_filter
+from marvin.tools.query import Query
+import numpy as np
+import pytest
+
+
+@pytest.fixture()
+def drpall(monkeypatch):
+    table = Table({'plateifu': np.array([b'8485-1901', b'8485-1902', b'7443-12701', b'7443-1901']),
+                   'mangaid': np.array([b'1-209232', b'1-209113', b'12-98126', b'1-46215']),
+                   'ifudsgn': np.array([b'1901', b'1902', b'12701', b'1901']),
+                   'nsa_z': np.array([0.0407447, 0.0378877, 0.0205778, 0.11]),
+                   'nsa_elpetro_mass': np.array([1.e10, 1.e9, 1.e11, 1.e8])})
+    monkeypatch.setattr(file_query, 'get_drpall_table', lambda drpver=None, lazy=False: table)
+    yield table
+
+
+class TestParseFilter(object):
+
+    def test_parse(self):
+        parsed = parse_filter('nsa.z < 0.1 and (ifu.name = 19* or not nsa.z >= 0.5)')
+        assert parsed == ('and', [('cond', 'nsa.z', '<', '0.1'),
+                                  ('or', [('cond', 'ifu.name', '=', '19*'),
+                                          ('not', ('cond', 'nsa.z', '>=', '0.5'))])])
+
+    def test_between(self):
+        parsed = parse_filter('nsa.z between 0.1 and 0.2')
+        assert parsed == ('and', [('cond', 'nsa.z', '>=', '0.1'), ('cond', 'nsa.z', '<=', '0.2')])
+
+    @pytest.mark.parametrize('badfilter',
+                             [('nsa.z <'), ('(nsa.z < 0.1'), ('nsa.z 0.1'), ('nsa.z < 0.1 0.2')])
+    def test_syntax_error(self, badfilter):
+        with pytest.raises(MarvinError):
+            parse_filter(badfilter)
+
+
+class TestFileQuery(object):
+
+    def test_params(self, drpall):
+        fq = FileQuery('nsa.z < 0.1', params=['cube.mangaid', 'cube.plateifu'])
+        assert fq.params == ['cube.mangaid', 'cube.plateifu', 'nsa.z']
+
+    @pytest.mark.parametrize('sfilter, plateifus',
+                             [('nsa.z < 0.1', ['8485-1902', '8485-1901', '7443-12701']),
+                              ('nsa.z < 0.1 and ifu.name = 19*', ['8485-1902', '8485-1901']),
+                              ('ifu.name = 1901 or nsa.elpetro_logmass > 10.5',
+                               ['8485-1901', '7443-1901', '7443-12701']),
+                              ('not nsa.z between 0.03 and 0.05', ['7443-1901', '7443-12701'])])
+    def test_filter(self, drpall, sfilter, plateifus):
+        fq = FileQuery(sfilter, params=['cube.plateifu'], sort='cube.plateifu', order='desc')
+        assert fq.count() == len(plateifus)
+        assert [row[0] for row in fq.all()] == plateifus
+
+    def test_sort_slice(self, drpall):
+        fq = FileQuery('nsa.z < 0.2', params=['cube.plateifu', 'nsa.z'], sort='nsa.z')
+        redshift = [row[1] for row in fq.all()]
+        assert redshift == sorted(redshift)
+        assert fq.slice(1, 3).all() == fq.all()[1:3]
+        assert list(fq.iter_rows(chunk=3)) == fq.all()
+
+    def test_unsupported(self, drpall):
+        with pytest.raises(MarvinError) as cm:
+            FileQuery('spaxelprop.x > 10', params=['cube.plateifu'])
+        assert 'cannot be queried from the DRPall or DAPall files' in str(cm.value)
+
+
+class TestFileModeQuery(object):
+
+    @pytest.fixture(autouse=True)
+    def file_mode(self, monkeypatch, drpall):
+        monkeypatch.setattr(config, 'db', None)
+        monkeypatch.setattr(Query, '_has_drpall', lambda self: True)
+
+    def test_file_origin(self):
+        query = Query(search_filter='nsa.z < 0.1', mode='local')
+        assert query.data_origin == 'file'
+
+    @pytest.mark.parametrize('flags', [{'targets': ['primary']}, {'quality': ['BADFLUX']}],
+                             ids=['targets', 'quality'])
+    def test_flags(self, flags):
+        with pytest.raises(MarvinError) as cm:
+            Query(search_filter='nsa.z < 0.1', mode='local', **flags)
+        assert 'cannot be queried from the DRPall or DAPall files' in str(cm.value)
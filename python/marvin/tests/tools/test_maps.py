@@ -182,6 +182,59 @@ class TestMaps(object):
                 else:
                     assert value == value2, attr
 
+    @pytest.mark.parametrize('data_origin', ['file', 'db', 'api'])
+    def test_getMaps(self, galaxy, data_origin):
+        maps = Maps(**self._get_maps_kwargs(galaxy, data_origin))
+        names = ['emline_gflux_ha_6564', 'stellar_vel', 'binid_stellar_continua']
+        map_list = maps.getMaps(names)
+
+        assert [map_.datamodel.full() for map_ in map_list] == names
+        for map_ in map_list:
+            map_single = maps.getMap(map_.datamodel)
+            assert map_.unit == map_single.unit
+            for attr in ['value', 'ivar', 'mask', 'binid']:
+                if getattr(map_single, attr) is None:
+                    assert getattr(map_, attr) is None
+                else:
+                    assert getattr(map_, attr) == pytest.approx(getattr(map_single, attr),
+                                                                nan_ok=True)
+
+    @pytest.mark.parametrize('data_origin', ['file', 'db', 'api'])
+    def test_load_all(self, galaxy, data_origin):
+        maps = Maps(**self._get_maps_kwargs(galaxy, data_origin))
+        extensions = maps.to_cube()
+
+        assert extensions['emline_gflux'].ndim == 3
+        assert extensions['emline_gflux'].shape[1:] == tuple(galaxy.shape)
+
+        all_maps = maps.load_all()
+        assert list(all_maps.keys()) == [prop.full() for prop in maps.datamodel]
+
+        ha = all_maps['emline_gflux_ha_6564']
+        idx = ha.datamodel.channel.idx
+        assert np.shares_memory(ha.value, extensions['emline_gflux'])
+        assert np.shares_memory(ha.ivar, extensions['emline_gflux_ivar'])
+        assert ha.value == pytest.approx(extensions['emline_gflux'][idx])
+
+        # getMap uses the loaded extensions too, but copies them
+        assert not np.shares_memory(maps.getMap('emline_gflux_ha_6564').value,
+                                    extensions['emline_gflux'])
+        assert maps.getMap('stellar_vel').value == pytest.approx(all_maps['stellar_vel'].value,
+                                                                 nan_ok=True)
+
+    def test_spaxel_index(self, galaxy):
+        maps = Maps(filename=galaxy.mapspath)
+        index = maps._get_spaxel_index()
+        assert index['value'].shape == tuple(galaxy.shape) + (len(maps.datamodel), )
+        assert maps._get_spaxel_index() is index
+
+        x, y = galaxy.dap['x'], galaxy.dap['y']
+        quantities = maps._get_spaxel_quantities(x, y)
+        column = index['columns']['emline_gflux_ha_6564']
+        assert quantities['emline_gflux_ha_6564'].value == index['value'][y, x, column]
+        assert quantities['emline_gflux_ha_6564'].value == \
+            maps.getMap('emline_gflux_ha_6564').value[y, x]
+
     def test_getMapRatio(self, galaxy):
         maps = Maps(galaxy.plateifu)
         map_ratio = maps.getMapRatio('emline_gflux', 'nii_6585', 'ha_6564')
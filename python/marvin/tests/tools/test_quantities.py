@@ -109,6 +109,15 @@ class TestDataCube(object):
         numpy.testing.assert_almost_equal(descaled.value, datacube.value * datacube.unit.scale)
         numpy.testing.assert_almost_equal(descaled.ivar, datacube.ivar / datacube.unit.scale**2)
 
+    def test_no_copy(self, datacube):
+
+        new_datacube = DataCube(datacube.value, datacube.wavelength.value,
+                                ivar=datacube.ivar, mask=datacube.mask, copy=False)
+
+        assert numpy.shares_memory(new_datacube.value, datacube.value)
+        assert numpy.shares_memory(new_datacube.ivar, datacube.ivar)
+        assert numpy.shares_memory(new_datacube.mask, datacube.mask)
+
     def test_redcorr(self, datacube):
 
         der = datacube.deredden()
@@ -245,6 +254,15 @@ class TestSpectrum(object):
         numpy.testing.assert_almost_equal(descaled.value, spectrum.value * spectrum.unit.scale)
         numpy.testing.assert_almost_equal(descaled.ivar, spectrum.ivar / spectrum.unit.scale**2)
 
+    def test_no_copy(self, spectrum):
+
+        new_spectrum = Spectrum(spectrum.value, spectrum.wavelength.value,
+                                ivar=spectrum.ivar, mask=spectrum.mask, copy=False)
+
+        assert numpy.shares_memory(new_spectrum.value, spectrum.value)
+        assert numpy.shares_memory(new_spectrum.ivar, spectrum.ivar)
+        assert numpy.shares_memory(new_spectrum.mask, spectrum.mask)
+
     def test_slice_spectrum(self, spectrum):
 
         new_spectrum = spectrum[10:100]
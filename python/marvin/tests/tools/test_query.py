@@ -134,6 +134,15 @@ class TestQuerySort(object):
             redshift = data['last'][-1]
         assert res.results['z'][0] == redshift
 
+    @pytest.mark.parametrize('query', [('nsa.z < 0.1')], indirect=True)
+    def test_iter_rows(self, query):
+        data = query.expdata['queries']['nsa.z < 0.1']
+        query = Query(search_filter=query.search_filter, mode=query.mode, sort='z', order='asc')
+        rows = query.iter_rows(chunk=5)
+        first = next(rows)
+        assert first[-1] == data['sorted']['1'][-1]
+        assert len(list(rows)) + 1 == data['count']
+
 
 class TestQueryShow(object):
 
@@ -14,6 +14,7 @@ import copy
 import json
 from imp import reload
 
+import numpy as np
 import pandas as pd
 import pytest
 import six
@@ -368,12 +369,87 @@ class TestResultsPaging(object):
         assert results.count == results.expdata['queries'][results.search_filter]['count']
         assert results.count == results.totalcount
 
+    @pytest.mark.parametrize('results', [('nsa.z < 0.1')], indirect=True)
+    def test_iterate(self, results):
+        res = results.getSubset(0, limit=1)
+        rows = list(results.iterate(chunk=5))
+        assert len(rows) == results.expdata['queries'][results.search_filter]['count']
+        assert rows[0] == results.results[0]
+        assert rows[0].mangaid == results.results[0].mangaid
+        assert results.count == 1
+
     @pytest.mark.parametrize('results', [('nsa.z < 0.1')], indirect=True)
     def test_get_all(self, results):
         res = results.getAll()
         assert results.count == results.totalcount
 
 
+class TestResultsColumnar(object):
+
+    @pytest.fixture()
+    def colres(self, results):
+        q = Query(search_filter=results.search_filter, mode=results.mode, limit=10,
+                  release=results.release, columnar=True)
+        r = q.run()
+        yield r
+        r = None
+
+    def test_lazy_rows(self, colres):
+        assert colres._result_set is None
+        assert colres.toArray().dtype.names == tuple(remotecols)
+        assert colres._result_set is None
+        assert isinstance(colres.results, ResultSet)
+        assert len(colres.results) == colres.count
+
+    def test_same_as_rows(self, colres, results):
+        assert colres.toArray().tolist() == [tuple(row) for row in results.results]
+        assert colres.getListOf('z') == results.getListOf('z')
+        assert colres.results[0] == results.results[0]
+
+    def test_column_view(self, colres):
+        column = colres.getListOf('nsa.z', to_ndarray=True)
+        assert column.base is colres.toArray()
+        assert colres._result_set is None
+
+    def test_totable(self, colres):
+        table = colres.toTable()
+        assert table.colnames == cols
+        assert table['nsa.z'][0] == colres.toArray()['z'][0]
+
+    def test_todataframe(self, colres):
+        df = colres.toDataFrame()
+        assert isinstance(df, pd.DataFrame)
+        assert list(df.columns) == remotecols
+        assert colres._result_set is None
+
+    def test_sort(self, colres):
+        colres.sort('z', order='desc')
+        redshift = colres.getListOf('z', to_ndarray=True)
+        assert (redshift[:-1] >= redshift[1:]).all()
+
+    def test_extend_set(self, colres):
+        colres.getSubset(0, limit=1)
+        first = colres.toArray().tolist()
+        colres.extendSet(start=1, chunk=2)
+        assert colres._result_set is None
+        assert colres.count == len(colres.toArray()) == min(3, colres.totalcount)
+        assert colres.toArray().tolist()[:1] == first
+        assert len(colres.results) == colres.count
+
+    def test_loop(self, colres):
+        colres.getSubset(0, limit=1)
+        colres.loop(chunk=500)
+        assert colres._result_set is None
+        assert colres.count == len(colres.toArray()) == colres.totalcount
+
+    def test_concatenate(self):
+        first = np.array([('8485-1901', 0.1)], dtype=[('plateifu', 'U9'), ('z', 'f8')])
+        second = np.array([('7443-12701', 0.2)], dtype=[('plateifu', 'U10'), ('z', 'f8')])
+        data = Results._concatenate_data(first, second)
+        assert data['plateifu'].tolist() == ['8485-1901', '7443-12701']
+        assert data['z'].tolist() == [0.1, 0.2]
+
+
 class TestResultsPickling(object):
 
     def test_pickle_save(self, results, temp_scratch):
@@ -420,6 +496,31 @@ class TestResultsConvertTool(object):
         assert cm.type == error
         assert errmsg in str(cm.value)
 
+    @pytest.mark.parametrize('executor', [(None), ('thread')])
+    def test_convert_parallel(self, results, executor):
+        results.convertToTool('cube', limit=3, mode=results.mode, n_workers=2, executor=executor)
+        assert len(results.objects) == len(results.results[0:3])
+        for obj, res in zip(results.objects, results.results[0:3]):
+            assert isinstance(obj, Cube) is True
+            assert obj.plateifu == res.plateifu
+
+    @pytest.mark.parametrize('n_workers', [(None), (3)])
+    def test_get_objects_deduplicates(self, results, n_workers):
+
+        created = []
+
+        class Fake(object):
+            def __init__(self, plateifu=None, mode=None):
+                created.append(plateifu)
+                self.plateifu = plateifu
+
+        specs = [(Fake, {'plateifu': plateifu, 'mode': 'remote'})
+                 for plateifu in ['8485-1901', '7443-12701', '8485-1901']]
+        objects = results._get_objects(specs, n_workers=n_workers, executor='thread' if n_workers else None)
+        assert [obj.plateifu for obj in objects] == ['8485-1901', '7443-12701', '8485-1901']
+        assert objects[0] is objects[2]
+        assert sorted(created) == ['7443-12701', '8485-1901']
+
 
 #
 # Below here is beginnings of Results refactor
@@ -24,7 +24,7 @@ from marvin.tools.cube import Cube
 from marvin.tools.maps import Maps
 from marvin.tools.modelcube import ModelCube
 from marvin.tools.quantities import Spectrum
-from marvin.tools.spaxel import Spaxel
+from marvin.tools.spaxel import Spaxel, SpaxelBlock
 from marvin.utils.datamodel.dap import Property
 from marvin.web.controllers.galaxy import get_flagged_regions
 
@@ -244,6 +244,57 @@ class TestSpaxel(object):
         assert not isinstance(spaxel._modelcube, ModelCube)
 
 
+@marvin_test_if_class(mark='include', galaxy=dict(plateifu=['8485-1901']))
+class TestSpaxelBlock(object):
+
+    def test_cube_block(self, galaxy):
+
+        cube = Cube(plateifu=galaxy.plateifu, release=galaxy.release)
+        block = cube.getSpaxels(x=[10, 11, 12], y=[15, 16, 17], xyorig='lower')
+
+        assert isinstance(block, SpaxelBlock)
+        assert len(block) == 3
+        assert block.flux.value.shape == (3, len(cube._wavelength))
+        assert block.flux.ivar.shape == block.flux.value.shape
+        assert block.flux.mask.shape == block.flux.value.shape
+
+        spaxel = cube.getSpaxel(x=11, y=16, xyorig='lower')
+        assert block.flux.value[1] == pytest.approx(spaxel.flux.value)
+        assert block.flux.ivar[1] == pytest.approx(spaxel.flux.ivar)
+
+    def test_maps_block(self, galaxy):
+
+        maps = Maps(plateifu=galaxy.plateifu, release=galaxy.release,
+                    bintype=galaxy.bintype, template=galaxy.template)
+        block = maps.getSpaxels(x=[galaxy.dap['x'], 0], y=[galaxy.dap['y'], 0], xyorig='lower')
+
+        assert block.maps_quantities.value.shape == (2, len(maps.datamodel))
+        assert len(block.maps_columns) == len(maps.datamodel)
+
+        spaxel = maps.getSpaxel(x=galaxy.dap['x'], y=galaxy.dap['y'], xyorig='lower')
+        ha = block.emline_gflux_ha_6564
+        assert ha.value[0] == pytest.approx(spaxel.emline_gflux_ha_6564.value)
+
+    def test_block_indexing(self, galaxy):
+
+        cube = Cube(plateifu=galaxy.plateifu, release=galaxy.release)
+        block = cube.getSpaxels(x=[10, 11], y=[15, 16], xyorig='lower')
+
+        assert len(block._spaxels) == 0
+
+        spaxel = block[-1]
+        assert isinstance(spaxel, Spaxel)
+        assert spaxel.loaded is True
+        assert (spaxel.x, spaxel.y) == (11, 16)
+        assert spaxel.flux.value == pytest.approx(block.flux.value[1])
+        assert block[1] is spaxel
+
+        assert len(list(block)) == 2
+
+        with pytest.raises(IndexError):
+            block[2]
+
+
 class TestBinInfo(object):
 
     def test_bad_binid(self):
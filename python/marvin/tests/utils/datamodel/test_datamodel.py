@@ -0,0 +1,79 @@
+# !usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under a 3-clause BSD license.
+#
+
+from __future__ import print_function, division, absolute_import
+
+import os
+
+import pytest
+from marvin import config
+from marvin.utils.datamodel.dap import DAPDataModelList, _sources
+from marvin.utils.datamodel.dap import datamodel as dap_datamodel
+
+
+@pytest.fixture()
+def lazy_datamodel():
+    """Yields a list of lazy datamodels and the number of times each one is built."""
+
+    builds = {'2.2.1': 0, '2.4.1': 0}
+
+    def get_builder(release):
+        def builder():
+            builds[release] += 1
+            return dap_datamodel[release]
+        return builder
+
+    datamodel = DAPDataModelList()
+    datamodel.add_lazy_datamodel('2.2.1', get_builder('2.2.1'), aliases=['MPL-7', 'DR15'],
+                                 sources=_sources)
+    datamodel.add_lazy_datamodel('2.4.1', get_builder('2.4.1'), aliases=['MPL-9'],
+                                 sources=_sources)
+
+    yield datamodel, builds
+
+
+class TestLazyDataModel(object):
+
+    def test_lazy(self, lazy_datamodel):
+        datamodel, builds = lazy_datamodel
+
+        assert 'MPL-9' in datamodel and 'DR15' in datamodel and 'MPL-4' not in datamodel
+        assert list(datamodel.keys()) == ['2.2.1', '2.4.1']
+        assert datamodel.loaded == []
+
+        assert datamodel['MPL-9'].release == '2.4.1'
+        assert datamodel['2.4.1'] is datamodel['MPL-9']
+        assert datamodel.loaded == ['2.4.1']
+        assert builds == {'2.2.1': 0, '2.4.1': 1}
+
+        assert [model.release for model in datamodel.values()] == ['2.2.1', '2.4.1']
+        assert builds == {'2.2.1': 1, '2.4.1': 1}
+
+    def test_missing(self, lazy_datamodel):
+        datamodel, builds = lazy_datamodel
+
+        with pytest.raises(KeyError):
+            datamodel['MPL-4']
+        assert datamodel.get('MPL-4') is None
+
+    def test_snapshot(self, lazy_datamodel, monkeypatch, temp_scratch):
+        datamodel, builds = lazy_datamodel
+        monkeypatch.setattr(config, 'datamodel_cache_dir', str(temp_scratch.join('datamodels')))
+
+        model = datamodel['MPL-9']
+        assert len(os.listdir(config.datamodel_cache_dir)) == 1
+
+        def builder():
+            raise AssertionError('the datamodel should be loaded from the snapshot')
+
+        new_datamodel = DAPDataModelList()
+        new_datamodel.add_lazy_datamodel('2.4.1', builder, aliases=['MPL-9'], sources=_sources)
+
+        snapshot = new_datamodel['MPL-9']
+        assert snapshot is not model
+        assert snapshot.release == model.release
+        assert [prop.full() for prop in snapshot.properties] == \
+            [prop.full() for prop in model.properties]
@@ -21,6 +21,7 @@ from __future__ import print_function
 import re
 import pytest
 import numpy as np
+from astropy import table
 from astropy.io import fits
 from astropy.wcs import WCS
 
@@ -34,7 +35,8 @@ from marvin.core.exceptions import MarvinError
 from marvin.utils.general import (convertCoords, get_nsa_data, getWCSFromPng,
                                   _sort_dir, getDapRedux, getDefaultMapPath, target_status,
                                   target_is_observed, downloadList, check_versions,
-                                  get_manga_image)
+                                  get_manga_image, DrpallIndex)
+from marvin.utils.general import general
 from marvin.utils.datamodel.dap import datamodel
 
 
@@ -305,6 +307,113 @@ class TestTargetStatus(object):
         assert status == exp
 
 
+@pytest.fixture()
+def drpall_index(monkeypatch):
+    tables = {'MANGA': table.Table({'plateifu': ['8485-1901', '8485-1902', '7443-12701'],
+                                    'mangaid': ['1-209232 ', '1-209113', '1-209232'],
+                                    'bluesn2': [1., 2., 5.], 'redsn2': [1., 2., 5.],
+                                    'srvymode': ['MaNGA dither'] * 3}),
+              'MASTAR': table.Table({'plateifu': ['8713-12701'], 'mangaid': ['3-23566'],
+                                     'bluesn2': [1.], 'redsn2': [1.],
+                                     'srvymode': ['APOGEE lead']})}
+    monkeypatch.setattr(general, 'get_drpall_table',
+                        lambda drpver=None, drpall=None, hdu='MANGA', lazy=False: tables[hdu])
+    yield DrpallIndex.from_table('v2_5_3', None)
+
+
+class TestDrpallIndex(object):
+
+    def test_plateifus(self, drpall_index):
+        assert drpall_index.get_plateifus('1-209232') == ['7443-12701', '8485-1901']
+        assert drpall_index.get_plateifus('3-23566') == []
+
+    def test_locate(self, drpall_index):
+        assert drpall_index.locate('8485-1902') == ('MANGA', 1)
+        assert drpall_index.locate('8713-12701') == ('MASTAR', 0)
+        assert drpall_index.locate('1-1') is None
+
+    def test_is_mastar(self, drpall_index):
+        assert drpall_index.is_mastar('8713-12701') is True
+        assert drpall_index.is_mastar('8485-1901') is False
+        with pytest.raises(ValueError):
+            drpall_index.is_mastar('1-1')
+
+    def test_save_load(self, drpall_index, temp_scratch):
+        drpall = temp_scratch.join('drpall-v2_5_3.fits')
+        drpall.write('drpall')
+        path = str(temp_scratch.join('index', 'drpall-v2_5_3.npz'))
+
+        drpall_index.drpall = str(drpall)
+        drpall_index.save(path)
+
+        loaded = DrpallIndex.load(path, 'v2_5_3', str(drpall))
+        assert loaded.get_plateifus('1-209232') == ['7443-12701', '8485-1901']
+        assert loaded.locate('8713-12701') == ('MASTAR', 0)
+
+        drpall.write('modified drpall')
+        assert DrpallIndex.load(path, 'v2_5_3', str(drpall)) is None
+
+
+@pytest.fixture()
+def lazy_table(temp_scratch):
+    path = str(temp_scratch.join('drpall-test.fits'))
+    data = table.Table({'plateifu': ['8485-1901', '7443-12701'], 'nsa_z': [0.04, 0.02],
+                       'nsa_elpetro_absmag': np.arange(14.).reshape(2, 7)})
+    data.write(path, format='fits')
+    yield general.LazyTable(path, hdu=1)
+
+
+class TestLazyTable(object):
+
+    def test_columns(self, lazy_table):
+        assert len(lazy_table) == 2
+        assert lazy_table.colnames == ['plateifu', 'nsa_z', 'nsa_elpetro_absmag']
+        assert lazy_table.loaded_columns == []
+
+        assert lazy_table['nsa_z'][1] == pytest.approx(0.02)
+        assert lazy_table['NSA_Z'] is lazy_table['nsa_z']
+        assert lazy_table.loaded_columns == ['nsa_z']
+        assert lazy_table.nbytes == 16
+
+    def test_rows(self, lazy_table):
+        row = lazy_table[-1]
+        assert row['plateifu'] == '7443-12701'
+        assert lazy_table[np.array([True, False])]['nsa_z'][0] == pytest.approx(0.04)
+        assert lazy_table.to_table(columns=['plateifu']).colnames == ['plateifu']
+
+    def test_shared(self, lazy_table):
+        other = general.LazyTable(lazy_table.path, hdu=1)
+        assert other['plateifu'] is lazy_table['plateifu']
+
+
+class TestGetDrpallTable(object):
+
+    @pytest.fixture(autouse=True)
+    def drpall(self, monkeypatch, temp_scratch):
+        path = str(temp_scratch.join('drpall-v2_4_3.fits'))
+        data = table.Table({'plateifu': ['8485-1901', '7443-12701'], 'nsa_z': [0.04, 0.02]})
+        fits.HDUList([fits.PrimaryHDU(), fits.table_to_hdu(data)]).writeto(path)
+        fits.setval(path, 'EXTNAME', value='MANGA', ext=1)
+
+        monkeypatch.setattr(general, 'get_drpall_file', lambda drpall=None, drpver=None: None)
+        monkeypatch.setattr(general, 'drpTable', {})
+        monkeypatch.setattr(general, 'drpFullTable', {})
+        yield path
+
+    def test_table(self, drpall):
+        drpall_table = general.get_drpall_table(drpver='v2_4_3', drpall=drpall)
+        assert isinstance(drpall_table, table.Table)
+        assert general.get_drpall_table(drpver='v2_4_3', drpall=drpall) is drpall_table
+
+        drpall_table.add_index('plateifu')
+        assert drpall_table.loc['7443-12701']['nsa_z'] == pytest.approx(0.02)
+
+    def test_lazy(self, drpall):
+        lazy_table = general.get_drpall_table(drpver='v2_4_3', drpall=drpall, lazy=True)
+        assert isinstance(lazy_table, general.LazyTable)
+        assert lazy_table.loaded_columns == []
+
+
 class TestDownloadList(object):
     dl = ['8485-1901', '7443-12701']
 
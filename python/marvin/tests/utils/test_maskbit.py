@@ -11,10 +11,15 @@
 
 from __future__ import absolute_import, division, print_function
 
+import os
+import shutil
+
 import numpy as np
 import pandas as pd
 import pytest
 
+import marvin
+from marvin.utils.general import maskbit
 from marvin.utils.general.maskbit import Maskbit
 
 
@@ -48,6 +53,26 @@ class TestMaskbit(object):
         assert isinstance(mb.schema, pd.DataFrame)
         assert mb.description is None
 
+    def test_maskbit_schema_shared(self):
+        mb = Maskbit(name='MANGA_DAPPIXMASK')
+        mb2 = Maskbit(name='MANGA_DAPPIXMASK')
+        assert mb._maskbit_schema is mb2._maskbit_schema
+        assert mb.schema is mb2.schema
+        assert mb.labels_to_bits('NOCOV') == [0]
+
+    def test_compiled_schemas(self, temp_scratch):
+        path_par = os.path.join(os.path.dirname(marvin.__file__), 'data', 'sdssMaskbits.par')
+        path_npz = str(temp_scratch.join('sdssMaskbits.npz'))
+
+        compiled = maskbit._compile_maskbit_schemas(path_par, path_npz)
+        loaded = maskbit._load_compiled_maskbit_schemas(path_par, path_npz)
+        for key in ['flag', 'bit', 'label', 'description']:
+            assert np.array_equal(loaded[key], compiled[key])
+
+        path_copy = str(temp_scratch.join('sdssMaskbits.par'))
+        shutil.copy(path_par, path_copy)
+        assert maskbit._load_compiled_maskbit_schemas(path_copy, path_npz) is None
+
     def test_values_to_bits_no_value_error(self,  name=name, schema=schema, description=description):
         mb = Maskbit(name=name, schema=schema, description=description)
         with pytest.raises(AssertionError) as ee:
@@ -69,6 +94,24 @@ class TestMaskbit(object):
         actual = mb.values_to_bits(values=values)
         assert actual == expected
 
+    @pytest.mark.parametrize('values, expected',
+                             [(0, [False, False, False, False, False]),
+                              (12, [False, False, True, True, False]),
+                              (np.array([1, 3], dtype=np.uint8), [[True, False, False, False, False],
+                                                                  [True, True, False, False, False]])])
+    def test_bit_planes(self, values, expected):
+        mb = Maskbit(name=name, schema=schema, description=description)
+        actual = mb.bit_planes(values)
+        assert actual.dtype == bool
+        assert actual.shape == np.shape(values) + (len(schema),)
+        assert actual.tolist() == expected
+
+    def test_bit_planes_mask(self):
+        mb = Maskbit(name=name, schema=schema, description=description)
+        mb.mask = mask
+        assert mb.bit_planes().shape == mask.shape + (len(schema),)
+        assert mb.bit_planes()[1, 1].tolist() == [False, False, True, True, False]
+
     @pytest.mark.parametrize('value, expected',
                              [(0, []),
                               (3, [0, 1])])
@@ -140,6 +183,17 @@ class TestMaskbit(object):
         actual = mb.get_mask(labels, dtype=bool)
         assert (actual == expected).all()
 
+    @pytest.mark.parametrize('dtype, expected',
+                             [(np.bool_, np.array([[False, False], [True, True]])),
+                              (float, np.array([[0., 0.], [2., 10.]])),
+                              (np.uint8, np.array([[0, 0], [2, 10]]))])
+    def test_get_mask_dtype(self, dtype, expected):
+        mb = Maskbit(name=name, schema=schema, description=description)
+        mb.mask = mask
+        actual = mb.get_mask(['BITONE', 'BITTHREE'], mask=custom_mask, dtype=dtype)
+        assert actual.dtype == np.dtype(dtype)
+        assert (actual == expected).all()
+
     @pytest.mark.parametrize('labels, expected',
                              [('BITONE', np.array([[0, 0], [2, 2]])),
                               (['BITONE'], np.array([[0, 0], [2, 2]])),
@@ -172,10 +226,12 @@ class TestMaskbit(object):
 
     @pytest.mark.parametrize('labels, dtype, expected',
                              [('BITFOUR', bool, np.array([[False, False], [False, False]])),
-                              ('BITFOUR', int, np.array([[0, 0], [0, 0]]))])
+                              ('BITFOUR', int, np.array([[0, 0], [0, 0]])),
+                              ('BITFOUR', np.uint8, np.array([[0, 0], [0, 0]]))])
     def test_get_mask_empty(self, labels, dtype, expected):
 
         mb = Maskbit(name=name, schema=schema, description=description)
         mb.mask = mask
         actual = mb.get_mask(labels, mask=custom_mask, dtype=dtype)
+        assert actual.dtype == np.dtype(dtype)
         assert (actual == expected).all()
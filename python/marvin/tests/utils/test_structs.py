@@ -9,11 +9,21 @@
 # @Last Modified time: 2017-06-12 19:13:15
 
 from __future__ import print_function, division, absolute_import
-from marvin.utils.general.structs import Dotable, DotableCaseInsensitive
+from marvin.utils.general import structs
+from marvin.utils.general.structs import (Dotable, DotableCaseInsensitive, FuzzyDict, FuzzyList,
+                                          LazyFuzzyDict)
+from marvin.utils.general.structs import get_best_fuzzy as structs_get_best_fuzzy
+import copy
+import pickle
+import timeit
 import pytest
 
 from collections import OrderedDict
 
+# The maximum average time, in microseconds, of a lookup in the hot-path benchmark,
+# which only runs with --benchmark.
+LOOKUP_TIME_BUDGET = 50
+
 normal_dicts = [OrderedDict(A=7, b=[10, 2], C='AbCdEf', d=['ghIJ', 'Lmnop'])]
 
 
@@ -39,3 +49,158 @@ class TestCoreDotable(object):
         assert dotdictci[key.upper()] == dotdictci.__getattr__(key.lower())
         assert dotdictci[key.lower()] == dotdictci.__getattr__(key.upper())
         assert dotdictci[key.lower()] == dotdictci.__getattr__(key.lower())
+
+
+class TestLazyFuzzyDict(object):
+
+    def test_lazy(self):
+        calls = []
+        lazy = LazyFuzzyDict({})
+        for key in ['emline_gflux_ha_6564', 'stellar_vel']:
+            lazy.set_lazy(key, lambda key=key: calls.append(key) or key.upper())
+
+        assert 'stellar_vel' in lazy
+        assert len(lazy) == 2
+        assert calls == []
+
+        assert lazy['stellar_vel'] == 'STELLAR_VEL'
+        assert lazy.stellar_vel == 'STELLAR_VEL'
+        assert calls == ['stellar_vel']
+
+        assert lazy['gflux_ha'] == 'EMLINE_GFLUX_HA_6564'
+        assert lazy.values() == ['EMLINE_GFLUX_HA_6564', 'STELLAR_VEL']
+        assert calls == ['stellar_vel', 'emline_gflux_ha_6564']
+
+    def test_copy(self):
+        lazy = LazyFuzzyDict({})
+        lazy.set_lazy('stellar_vel', lambda: 1)
+        copied = copy.deepcopy(lazy)
+        assert isinstance(copied, FuzzyDict)
+        assert copied['stellar_vel'] == 1
+
+
+class TestFuzzyList(object):
+
+    def test_exact(self):
+        fuzzy = FuzzyList(['stellar_vel', 'emline_gflux_ha_6564', 'spx_snr'])
+        assert fuzzy == 'stellar_vel'
+        assert fuzzy.spx_snr == 'spx_snr'
+        assert 'spx_snr' in fuzzy
+
+    def test_memo(self):
+        calls = []
+
+        def use_fuzzy(value, choices):
+            calls.append(value)
+            return FuzzyList([]).use_fuzzy(value, choices)
+
+        fuzzy = FuzzyList(['stellar_vel', 'emline_gflux_ha_6564'], use_fuzzy=use_fuzzy)
+        assert fuzzy == 'gflux_ha'
+        assert fuzzy == 'gflux_ha'
+        assert fuzzy == 'stellar_vel'
+        assert calls == ['gflux_ha']
+
+        fuzzy.append('emline_gflux_hb_4862')
+        assert fuzzy == 'gflux_ha'
+        assert calls == ['gflux_ha', 'gflux_ha']
+
+    def test_modified(self):
+        fuzzy = FuzzyList(['stellar_vel', 'spx_snr'])
+        assert fuzzy == 'stellar_vel'
+
+        fuzzy[0] = 'stellar_sigma'
+        assert 'stellar_vel' not in fuzzy
+        assert fuzzy == 'stellar_sigma'
+
+        fuzzy.remove('spx_snr')
+        fuzzy.extend(['binid'])
+        assert fuzzy.binid == 'binid'
+        assert dir(fuzzy) == ['binid', 'stellar_sigma']
+
+    def test_copy(self):
+        fuzzy = FuzzyList(['stellar_vel', 'spx_snr'])
+        assert fuzzy == 'stellar_vel'
+
+        for new_fuzzy in [copy.copy(fuzzy), copy.deepcopy(fuzzy),
+                          pickle.loads(pickle.dumps(fuzzy))]:
+            assert new_fuzzy == 'spx_snr'
+            assert list(new_fuzzy) == list(fuzzy)
+
+
+class TestFuzzyDict(object):
+
+    def test_memo(self, monkeypatch):
+        calls = []
+
+        def get_best_fuzzy(value, choices):
+            calls.append(value)
+            return structs_get_best_fuzzy(value, choices)
+
+        monkeypatch.setattr(structs, 'get_best_fuzzy', get_best_fuzzy)
+
+        fuzzy = FuzzyDict([('stellar_vel', 1), ('emline_gflux_ha_6564', 2)])
+        assert fuzzy['gflux_ha'] == 2
+        assert fuzzy['gflux_ha'] == 2
+        assert fuzzy['stellar_vel'] == 1
+        assert calls == ['gflux_ha']
+
+        fuzzy['stellar_vel'] = 3
+        assert fuzzy['gflux_ha'] == 2
+        assert calls == ['gflux_ha']
+
+    def test_replaced_key(self):
+        fuzzy = FuzzyDict([('stellar_vel', 1), ('spx_snr', 2)])
+        assert fuzzy['spx snr'] == 2
+        with pytest.raises(ValueError):
+            fuzzy['bin id']
+
+        # The number of keys does not change.
+        del fuzzy['spx_snr']
+        fuzzy['binid'] = 3
+        assert fuzzy['bin id'] == 3
+        with pytest.raises(ValueError):
+            fuzzy['spx snr']
+
+    @pytest.mark.parametrize('modify', [lambda fuzzy: fuzzy.pop('stellar_vel'),
+                                        lambda fuzzy: fuzzy.popitem(last=False),
+                                        lambda fuzzy: fuzzy.clear()],
+                             ids=['pop', 'popitem', 'clear'])
+    def test_modified(self, modify):
+        fuzzy = FuzzyDict([('stellar_vel', 1), ('emline_gflux_ha_6564', 2)])
+        assert fuzzy['stellar'] == 1
+
+        modify(fuzzy)
+        fuzzy.update(emline_gflux_hb_4862=3)
+        with pytest.raises(ValueError):
+            fuzzy['stellar']
+
+    def test_missing(self):
+        fuzzy = FuzzyDict([('stellar_vel', 1)])
+        for __ in range(2):
+            with pytest.raises(ValueError):
+                fuzzy['zzzz']
+
+
+@pytest.mark.benchmark
+class TestHotPath(object):
+    """Measures the average time of exact and repeated fuzzy lookups."""
+
+    names = ['emline_gflux_{0}'.format(ii) for ii in range(1000)]
+
+    def _time(self, lookup, number=1000):
+        lookup()
+        return timeit.timeit(lookup, number=number) / number * 1e6
+
+    @pytest.mark.parametrize('value', ['emline_gflux_500', 'emline gflux 500'],
+                             ids=['exact', 'fuzzy'])
+    def test_fuzzy_list(self, value):
+        fuzzy = FuzzyList(self.names)
+        time = self._time(lambda: fuzzy == value)
+        assert time < LOOKUP_TIME_BUDGET, 'FuzzyList lookup took {0:.1f} us'.format(time)
+
+    @pytest.mark.parametrize('value', ['emline_gflux_500', 'emline gflux 500'],
+                             ids=['exact', 'fuzzy'])
+    def test_fuzzy_dict(self, value):
+        fuzzy = FuzzyDict((name, ii) for ii, name in enumerate(self.names))
+        time = self._time(lambda: fuzzy[value])
+        assert time < LOOKUP_TIME_BUDGET, 'FuzzyDict lookup took {0:.1f} us'.format(time)
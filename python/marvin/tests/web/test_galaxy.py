@@ -10,7 +10,7 @@
 
 from __future__ import print_function, division, absolute_import
 from marvin.web.controllers.galaxy import make_nsa_dict
-from marvin.web.controllers.galaxy import getWebMap
+from marvin.web.controllers.galaxy import getWebMap, getWebMaps
 from marvin.tools.cube import Cube
 from marvin.tests.conftest import set_the_config
 import pytest
@@ -80,6 +80,20 @@ class TestWebMap(object):
         if 'sigma' in parameter and cube.release != 'MPL-6':
             assert 'Corrected' in mapmsg
 
+    def test_getmaps(self, cube):
+        parameters = [('emline_gflux', 'ha_6564'), ('stellar_sigma', None)]
+        webmaps = getWebMaps(cube, parameters)
+
+        assert len(webmaps) == 2
+        for (parameter, channel), (webmap, mapmsg) in zip(parameters, webmaps):
+            assert (webmap, mapmsg) == getWebMap(cube, parameter=parameter, channel=channel)
+
+    def test_getmaps_failed(self, cube):
+        webmaps = getWebMaps(cube, [('emline_gflux', 'ha_6564'), ('crap', None)])
+        assert isinstance(webmaps[0][0], dict)
+        assert webmaps[1][0] is None
+        assert 'Could not get map' in webmaps[1][1]
+
     def test_getmap_failed(self, cube):
         webmap, mapmsg = getWebMap(cube, parameter='crap')
         assert webmap is None
@@ -18,9 +18,13 @@ import astropy.io.fits
 import marvin
 import marvin.api.api
 from marvin.core import marvin_pickle
+from marvin.core.disk_cache import get_gunzip_cache, get_remote_cache, is_gzipped
 from marvin.core.exceptions import MarvinBreadCrumb, MarvinError, MarvinUserWarning
+from marvin.core.file_pool import FileHandle
+from marvin.core.memory_cache import ToolCache
 from marvin.tools.mixins import MMAMixIn
 from marvin.utils.general.maskbit import get_manga_target
+from marvin.utils.general.structs import gunzip
 
 
 try:
@@ -34,7 +38,7 @@ except ImportError:
     Access = None
 
 
-__ALL__ = ['MarvinToolsClass']
+__ALL__ = ['MarvinToolsClass', 'open_fits']
 
 
 def kwargsGet(kwargs, key, replacement):
@@ -48,6 +52,30 @@ def kwargsGet(kwargs, key, replacement):
         return kwargs[key]
 
 
+def open_fits(filename):
+    """Opens a FITS file memory-mapped.
+
+    Gzipped files are opened from their decompressed copy in the
+    `~marvin.core.disk_cache.GunzipCache` (see ``config.use_gunzip_cache``)
+    or, if the cache is disabled or fails, from a temporary decompressed file.
+
+    """
+
+    if not is_gzipped(filename):
+        return astropy.io.fits.open(filename, memmap=True)
+
+    gunzip_cache = get_gunzip_cache()
+
+    if gunzip_cache is not None:
+        try:
+            return astropy.io.fits.open(gunzip_cache.get(filename), memmap=True)
+        except (IOError, OSError) as ee:
+            warnings.warn('failed using the gunzip cache: {0}'.format(ee), MarvinUserWarning)
+
+    with gunzip(filename) as gg:
+        return astropy.io.fits.open(gg.name, memmap=True)
+
+
 breadcrumb = MarvinBreadCrumb()
 
 
@@ -125,12 +153,142 @@ class MarvinToolsClass(MMAMixIn):
         from marvin.contrib.vacs.base import VACMixIn
         self.vacs = VACMixIn.get_vacs(self)
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def data(self):
+        """The |HDUList|, SQLAlchemy object, or dictionary with the data.
+
+        For files opened with `._open_file`, the |HDUList| is reopened if it
+        has been closed by the pool of open files.
+
+        """
+
+        file_handle = self.__dict__.get('_file_handle', None)
+        if file_handle is not None:
+            return file_handle.fileobj
+
+        return self.__dict__.get('_data', None)
+
+    @data.setter
+    def data(self, value):
+
+        file_handle = self.__dict__.get('_file_handle', None)
+        if file_handle is not None and file_handle.is_open and value is file_handle.fileobj:
+            return
+
+        self._close_file()
+        self._data = value
+
+    def _open_file(self, opener=open_fits):
+        """Opens ``self.filename`` in the pool of open files and sets it as ``data``.
+
+        The pool (see `~marvin.core.file_pool.FilePool`) limits the number of
+        files open at the same time to ``config.max_open_files``. If the file
+        is closed by the pool, it is reopened with ``opener`` when ``data`` is
+        accessed.
+
+        """
+
+        self._close_file()
+
+        file_handle = FileHandle(self.filename, opener)
+        file_handle.fileobj
+
+        self._data = None
+        self._file_handle = file_handle
+
+    def _close_file(self):
+        """Closes the file opened with `._open_file`, if any."""
+
+        file_handle = self.__dict__.get('_file_handle', None)
+        if file_handle is not None:
+            file_handle.close()
+            self._file_handle = None
+
+    def close(self):
+        """Closes the FITS file and releases the data cached in memory.
+
+        Called when the object is used as a context manager. Accessing the
+        data of a file opened by Marvin reopens the file.
+
+        Example:
+            >>> with Cube('8485-1901') as cube:
+            >>>     flux = cube.flux.value.sum()
+
+        """
+
+        if self.__dict__.get('_file_handle', None) is not None:
+            self._file_handle.close()
+        elif (self.__dict__.get('data_origin', None) == 'file' and
+              isinstance(self.__dict__.get('_data', None), astropy.io.fits.HDUList)):
+            self._data.close()
+
+        for value in list(self.__dict__.values()):
+            if isinstance(value, ToolCache):
+                value.clear()
+
     def _toolInteraction(self, url, params=None):
         """Runs an Interaction and passes self._release."""
 
         params = params or {'release': self._release}
         return marvin.api.api.Interaction(url, params=params)
 
+    @classmethod
+    def aopen(cls, *args, **kwargs):
+        """Initialises the object asynchronously.
+
+        Accepts the same parameters as the class and returns an awaitable
+        that, when awaited, initialises the object in a background thread.
+        Useful to load many objects concurrently in remote mode. Requires
+        Python 3.5+. See `marvin.api.aio`.
+
+        Example:
+            >>> maps = await Maps.aopen('8485-1901', mode='remote')
+
+        """
+
+        from marvin.api.aio import run_in_executor
+
+        return run_in_executor(cls, *args, **kwargs)
+
+    def _get_cache_key(self, *names):
+        """Returns the remote cache key for some data of this object.
+
+        The key includes the release and the DRP and DAP versions, so that
+        cached data is not reused if the data for a release changes.
+
+        """
+
+        bintype = getattr(self, 'bintype', None)
+        template = getattr(self, 'template', None)
+
+        return (self.__class__.__name__, self._release, self._drpver, self._dapver,
+                self.plateifu, getattr(bintype, 'name', bintype),
+                getattr(template, 'name', template)) + names
+
+    def _get_from_remote_cache(self, *names):
+        """Returns data from the remote cache, or None if not found or disabled."""
+
+        remote_cache = get_remote_cache()
+        if remote_cache is None:
+            return None
+
+        return remote_cache.get(self._get_cache_key(*names))
+
+    def _set_in_remote_cache(self, data, *names):
+        """Stores the data from an API call in the remote cache, if enabled."""
+
+        remote_cache = get_remote_cache()
+        if remote_cache is None:
+            return
+
+        remote_cache.set(self._get_cache_key(*names), data)
+
     @staticmethod
     def _check_file(header, data, objtype):
         ''' Check the file input to ensure correct tool '''
@@ -168,24 +326,28 @@ class MarvinToolsClass(MMAMixIn):
             raise MarvinError('objects with data_origin=\'db\' cannot be saved.')
 
         odict = self.__dict__.copy()
-        del odict['data']
+        odict.pop('_data', None)
 
         return odict
 
     def __setstate__(self, idict):
 
-        data = None
+        idict.pop('data', None)
+        self.__dict__.update(idict)
+        self._data = None
+
         if idict['data_origin'] == 'file':
             try:
-                data = astropy.io.fits.open(idict['filename'])
+                if self.__dict__.get('_file_handle', None) is None:
+                    self._open_file()
+                else:
+                    self._file_handle.fileobj
             except Exception as ee:
+                self._file_handle = None
                 warnings.warn('there was a problem reloading the FITS object: {0}. '
                               'The object has been unpickled but not all the functionality '
                               'will be available.'.format(str(ee)), MarvinUserWarning)
 
-        self.__dict__.update(idict)
-        self.data = data
-
     def save(self, path=None, overwrite=False):
         """Pickles the object.
 
@@ -228,13 +390,12 @@ class MarvinToolsClass(MMAMixIn):
         return res
 
     def __del__(self):
-        """Destructor for closing FITS files."""
+        """Destructor for closing FITS files and releasing the cached data."""
 
-        if self.data_origin == 'file' and isinstance(self.data, astropy.io.fits.HDUList):
-            try:
-                self.data.close()
-            except Exception as ee:
-                warnings.warn('failed to close FITS instance: {0}'.format(ee), MarvinUserWarning)
+        try:
+            self.close()
+        except Exception as ee:
+            warnings.warn('failed to close FITS instance: {0}'.format(ee), MarvinUserWarning)
 
     @property
     def quality_flag(self):
@@ -21,12 +21,14 @@ from astropy.wcs import WCS
 import marvin
 import marvin.core.exceptions
 import marvin.tools.maps
+import marvin.tools.modelcube
 import marvin.tools.spaxel
 import marvin.utils.general.general
 from marvin.core.exceptions import MarvinError, MarvinUserWarning
+from marvin.core.memory_cache import ToolCache
 from marvin.tools.quantities import DataCube, Spectrum
 from marvin.utils.datamodel.drp import datamodel
-from marvin.utils.general import FuzzyDict, get_nsa_data, gunzip
+from marvin.utils.general import FuzzyDict, get_nsa_data
 
 from .core import MarvinToolsClass
 from .mixins import GetApertureMixIn, NSAMixIn
@@ -53,14 +55,7 @@ class Cube(MarvinToolsClass, NSAMixIn, GetApertureMixIn):
 
         # Stores data from extensions that have already been accessed, so that they
         # don't need to be retrieved again.
-        self._extension_data = {}
-
-        # Datacubes and spectra
-        self._flux = None
-        self._spectral_resolution = None
-        self._spectral_resolution_prepixel = None
-        self._dispersion = None
-        self._dispersion_prepixel = None
+        self._extension_data = ToolCache()
 
         self._bitmasks = None
 
@@ -177,8 +172,7 @@ class Cube(MarvinToolsClass, NSAMixIn, GetApertureMixIn):
             assert isinstance(data, fits.HDUList), 'data is not an HDUList object'
         else:
             try:
-                with gunzip(self.filename) as gg:
-                    self.data = fits.open(gg.name)
+                self._open_file()
             except (IOError, OSError) as err:
                 raise OSError('filename {0} cannot be found: {1}'.format(self.filename, err))
 
@@ -234,15 +228,20 @@ class Cube(MarvinToolsClass, NSAMixIn, GetApertureMixIn):
     def _load_cube_from_api(self):
         """Calls the API and retrieves the necessary information to instantiate the cube."""
 
-        url = marvin.config.urlmap['api']['getCube']['url']
+        data = self._get_from_remote_cache('cube')
 
-        try:
-            response = self._toolInteraction(url.format(name=self.plateifu))
-        except Exception as ee:
-            raise MarvinError('found a problem when checking if remote cube '
-                              'exists: {0}'.format(str(ee)))
+        if data is None:
 
-        data = response.getData()
+            url = marvin.config.urlmap['api']['getCube']['url']
+
+            try:
+                response = self._toolInteraction(url.format(name=self.plateifu))
+            except Exception as ee:
+                raise MarvinError('found a problem when checking if remote cube '
+                                  'exists: {0}'.format(str(ee)))
+
+            data = response.getData()
+            self._set_in_remote_cache(data, 'cube')
 
         self.header = fits.Header.fromstring(data['header'])
         self.wcs = WCS(fits.Header.fromstring(data['wcs_header']))
@@ -255,7 +254,7 @@ class Cube(MarvinToolsClass, NSAMixIn, GetApertureMixIn):
         return
 
     def _get_datacube(self, name):
-        """Returns a `.DataCube`."""
+        """Returns a `.DataCube` built over the cached extension arrays, without copying them."""
 
         model = self.datamodel.datacubes[name]
         cube_data = self._get_extension_data(name)
@@ -268,12 +267,13 @@ class Cube(MarvinToolsClass, NSAMixIn, GetApertureMixIn):
                             np.array(self._wavelength),
                             ivar=self._get_extension_data(name, 'ivar'),
                             mask=self._get_extension_data(name, 'mask'),
-                            unit=model.unit, pixmask_flag=model.pixmask_flag)
+                            unit=model.unit, pixmask_flag=model.pixmask_flag,
+                            copy=False)
 
         return datacube
 
     def _get_spectrum(self, name):
-        """Returns an `.Spectrum`."""
+        """Returns an `.Spectrum` built over the cached extension arrays, without copying them."""
 
         model = self.datamodel.spectra[name]
         spec_data = self._get_extension_data(name)
@@ -286,7 +286,8 @@ class Cube(MarvinToolsClass, NSAMixIn, GetApertureMixIn):
                             wavelength=np.array(self._wavelength),
                             std=self._get_extension_data(name, 'std'),
                             unit=model.unit,
-                            pixmask_flag=model.pixmask_flag)
+                            pixmask_flag=model.pixmask_flag,
+                            copy=False)
 
         return spectrum
 
@@ -297,12 +298,7 @@ class Cube(MarvinToolsClass, NSAMixIn, GetApertureMixIn):
         assert 'flux' in self.datamodel.datacubes.list_names(), \
             'flux is not present in his MPL version.'
 
-        assert hasattr(self, '_flux')
-
-        if self._flux is None:
-            self._flux = self._get_datacube('flux')
-
-        return self._flux
+        return self._get_datacube('flux')
 
     @property
     def dispersion(self):
@@ -311,12 +307,7 @@ class Cube(MarvinToolsClass, NSAMixIn, GetApertureMixIn):
         assert 'dispersion' in self.datamodel.datacubes.list_names(), \
             'dispersion is not present in his MPL version.'
 
-        assert hasattr(self, '_dispersion')
-
-        if self._dispersion is None:
-            self._dispersion = self._get_datacube('dispersion')
-
-        return self._dispersion
+        return self._get_datacube('dispersion')
 
     @property
     def dispersion_prepixel(self):
@@ -325,12 +316,7 @@ class Cube(MarvinToolsClass, NSAMixIn, GetApertureMixIn):
         assert 'dispersion_prepixel' in self.datamodel.datacubes.list_names(), \
             'dispersion_prepixel is not present in his MPL version.'
 
-        assert hasattr(self, '_dispersion_prepixel')
-
-        if self._dispersion_prepixel is None:
-            self._dispersion_prepixel = self._get_datacube('dispersion_prepixel')
-
-        return self._dispersion_prepixel
+        return self._get_datacube('dispersion_prepixel')
 
     @property
     def spectral_resolution(self):
@@ -339,12 +325,7 @@ class Cube(MarvinToolsClass, NSAMixIn, GetApertureMixIn):
         assert 'spectral_resolution' in self.datamodel.spectra.list_names(), \
             'spectral_resolution is not present in his MPL version.'
 
-        assert hasattr(self, '_spectral_resolution')
-
-        if self._spectral_resolution is None:
-            self._spectral_resolution = self._get_spectrum('spectral_resolution')
-
-        return self._spectral_resolution
+        return self._get_spectrum('spectral_resolution')
 
     @property
     def spectral_resolution_prepixel(self):
@@ -353,12 +334,7 @@ class Cube(MarvinToolsClass, NSAMixIn, GetApertureMixIn):
         assert 'spectral_resolution_prepixel' in self.datamodel.spectra.list_names(), \
             'spectral_resolution_prepixel is not present in his MPL version.'
 
-        assert hasattr(self, '_spectral_resolution_prepixel')
-
-        if self._spectral_resolution_prepixel is None:
-            self._spectral_resolution_prepixel = self._get_spectrum('spectral_resolution_prepixel')
-
-        return self._spectral_resolution_prepixel
+        return self._get_spectrum('spectral_resolution_prepixel')
 
     def _get_ext_name(self, model, ext):
         ''' Get the extension name if it exists '''
@@ -379,8 +355,10 @@ class Cube(MarvinToolsClass, NSAMixIn, GetApertureMixIn):
         if not ext_name:
             return None
 
-        if ext_name in self._extension_data:
+        try:
             return self._extension_data[ext_name]
+        except KeyError:
+            pass
 
         if self.data_origin == 'file':
             ext_data = self.data[model.fits_extension(ext)].data
@@ -397,26 +375,128 @@ class Cube(MarvinToolsClass, NSAMixIn, GetApertureMixIn):
 
         elif self.data_origin == 'api':
 
-            params = {'release': self._release}
-            url = marvin.config.urlmap['api']['getExtension']['url']
+            data = self._get_from_remote_cache('extension', ext_name)
 
-            try:
-                response = self._toolInteraction(
-                    url.format(name=self.plateifu,
-                               cube_extension=model.fits_extension(ext).lower()),
-                    params=params)
-            except Exception as ee:
-                raise MarvinError('found a problem when checking if remote cube '
-                                  'exists: {0}'.format(str(ee)))
+            if data is None:
+
+                params = {'release': self._release}
+                url = marvin.config.urlmap['api']['getExtension']['url']
+
+                try:
+                    response = self._toolInteraction(
+                        url.format(name=self.plateifu,
+                                   cube_extension=model.fits_extension(ext).lower()),
+                        params=params)
+                except Exception as ee:
+                    raise MarvinError('found a problem when checking if remote cube '
+                                      'exists: {0}'.format(str(ee)))
+
+                data = response.getData()
+                self._set_in_remote_cache(data, 'extension', ext_name)
 
-            data = response.getData()
             cube_ext_data = data['extension_data']
-            ext_data = np.array(cube_ext_data) if cube_ext_data is not None else None
+            ext_data = np.asarray(cube_ext_data) if cube_ext_data is not None else None
 
         self._extension_data[ext_name] = ext_data
 
         return ext_data
 
+    def _get_subcube_extension_data(self, name, slices, ext=None):
+        """Returns a slice of an extension, only downloading it if remote."""
+
+        model = self.datamodel[name]
+        ext_name = self._get_ext_name(model, ext)
+        if not ext_name:
+            return None
+
+        # Uses the full extension if we already have it or it is local.
+        if self.data_origin != 'api' or ext_name in self._extension_data:
+            ext_data = self._get_extension_data(name, ext=ext)
+            return ext_data[slices] if ext_data is not None else None
+
+        wave_slice, y_slice, x_slice = slices
+        params = {'release': self._release,
+                  'wave_start': wave_slice.start, 'wave_stop': wave_slice.stop,
+                  'y_start': y_slice.start, 'y_stop': y_slice.stop,
+                  'x_start': x_slice.start, 'x_stop': x_slice.stop}
+
+        url = marvin.config.urlmap['api']['getSubCube']['url']
+
+        try:
+            response = self._toolInteraction(
+                url.format(name=self.plateifu,
+                           cube_extension=model.fits_extension(ext).lower()),
+                params={key: value for key, value in params.items() if value is not None})
+        except Exception as ee:
+            raise MarvinError('found a problem when getting the remote subcube: {0}'.format(str(ee)))
+
+        ext_data = response.getData()['extension_data']
+
+        return np.asarray(ext_data) if ext_data is not None else None
+
+    def get_subcube(self, name='flux', wave=None, x=None, y=None):
+        """Returns a `.DataCube` for a spectral and/or spatial section of the cube.
+
+        In remote mode, only the requested section is downloaded, which is
+        much faster than retrieving the full datacube when, for instance,
+        working with a single emission line.
+
+        Parameters:
+            name (str):
+                The name of the datacube to slice, e.g., ``'flux'``.
+            wave (tuple):
+                The ``(min, max)`` wavelength range, in Angstrom, to return.
+                If None, returns the full wavelength range.
+            x,y (tuple):
+                The ``(start, stop)`` range of spaxels to return, in pixels
+                with origin ``lower``. As with Python slices, ``stop`` is
+                exclusive. If None, returns the full spatial range.
+
+        Returns:
+            datacube (`.DataCube`):
+                The sliced datacube, with its matching ``ivar``, ``mask``, and
+                ``wavelength``.
+
+        Example:
+            >>> cube = Cube('8485-1901', mode='remote')
+            >>> halpha = cube.get_subcube('flux', wave=(6500, 6650))
+            >>> halpha.shape
+            (52, 34, 34)
+
+        """
+
+        assert name in self.datamodel.datacubes.list_names(), \
+            '{0} is not a valid datacube for this release.'.format(name)
+
+        model = self.datamodel.datacubes[name]
+        wavelength = np.asarray(self._wavelength)
+
+        if wave is not None:
+            wave_min, wave_max = wave
+            wave_slice = slice(int(np.searchsorted(wavelength, wave_min, side='left')),
+                               int(np.searchsorted(wavelength, wave_max, side='right')))
+            if wave_slice.start >= wave_slice.stop:
+                raise MarvinError('wavelength range {0} does not overlap with the cube'.format(wave))
+        else:
+            wave_slice = slice(None)
+
+        slices = (wave_slice, slice(*y) if y is not None else slice(None),
+                  slice(*x) if x is not None else slice(None))
+
+        subcube_data = self._get_subcube_extension_data(name, slices)
+
+        if subcube_data is None:
+            raise MarvinError('cannot find data for this extension. '
+                              'Maybe it is not loaded into the DB.')
+
+        datacube = DataCube(subcube_data,
+                            wavelength[wave_slice],
+                            ivar=self._get_subcube_extension_data(name, slices, 'ivar'),
+                            mask=self._get_subcube_extension_data(name, slices, 'mask'),
+                            unit=model.unit, pixmask_flag=model.pixmask_flag)
+
+        return datacube
+
     def _get_spaxel_quantities(self, x, y, spaxel=None):
         """Returns a dictionary of spaxel quantities."""
 
@@ -529,6 +609,55 @@ class Cube(MarvinToolsClass, NSAMixIn, GetApertureMixIn):
 
         return cube_quantities
 
+    def _get_spaxel_block_quantities(self, x, y):
+        """Returns a dictionary of `.SpaxelBlockQuantity` for a list of spaxels.
+
+        Each datacube extension is read once and indexed for all the ``x, y``
+        coordinates at the same time, producing ``(N, nwave)`` arrays. Spectra
+        that do not depend on the spaxel are stored as 1D arrays.
+
+        """
+
+        cube_quantities = FuzzyDict({})
+
+        for dm in self.datamodel.datacubes:
+
+            value = self._get_extension_data(dm.name)
+
+            if value is None:
+                warnings.warn('cannot find {!r} data for {!r}. '
+                              'Maybe the data is not in the DB.'.format(
+                                  dm.name, self.plateifu), MarvinUserWarning)
+                cube_quantities[dm.name] = None
+                continue
+
+            block = {'value': value,
+                     'ivar': self._get_extension_data(dm.name, 'ivar'),
+                     'mask': self._get_extension_data(dm.name, 'mask')}
+
+            for key in block:
+                if block[key] is not None:
+                    block[key] = np.ascontiguousarray(np.asarray(block[key])[:, y, x].T)
+
+            cube_quantities[dm.name] = marvin.tools.spaxel.SpaxelBlockQuantity(
+                value=block['value'], ivar=block['ivar'], mask=block['mask'], std=None)
+
+        for dm in self.datamodel.spectra:
+
+            value = self._get_extension_data(dm.name)
+
+            if value is None:
+                cube_quantities[dm.name] = None
+                continue
+
+            std = self._get_extension_data(dm.name, 'std')
+
+            cube_quantities[dm.name] = marvin.tools.spaxel.SpaxelBlockQuantity(
+                value=np.asarray(value), ivar=None, mask=None,
+                std=np.asarray(std) if std is not None else None)
+
+        return cube_quantities
+
     def getSpaxel(self, x=None, y=None, ra=None, dec=None,
                   maps=False, modelcube=False, **kwargs):
         """Returns the :class:`~marvin.tools.spaxel.Spaxel` matching certain coordinates.
@@ -583,6 +712,50 @@ class Cube(MarvinToolsClass, NSAMixIn, GetApertureMixIn):
                                                       modelcube=modelcube,
                                                       **kwargs)
 
+    def getSpaxels(self, x=None, y=None, ra=None, dec=None,
+                   maps=False, modelcube=False, xyorig=None):
+        """Returns a :class:`~marvin.tools.spaxel.SpaxelBlock` for a list of coordinates.
+
+        Like `.getSpaxel` but the quantities for all the spaxels are extracted
+        at once into ``(N, nwave)`` arrays. `~marvin.tools.spaxel.Spaxel`
+        objects are only created when the block is indexed.
+
+        Parameters:
+            x,y (array):
+                The spaxel coordinates relative to ``xyorig``.
+            ra,dec (array):
+                The celestial coordinates of the spaxels.
+            xyorig ({'center', 'lower'}):
+                The reference point from which ``x`` and ``y`` are measured.
+                Defaults to ``marvin.config.xyorig``.
+            maps (`~marvin.tools.maps.Maps` or bool):
+                If ``True``, the block will include the DAP properties from
+                the default Maps matching this cube. A
+                `~marvin.tools.maps.Maps` object can also be passed.
+            modelcube (`~marvin.tools.modelcube.ModelCube` or bool):
+                As ``maps`` for the `~marvin.tools.modelcube.ModelCube`.
+
+        Returns:
+            block (`~marvin.tools.spaxel.SpaxelBlock`):
+                The block with the spaxels, in the same order as the inputs.
+
+        """
+
+        if maps is True:
+            maps = self.getMaps()
+
+        if modelcube is True:
+            if maps:
+                modelcube = maps.getModelCube()
+            else:
+                modelcube = marvin.tools.modelcube.ModelCube(plateifu=self.plateifu,
+                                                             release=self.release)
+
+        return marvin.utils.general.general.getSpaxels(x=x, y=y, ra=ra, dec=dec,
+                                                       xyorig=xyorig, cube=self,
+                                                       maps=maps or None,
+                                                       modelcube=modelcube or None)
+
     def getRSS(self):
         """Returns the `~marvin.tools.rss.RSS` associated with this Cube."""
 
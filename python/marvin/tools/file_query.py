@@ -0,0 +1,549 @@
+#!/usr/bin/env python
+# encoding: utf-8
+#
+# file_query.py
+#
+# Licensed under a 3-clause BSD license.
+
+
+from __future__ import absolute_import, division, print_function
+
+import fnmatch
+import functools
+import re
+from operator import eq, ge, gt, le, lt, ne
+
+import numpy as np
+import six
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+import marvin
+from marvin.core.exceptions import MarvinError
+from marvin.utils.datamodel.dap import datamodel as dap_datamodel
+from marvin.utils.datamodel.query import datamodel as query_datamodel
+from marvin.utils.general import get_dapall_table, get_drpall_table
+
+
+__ALL__ = ['FileQuery', 'parse_filter']
+
+
+opdict = {'<=': le, '>=': ge, '>': gt, '<': lt, '!=': ne, '=': eq, '==': eq}
+
+_tokens = re.compile(r'''\s*(?:(?P<op><=|>=|!=|==|=|<|>)|(?P<paren>[()])|'''
+                     r'''(?P<string>'[^']*'|"[^"]*")|(?P<word>[^\s()<>=!'"]+))''')
+
+# drpall columns for parameters that do not follow the table rules in _find_column
+_drpall_columns = {'cube.ra': ['objra'],
+                   'cube.dec': ['objdec'],
+                   'ifu.name': ['ifudsgn'],
+                   'nsa.z': ['nsa_z', 'nsa_redshift']}
+
+# NSA parameters computed from the drpall columns
+_nsa_derived = {'elpetro_logmass': lambda cols: np.log10(cols('nsa_elpetro_mass')),
+                'sersic_logmass': lambda cols: np.log10(cols('nsa_sersic_mass')),
+                'elpetro_absmag_g_r': lambda cols: (cols('nsa_elpetro_absmag')[:, 3] -
+                                                    cols('nsa_elpetro_absmag')[:, 4]),
+                'sersic_absmag_g_r': lambda cols: (cols('nsa_sersic_absmag')[:, 3] -
+                                                   cols('nsa_sersic_absmag')[:, 4])}
+
+dapTable = {}
+
+
+def _tokenize(search_filter):
+    """Splits a search filter into (kind, value) tokens."""
+
+    tokens = []
+    pos = 0
+    search_filter = search_filter.strip()
+
+    while pos < len(search_filter):
+        match = _tokens.match(search_filter, pos)
+        if not match or match.end() == pos:
+            raise MarvinError('Your boolean expression contained a syntax error '
+                              'at {0!r}'.format(search_filter[pos:]))
+        kind = match.lastgroup
+        tokens.append((kind, match.group(kind)))
+        pos = match.end()
+
+    return tokens
+
+
+class _Parser(object):
+    """A recursive descent parser for the search filter syntax.
+
+    The grammar is::
+
+        expr      := and_expr ('or' and_expr)*
+        and_expr  := not_expr ('and' not_expr)*
+        not_expr  := 'not' not_expr | '(' expr ')' | condition
+        condition := name operator value | name 'between' value 'and' value
+
+    """
+
+    def __init__(self, search_filter):
+        self.tokens = _tokenize(search_filter)
+        self.pos = 0
+
+    def _peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else (None, None)
+
+    def _next(self):
+        token = self._peek()
+        if token[0] is None:
+            raise MarvinError('Your boolean expression ended unexpectedly')
+        self.pos += 1
+        return token
+
+    def _is_keyword(self, keyword):
+        kind, value = self._peek()
+        return kind == 'word' and value.lower() == keyword
+
+    def parse(self):
+        node = self._expr()
+        if self.pos != len(self.tokens):
+            raise MarvinError('Your boolean expression contained a syntax error '
+                              'at {0!r}'.format(self.tokens[self.pos][1]))
+        return node
+
+    def _expr(self):
+        nodes = [self._and_expr()]
+        while self._is_keyword('or'):
+            self._next()
+            nodes.append(self._and_expr())
+        return nodes[0] if len(nodes) == 1 else ('or', nodes)
+
+    def _and_expr(self):
+        nodes = [self._not_expr()]
+        while self._is_keyword('and'):
+            self._next()
+            nodes.append(self._not_expr())
+        return nodes[0] if len(nodes) == 1 else ('and', nodes)
+
+    def _not_expr(self):
+        if self._is_keyword('not'):
+            self._next()
+            return ('not', self._not_expr())
+
+        if self._peek() == ('paren', '('):
+            self._next()
+            node = self._expr()
+            if self._next() != ('paren', ')'):
+                raise MarvinError('Your boolean expression has unbalanced parentheses')
+            return node
+
+        return self._condition()
+
+    def _value(self):
+        kind, value = self._next()
+        if kind == 'string':
+            return value[1:-1]
+        elif kind == 'word':
+            return value
+        raise MarvinError('Expected a value in your boolean expression, got {0!r}'.format(value))
+
+    def _condition(self):
+        kind, name = self._next()
+        if kind != 'word':
+            raise MarvinError('Expected a parameter name in your boolean expression, '
+                              'got {0!r}'.format(name))
+
+        if self._is_keyword('between'):
+            self._next()
+            low = self._value()
+            if not self._is_keyword('and'):
+                raise MarvinError('between must be followed by "value and value"')
+            self._next()
+            high = self._value()
+            return ('and', [('cond', name, '>=', low), ('cond', name, '<=', high)])
+
+        kind, op = self._next()
+        if kind != 'op':
+            raise MarvinError('Expected an operator after {0!r} in your boolean '
+                              'expression'.format(name))
+
+        return ('cond', name, op, self._value())
+
+
+def parse_filter(search_filter):
+    """Parses a search filter into a tree of conditions.
+
+    Accepts the same natural language syntax as `~marvin.tools.query.Query`,
+    e.g. ``'nsa.z < 0.1 and (ifu.name = 19* or not nsa.elpetro_ba >= 0.5)'``.
+
+    Parameters:
+        search_filter (str):
+            The search filter.
+
+    Returns:
+        A tree of tuples. Leaves are ``('cond', name, operator, value)``,
+        and nodes are ``('and', [nodes])``, ``('or', [nodes])``, or
+        ``('not', node)``.
+
+    """
+
+    if not isinstance(search_filter, six.string_types):
+        raise MarvinError('Input parameters must be a natural language string!')
+
+    return _Parser(search_filter).parse()
+
+
+def _filter_names(node):
+    """Returns the parameter names used in a parsed filter."""
+
+    if node[0] == 'cond':
+        return [node[1]]
+    elif node[0] == 'not':
+        return _filter_names(node[1])
+
+    return [name for child in node[1] for name in _filter_names(child)]
+
+
+def _as_text(array):
+    """Converts a byte string array to stripped unicode."""
+
+    if array.dtype.kind == 'S':
+        array = np.char.decode(array, 'utf-8')
+    if array.dtype.kind == 'U':
+        array = np.char.strip(array)
+
+    return array
+
+
+class _LazyColumns(Mapping):
+    """A mapping of column names to arrays that are only computed when accessed."""
+
+    def __init__(self, getters):
+        self._getters = getters
+        self._values = {}
+
+    def __getitem__(self, name):
+        if name not in self._values:
+            self._values[name] = self._getters[name]()
+        return self._values[name]
+
+    def __iter__(self):
+        return iter(self._getters)
+
+    def __len__(self):
+        return len(self._getters)
+
+
+def _get_dapall_columns(drpver, dapver):
+    """Returns a lazy mapping of the DAPall columns, with the DB naming.
+
+    Multichannel columns are split into one column per channel, named as in
+    `~marvin.utils.general.general.map_dapall`. The columns are only read
+    from the DAPall file when accessed.
+
+    """
+
+    if (drpver, dapver) in dapTable:
+        return dapTable[(drpver, dapver)]
+
+    dapall = get_dapall_table(drpver, dapver)
+    header = dapall.hdulist[0].header
+
+    channels = {'emline_s': [], 'emline_g': [], 'specindex': []}
+    for key, val in header.items():
+        val = str(val).lower().replace('-', '_').replace('.', '_')
+        if 'ELS' in key:
+            channels['emline_s'].append(val)
+        elif 'ELG' in key:
+            channels['emline_g'].append(val)
+        elif re.search('SPI([0-9])', key):
+            channels['specindex'].append(val)
+
+    def get_column(col, channel=None):
+        values = _as_text(np.asarray(dapall[col]))
+        return values if channel is None else values[:, channel]
+
+    # The shape of each column is read from the header, without loading the data.
+    dtype = dapall.hdulist[-1].columns.dtype
+
+    getters = {}
+    for col in dapall.colnames:
+        name = col.lower()
+        shape = dtype[col].shape
+        if len(shape) == 0:
+            getters[name] = functools.partial(get_column, col)
+            continue
+
+        prefix = [pre for pre in channels if pre in name]
+        for ii in range(shape[0]):
+            channame = channels[prefix[0]][ii] if prefix else ii + 1
+            getters['{0}_{1}'.format(name, channame)] = functools.partial(get_column, col, ii)
+
+    columns = _LazyColumns(getters)
+    dapTable[(drpver, dapver)] = columns
+
+    return columns
+
+
+class FileQuery(object):
+    """A query evaluated on the DRPall and DAPall summary files.
+
+    Evaluates the search filter of a `~marvin.tools.query.Query` with
+    vectorised numpy operations over the columns of the DRPall file (and of
+    the DAPall file, for ``dapall.`` parameters), so that galaxy-level queries
+    can be run without a database or a call to the API.
+
+    Query parameters are mapped to the DRPall columns with the same name
+    (``cube.plate`` to ``plate``) or, for the NSA catalogue, prefixed with
+    ``nsa_`` (``nsa.elpetro_ba`` to ``nsa_elpetro_ba``).  ``dapall.``
+    parameters are read from the DAPall rows of the default bintype and
+    template of the release, and only galaxies with a DAPall row are returned
+    when they are used.  Spaxel-level parameters cannot be queried.
+
+    The object follows the subset of the SQLAlchemy Query interface used by
+    `~marvin.tools.results.Results` (``count``, ``slice``, ``all``, and
+    ``from_self``), so that paging through the results works as for a
+    database query.
+
+    Parameters:
+        search_filter (str):
+            The search filter.
+        params (list):
+            The names of the parameters to return, in addition to the
+            parameters in the filter.
+        release (str):
+            The release of the files to query.  Defaults to the current release.
+        sort (str):
+            The parameter to sort the results on.
+        order ({'asc', 'desc'}):
+            The sort order.
+
+    """
+
+    def __init__(self, search_filter=None, params=None, release=None, sort=None, order='asc'):
+
+        self.release = release or marvin.config.release
+        self._drpver, self._dapver = marvin.config.lookUpVersions(release=self.release)
+        self.datamodel = query_datamodel[self.release]
+        self.search_filter = search_filter
+        self.sort = sort
+        self.order = order
+
+        self._parsed = parse_filter(search_filter) if search_filter else None
+        self._cache = {}
+        self._start = None
+        self._end = None
+
+        # resolve all the parameter names and check they can be queried
+        names = list(params or []) + (_filter_names(self._parsed) if self._parsed else [])
+        self.params = []
+        for name in names:
+            full = self.resolve(name)
+            if full not in self.params:
+                self.params.append(full)
+
+        self._sort_param = self.resolve(sort) if sort else None
+        self._use_dapall = any(param.startswith('dapall.') or
+                               param in ['bintype.name', 'template.name']
+                               for param in self.params + [self._sort_param or ''])
+
+        for param in self.params + ([self._sort_param] if self._sort_param else []):
+            self.get_column(param)
+
+    def __repr__(self):
+        return '<FileQuery release={0!r}, filter={1!r}>'.format(self.release, self.search_filter)
+
+    def __str__(self):
+        files = 'drpall-{0}'.format(self._drpver)
+        if self._use_dapall:
+            files += ', dapall-{0}-{1}'.format(self._drpver, self._dapver)
+        where = ' WHERE {0}'.format(self.search_filter) if self.search_filter else ''
+        order = ' ORDER BY {0} {1}'.format(self._sort_param, self.order) if self._sort_param else ''
+        return 'SELECT {0} FROM {1}{2}{3}'.format(', '.join(self.params), files, where, order)
+
+    def resolve(self, name):
+        """Returns the full name (``table.column``) of a query parameter."""
+
+        parameters = self.datamodel.parameters
+        if name in parameters._full:
+            return name
+
+        for names in [parameters._short, parameters._remote]:
+            if name in names:
+                return parameters._full[names.index(name)]
+
+        if '.' in name:
+            return name
+
+        raise MarvinError('Could not find a match for query parameter {0}'.format(name))
+
+    def _drpall(self):
+        """Returns the DRPall table and the row index of each galaxy."""
+
+        if 'drpall' not in self._cache:
+            drpall = get_drpall_table(drpver=self._drpver, lazy=True)
+            self._cache['drpall'] = _LazyColumns(
+                {name.lower(): functools.partial(drpall.__getitem__, name)
+                 for name in drpall.colnames})
+
+            rows = np.arange(len(drpall))
+            if self._use_dapall:
+                # inner join with the DAPall rows of the default bintype and template
+                dapall = self._dapall()
+                plateifu = _as_text(np.asarray(drpall['plateifu']))
+                rows = rows[np.in1d(plateifu, dapall['plateifu'])]
+                order = np.argsort(dapall['plateifu'])
+                position = np.searchsorted(dapall['plateifu'], plateifu[rows], sorter=order)
+                self._cache['dapall_rows'] = order[position]
+            self._cache['drpall_rows'] = rows
+
+        return self._cache['drpall']
+
+    def _dapall(self):
+        """Returns the DAPall columns for the default bintype and template."""
+
+        if 'dapall' not in self._cache:
+            if self._dapver is None or self.release in ['MPL-4', 'MPL-5']:
+                raise MarvinError('there is no DAPall file for release {0}'.format(self.release))
+
+            dapdm = dap_datamodel[self.release]
+            self._daptype = '{0}-{1}'.format(dapdm.default_bintype.name,
+                                             dapdm.default_template.name)
+            columns = _get_dapall_columns(self._drpver, self._dapver)
+            selected = columns['daptype'] == self._daptype
+            self._cache['dapall'] = _LazyColumns(
+                {name: functools.partial(lambda name: columns[name][selected], name)
+                 for name in columns})
+
+        return self._cache['dapall']
+
+    def _find_column(self, full):
+        """Finds the values of a parameter for all the galaxies."""
+
+        drpall = self._drpall()
+        rows = self._cache['drpall_rows']
+        table, __, name = full.rpartition('.')
+
+        def drpall_column(colname):
+            if colname not in drpall:
+                raise KeyError(colname)
+            return np.asarray(drpall[colname])[rows]
+
+        candidates = _drpall_columns.get(full, [])
+        if table in ['cube', 'ifu']:
+            candidates = candidates + [name]
+        elif table == 'nsa':
+            candidates = candidates + ['nsa_{0}'.format(name)]
+
+        for colname in candidates:
+            if colname in drpall:
+                return _as_text(drpall_column(colname))
+
+        if table == 'nsa' and name in _nsa_derived:
+            try:
+                return _nsa_derived[name](drpall_column)
+            except KeyError:
+                pass
+        elif table == 'dapall':
+            dapall = self._dapall()
+            if name in dapall:
+                return dapall[name][self._cache['dapall_rows']]
+        elif full in ['bintype.name', 'template.name']:
+            self._dapall()
+            bintype, template = self._daptype.split('-', 1)
+            return np.full(len(rows), bintype if table == 'bintype' else template)
+
+        raise MarvinError('query parameter {0} cannot be queried from the DRPall '
+                          'or DAPall files'.format(full))
+
+    def get_column(self, name):
+        """Returns the values of a parameter for all the galaxies in the files."""
+
+        full = self.resolve(name)
+        if full not in self._cache:
+            self._cache[full] = self._find_column(full)
+
+        return self._cache[full]
+
+    def _evaluate(self, node):
+        """Evaluates a parsed filter into a boolean mask."""
+
+        if node[0] == 'and':
+            return np.logical_and.reduce([self._evaluate(child) for child in node[1]])
+        elif node[0] == 'or':
+            return np.logical_or.reduce([self._evaluate(child) for child in node[1]])
+        elif node[0] == 'not':
+            return ~self._evaluate(node[1])
+
+        __, name, op, value = node
+        column = self.get_column(name)
+
+        if column.dtype.kind in 'US':
+            if '*' in value and op in ['=', '==', '!=']:
+                regex = re.compile(fnmatch.translate(value))
+                mask = np.array([regex.match(item) is not None for item in column], dtype=bool)
+                return ~mask if op == '!=' else mask
+            return opdict[op](column, value)
+
+        try:
+            number = float(value)
+        except ValueError:
+            raise MarvinError('cannot compare {0} with non-numeric value {1!r}'.format(name, value))
+
+        with np.errstate(invalid='ignore'):
+            return opdict[op](column, number)
+
+    def _run(self):
+        """Evaluates the filter and sort, returning the indices of the selected rows."""
+
+        if 'indices' not in self._cache:
+            self._drpall()
+            indices = np.arange(len(self._cache['drpall_rows']))
+            if self._parsed:
+                indices = indices[self._evaluate(self._parsed)]
+
+            if self._sort_param:
+                values = self.get_column(self._sort_param)[indices]
+                order = np.argsort(values, kind='mergesort')
+                indices = indices[order[::-1] if self.order == 'desc' else order]
+
+            self._cache['indices'] = indices
+
+        return self._cache['indices']
+
+    def count(self):
+        """Returns the number of rows selected by the filter."""
+
+        return len(self._run())
+
+    def slice(self, start, end):
+        """Returns a copy of the query restricted to the rows start to end."""
+
+        sliced = FileQuery.__new__(FileQuery)
+        sliced.__dict__.update(self.__dict__)
+        sliced._start, sliced._end = start, end
+
+        return sliced
+
+    def from_self(self):
+        """Returns a copy of the query covering all the rows."""
+
+        return self.slice(None, None)
+
+    def _rows(self, indices):
+        """Returns the rows at ``indices`` as a list of tuples."""
+
+        columns = [self.get_column(param)[indices].tolist() for param in self.params]
+
+        return list(zip(*columns))
+
+    def all(self):
+        """Returns the selected rows as a list of tuples, in the order of ``params``."""
+
+        return self._rows(self._run()[self._start:self._end])
+
+    def iter_rows(self, chunk=1000):
+        """Iterates over the selected rows, creating ``chunk`` rows at a time."""
+
+        indices = self._run()[self._start:self._end]
+        for start in range(0, len(indices), chunk):
+            for row in self._rows(indices[start:start + chunk]):
+                yield row
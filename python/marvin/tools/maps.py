@@ -12,7 +12,9 @@
 
 from __future__ import absolute_import, division, print_function
 
+import collections
 import copy
+import functools
 import inspect
 import warnings
 
@@ -32,9 +34,10 @@ import marvin.tools.quantities.map
 import marvin.tools.spaxel
 import marvin.utils.dap.bpt
 import marvin.utils.general.general
+from marvin.core.memory_cache import ToolCache
 from marvin.utils.datamodel.dap import datamodel
 from marvin.utils.datamodel.dap.base import Channel, Property
-from marvin.utils.general import FuzzyDict, turn_off_ion, check_versions
+from marvin.utils.general import FuzzyDict, LazyFuzzyDict, turn_off_ion, check_versions
 
 from .core import MarvinToolsClass
 from .mixins import DAPallMixIn, GetApertureMixIn, NSAMixIn
@@ -104,6 +107,11 @@ class Maps(MarvinToolsClass, NSAMixIn, DAPallMixIn, GetApertureMixIn):
         self.header = None
         self.wcs = None
         self._shape = None
+        self._extensions = None
+
+        # Stores the maps and spaxel index already retrieved, so that they
+        # don't need to be retrieved again.
+        self._map_data = ToolCache()
 
         if self.data_origin == 'file':
             self._load_maps_from_file(data=self.data)
@@ -241,7 +249,7 @@ class Maps(MarvinToolsClass, NSAMixIn, DAPallMixIn, GetApertureMixIn):
         if data is not None:
             assert isinstance(data, astropy.io.fits.HDUList), 'data is not a HDUList.'
         else:
-            self.data = astropy.io.fits.open(self.filename)
+            self._open_file(astropy.io.fits.open)
 
         self.header = self.data[0].header
 
@@ -369,19 +377,24 @@ class Maps(MarvinToolsClass, NSAMixIn, DAPallMixIn, GetApertureMixIn):
     def _load_maps_from_api(self):
         """Loads a Maps object from remote."""
 
-        url = marvin.config.urlmap['api']['getMaps']['url']
+        data = self._get_from_remote_cache('maps')
 
-        url_full = url.format(name=self.plateifu,
-                              bintype=self.bintype.name,
-                              template=self.template.name)
+        if data is None:
 
-        try:
-            response = self._toolInteraction(url_full)
-        except Exception as ee:
-            raise marvin.core.exceptions.MarvinError(
-                'found a problem when checking if remote maps exists: {0}'.format(str(ee)))
+            url = marvin.config.urlmap['api']['getMaps']['url']
+
+            url_full = url.format(name=self.plateifu,
+                                  bintype=self.bintype.name,
+                                  template=self.template.name)
+
+            try:
+                response = self._toolInteraction(url_full)
+            except Exception as ee:
+                raise marvin.core.exceptions.MarvinError(
+                    'found a problem when checking if remote maps exists: {0}'.format(str(ee)))
 
-        data = response.getData()
+            data = response.getData()
+            self._set_in_remote_cache(data, 'maps')
 
         if self.plateifu not in data['plateifu']:
             raise marvin.core.exceptions.MarvinError('remote maps has a different plateifu!')
@@ -398,16 +411,93 @@ class Maps(MarvinToolsClass, NSAMixIn, DAPallMixIn, GetApertureMixIn):
 
         return
 
+    def _get_spaxel_index(self):
+        """Returns the spaxel-major index of the properties of this Maps.
+
+        The index is built from the MAPS file or from the extensions
+        loaded with `.to_cube`. It is a dictionary with the ``value``,
+        ``ivar``, and ``mask`` arrays of shape ``(ny, nx, nprop)``, so that
+        the quantities of a spaxel are a single slice, and ``columns``, the
+        mapping of the full name of each property to its column. Properties
+        without ivar or mask are filled with ``NaN`` and ``0``, respectively.
+        The index is kept in the memory cache and rebuilt if it is evicted.
+
+        """
+
+        try:
+            return self._map_data['_spaxel_index']
+        except KeyError:
+            pass
+
+        if self._extensions is not None:
+            extensions = self._extensions
+        else:
+            extensions = {name: self.data[name].data for name in self._get_extension_names()}
+
+        columns = collections.OrderedDict((dm.full(), column)
+                                          for column, dm in enumerate(self.datamodel))
+        shape = tuple(self._shape) + (len(columns), )
+
+        index = {'columns': columns,
+                 'value': np.zeros(shape, dtype=np.float64),
+                 'ivar': np.full(shape, np.nan, dtype=np.float64),
+                 'mask': np.zeros(shape, dtype=np.int64)}
+
+        for column, dm in enumerate(self.datamodel):
+
+            for key in ['value', 'ivar', 'mask']:
+
+                if key == 'ivar' and not dm.has_ivar():
+                    continue
+                if key == 'mask' and not dm.has_mask():
+                    continue
+
+                extname = dm.name if key == 'value' else dm.name + '_' + key
+
+                if dm.channel:
+                    index[key][:, :, column] = extensions[extname][dm.channel.idx]
+                else:
+                    index[key][:, :, column] = extensions[extname]
+
+        self._map_data['_spaxel_index'] = index
+
+        return index
+
     def _get_spaxel_quantities(self, x, y, spaxel=None):
-        """Returns a dictionary of spaxel quantities."""
+        """Returns a dictionary of spaxel quantities.
+
+        For files, or if the extensions have been loaded with `.to_cube`, the
+        quantities are sliced from the spaxel index (see `._get_spaxel_index`)
+        and each `.AnalysisProperty` is only created when it is accessed.
+
+        """
 
         maps_quantities = FuzzyDict({})
 
-        if self.data_origin == 'file' or self.data_origin == 'db':
+        if self.data_origin == 'file' or self._extensions is not None:
+
+            index = self._get_spaxel_index()
+
+            value = index['value'][y, x]
+            ivar = index['ivar'][y, x]
+            mask = index['mask'][y, x]
+
+            maps_quantities = LazyFuzzyDict({})
+
+            for dm in self.datamodel:
+                column = index['columns'][dm.full()]
+                maps_quantities.set_lazy(dm.full(), functools.partial(
+                    self._make_spaxel_quantity, dm, value[column],
+                    ivar[column] if dm.has_ivar() else None,
+                    mask[column] if dm.has_mask() else None, spaxel))
+
+        elif self.data_origin == 'db':
 
             # Stores a dictionary of (table, row)
             _db_rows = {}
 
+            mdb = marvin.marvindb
+
             for dm in self.datamodel:
 
                 data = {'value': None, 'ivar': None, 'mask': None}
@@ -419,37 +509,19 @@ class Maps(MarvinToolsClass, NSAMixIn, DAPallMixIn, GetApertureMixIn):
                     if key == 'mask' and not dm.has_mask():
                         continue
 
-                    if self.data_origin == 'file':
-
-                        extname = dm.name + '' if key == 'value' else dm.name + '_' + key
-
-                        if dm.channel:
-                            data[key] = self.data[extname].data[dm.channel.idx, y, x]
-                        else:
-                            data[key] = self.data[extname].data[y, x]
+                    table = getattr(mdb.dapdb, dm.model)
 
-                    elif self.data_origin == 'db':
+                    if table not in _db_rows:
+                        _db_rows[table] = mdb.session.query(table).filter(
+                            table.file_pk == self.data.pk, table.x == x, table.y == y).one()
 
-                        mdb = marvin.marvindb
+                    colname = dm.db_column(ext=None if key == 'value' else key)
+                    data[key] = getattr(_db_rows[table], colname)
 
-                        table = getattr(mdb.dapdb, dm.model)
+                maps_quantities[dm.full()] = self._make_spaxel_quantity(
+                    dm, data['value'], data['ivar'], data['mask'], spaxel)
 
-                        if table not in _db_rows:
-                            _db_rows[table] = mdb.session.query(table).filter(
-                                table.file_pk == self.data.pk, table.x == x, table.y == y).one()
-
-                        colname = dm.db_column(ext=None if key == 'value' else key)
-                        data[key] = getattr(_db_rows[table], colname)
-
-                quantity = AnalysisProperty(data['value'], unit=dm.unit, ivar=data['ivar'],
-                                            mask=data['mask'], pixmask_flag=dm.pixmask_flag)
-
-                if spaxel:
-                    quantity._init_bin(spaxel=spaxel, parent=self, datamodel=dm)
-
-                maps_quantities[dm.full()] = quantity
-
-        if self.data_origin == 'api':
+        elif self.data_origin == 'api':
 
             params = {'release': self._release}
             url = marvin.config.urlmap['api']['getMapsQuantitiesSpaxel']['url']
@@ -468,18 +540,63 @@ class Maps(MarvinToolsClass, NSAMixIn, DAPallMixIn, GetApertureMixIn):
 
             for dm in self.datamodel:
 
-                quantity = AnalysisProperty(data[dm.full()]['value'],
-                                            ivar=data[dm.full()]['ivar'],
-                                            mask=data[dm.full()]['mask'],
-                                            unit=dm.unit,
-                                            pixmask_flag=dm.pixmask_flag)
+                maps_quantities[dm.full()] = self._make_spaxel_quantity(
+                    dm, data[dm.full()]['value'], data[dm.full()]['ivar'],
+                    data[dm.full()]['mask'], spaxel)
 
-                if spaxel:
-                    quantity._init_bin(spaxel=spaxel, parent=self, datamodel=dm)
+        return maps_quantities
 
-                maps_quantities[dm.full()] = quantity
+    def _make_spaxel_quantity(self, dm, value, ivar, mask, spaxel=None):
+        """Creates the `.AnalysisProperty` for a property of a spaxel."""
 
-        return maps_quantities
+        quantity = AnalysisProperty(value, unit=dm.unit, ivar=ivar, mask=mask,
+                                    pixmask_flag=dm.pixmask_flag)
+
+        if spaxel:
+            quantity._init_bin(spaxel=spaxel, parent=self, datamodel=dm)
+
+        return quantity
+
+    def _get_spaxel_block_quantities(self, x, y):
+        """Returns the property columns and a `.SpaxelBlockQuantity` for a list of spaxels.
+
+        The returned value, ivar, and mask arrays have shape ``(N, nprop)``,
+        with columns in the same order as the datamodel. For files, or if
+        the extensions have been loaded with `.to_cube`, the arrays are
+        indexed from the spaxel index (see `._get_spaxel_index`). Properties
+        without ivar or mask are filled with ``NaN`` and ``0``, respectively.
+
+        """
+
+        columns = [dm.full() for dm in self.datamodel]
+        shape = (len(x), len(columns))
+
+        if self.data_origin == 'file' or self._extensions is not None:
+
+            index = self._get_spaxel_index()
+
+            value = index['value'][y, x]
+            ivar = index['ivar'][y, x]
+            mask = index['mask'][y, x]
+
+        else:
+
+            value = np.zeros(shape, dtype=np.float64)
+            ivar = np.full(shape, np.nan, dtype=np.float64)
+            mask = np.zeros(shape, dtype=np.int64)
+
+            map_list = marvin.tools.quantities.map.Map.bulk_from_maps(self, list(self.datamodel))
+
+            for column, map_dm in enumerate(map_list):
+
+                value[:, column] = map_dm.value[y, x]
+                if map_dm.ivar is not None:
+                    ivar[:, column] = map_dm.ivar[y, x]
+                if map_dm.mask is not None:
+                    mask[:, column] = map_dm.mask[y, x]
+
+        return columns, marvin.tools.spaxel.SpaxelBlockQuantity(value=value, ivar=ivar,
+                                                                mask=mask, std=None)
 
     def get_binid(self, property=None):
         """Returns the binid map associated with a property.
@@ -583,6 +700,46 @@ class Maps(MarvinToolsClass, NSAMixIn, DAPallMixIn, GetApertureMixIn):
             x=x, y=y, ra=ra, dec=dec,
             cube=cube, maps=self, modelcube=modelcube, **kwargs)
 
+    def getSpaxels(self, x=None, y=None, ra=None, dec=None,
+                   cube=False, modelcube=False, xyorig=None):
+        """Returns a :class:`~marvin.tools.spaxel.SpaxelBlock` for a list of coordinates.
+
+        Like `.getSpaxel` but the properties for all the spaxels are extracted
+        at once into ``(N, nprop)`` arrays. `~marvin.tools.spaxel.Spaxel`
+        objects are only created when the block is indexed.
+
+        Parameters:
+            x,y (array):
+                The spaxel coordinates relative to ``xyorig``.
+            ra,dec (array):
+                The celestial coordinates of the spaxels.
+            xyorig ({'center', 'lower'}):
+                The reference point from which ``x`` and ``y`` are measured.
+                Defaults to ``marvin.config.xyorig``.
+            cube (`~marvin.tools.cube.Cube` or bool):
+                If ``True``, the block will include the DRP quantities from
+                the cube matching this Maps. A `~marvin.tools.cube.Cube`
+                object can also be passed.
+            modelcube (`~marvin.tools.modelcube.ModelCube` or bool):
+                As ``cube`` for the `~marvin.tools.modelcube.ModelCube`.
+
+        Returns:
+            block (`~marvin.tools.spaxel.SpaxelBlock`):
+                The block with the spaxels, in the same order as the inputs.
+
+        """
+
+        if cube is True:
+            cube = self.getCube()
+
+        if modelcube is True:
+            modelcube = self.getModelCube()
+
+        return marvin.utils.general.general.getSpaxels(x=x, y=y, ra=ra, dec=dec,
+                                                       xyorig=xyorig, maps=self,
+                                                       cube=cube or None,
+                                                       modelcube=modelcube or None)
+
     def _match_properties(self, property_name, channel=None, exact=False):
         """Returns the best match for a property_name+channel."""
 
@@ -633,6 +790,197 @@ class Maps(MarvinToolsClass, NSAMixIn, DAPallMixIn, GetApertureMixIn):
 
         return marvin.tools.quantities.Map.from_maps(self, best)
 
+    def getMaps(self, properties=None, exact=False):
+        """Retrieves a list of :class:`~marvin.tools.quantities.Map` objects.
+
+        Faster than calling `.getMap` for each property. The binid maps are
+        retrieved only once and, for DB maps, all the properties are read
+        with a single query per table.
+
+        Parameters:
+            properties (list or None):
+                A list of property names (e.g., ``'emline_gflux_ha_6564'``)
+                or `~marvin.utils.datamodel.dap.Property` objects. If
+                ``None``, returns all the maps in the datamodel.
+            exact (bool):
+                As in `.getMap`, whether to check that the name of each
+                returned map matches its input value exactly.
+
+        Returns:
+            maps (list):
+                The list of `~marvin.tools.quantities.Map`, in the same
+                order as ``properties``.
+
+        Example:
+            >>> ha, hb = maps.getMaps(['emline_gflux_ha_6564', 'emline_gflux_hb_4862'])
+
+        """
+
+        if properties is None:
+            properties = list(self.datamodel)
+
+        props = [prop if isinstance(prop, Property) else
+                 self._match_properties(prop, exact=exact) for prop in properties]
+
+        for prop in props:
+            if prop.full() == 'stellar_sigmacorr' and self.release == 'MPL-6':
+                raise marvin.core.exceptions.MarvinError('stellar_sigmacorr is unreliable in '
+                                                         'MPL-6. Please use MPL-7.')
+
+        return marvin.tools.quantities.Map.bulk_from_maps(self, props)
+
+    def to_cube(self):
+        """Loads all the extensions of this Maps and returns them as arrays.
+
+        Each multi-channel extension (and its ivar and mask) is read only
+        once, as a 3D array with the channels in the first axis. In remote
+        mode, all the extensions are retrieved with a single request. Once
+        loaded, `.getMap`, `.getMaps`, and `.load_all` create the maps as
+        views of these arrays, without reading or copying any more data.
+
+        Returns:
+            extensions (OrderedDict):
+                A dictionary of arrays keyed by the lowercase name of the
+                extension (e.g., ``'emline_gflux'``, ``'emline_gflux_ivar'``).
+
+        """
+
+        if self._extensions is not None:
+            return self._extensions
+
+        if self.data_origin == 'file':
+            extensions = self._get_extensions_from_file()
+        elif self.data_origin == 'db':
+            extensions = self._get_extensions_from_db()
+        elif self.data_origin == 'api':
+            extensions = self._get_extensions_from_api()
+
+        self._extensions = extensions
+
+        return self._extensions
+
+    def _get_extension_names(self):
+        """Returns the names of the extensions needed by the datamodel."""
+
+        names = []
+        for prop in self.datamodel:
+            names.append(prop.name)
+            if prop.ivar:
+                names.append(prop.name + '_ivar')
+            if prop.mask:
+                names.append(prop.name + '_mask')
+
+        return list(collections.OrderedDict.fromkeys(names))
+
+    def _get_extensions_from_file(self):
+        """Reads all the extensions from the MAPS file."""
+
+        return collections.OrderedDict((name, self.data[name].data)
+                                       for name in self._get_extension_names())
+
+    def _get_extensions_from_db(self):
+        """Retrieves all the properties from the DB and stacks them by extension."""
+
+        props = list(self.datamodel)
+        arrays = marvin.tools.quantities.map.Map._get_maps_from_db(self, props)
+
+        extensions = collections.OrderedDict()
+
+        for name in self._get_extension_names():
+
+            if name.endswith('_ivar') or name.endswith('_mask'):
+                prop_name, key = name[:-5], 2 if name.endswith('_mask') else 1
+            else:
+                prop_name, key = name, 0
+
+            channels = [prop for prop in props if prop.name == prop_name]
+
+            if channels[0].channel is None:
+                extensions[name] = arrays[channels[0].full()][key]
+                continue
+
+            first = arrays[channels[0].full()][key]
+            nchannels = max(prop.channel.idx for prop in channels) + 1
+            extensions[name] = np.zeros((nchannels, ) + first.shape, dtype=first.dtype)
+            for prop in channels:
+                extensions[name][prop.channel.idx] = arrays[prop.full()][key]
+
+        return extensions
+
+    def _get_extensions_from_api(self):
+        """Retrieves all the extensions with a single API call."""
+
+        data = self._get_from_remote_cache('extensions')
+
+        if data is None:
+
+            url = marvin.config.urlmap['api']['getMapsExtensions']['url']
+
+            url_full = url.format(name=self.plateifu,
+                                  bintype=self.bintype.name,
+                                  template=self.template.name)
+
+            try:
+                response = self._toolInteraction(url_full)
+            except Exception as ee:
+                raise marvin.core.exceptions.MarvinError(
+                    'found a problem when getting the maps extensions: {0}'.format(str(ee)))
+
+            data = response.getData()
+
+            if data is None:
+                raise marvin.core.exceptions.MarvinError(
+                    'something went wrong. Error is: {0}'.format(response.results['error']))
+
+            self._set_in_remote_cache(data, 'extensions')
+
+        return collections.OrderedDict((name, np.asarray(data['extensions'][name]))
+                                       for name in self._get_extension_names())
+
+    def load_all(self):
+        """Loads all the maps at once.
+
+        Reads all the extensions with `.to_cube` and returns a `.Map` for
+        each property in the datamodel. The maps are views of the loaded
+        extensions, so they share memory with each other and with the arrays
+        returned by `.to_cube`. Much faster than calling `.getMap` for each
+        property, especially in remote mode, where a single request is made.
+
+        Returns:
+            maps (FuzzyDict):
+                A dictionary of `~marvin.tools.quantities.Map` keyed by the
+                full name of the property (e.g., ``'emline_gflux_ha_6564'``).
+
+        Example:
+            >>> all_maps = maps.load_all()
+            >>> ha = all_maps['emline_gflux_ha_6564']
+
+        """
+
+        self.to_cube()
+
+        props = list(self.datamodel)
+        map_list = marvin.tools.quantities.map.Map.bulk_from_maps(self, props, copy=False)
+
+        return FuzzyDict(collections.OrderedDict((prop.full(), map_)
+                                                 for prop, map_ in zip(props, map_list)))
+
+    def agetMap(self, property_name, channel=None, exact=False):
+        """Retrieves a :class:`~marvin.tools.quantities.Map` asynchronously.
+
+        Accepts the same parameters as `.getMap` and returns an awaitable
+        that retrieves the map in a background thread, so that many maps
+        can be requested concurrently. Requires Python 3.5+.
+
+        Example:
+            >>> ha = await maps.agetMap('emline_gflux', channel='ha_6564')
+
+        """
+
+        from marvin.api.aio import run_in_executor
+
+        return run_in_executor(self.getMap, property_name, channel=channel, exact=exact)
+
     def getMapRatio(self, property_name, channel_1, channel_2):
         """Returns a ratio `~marvin.tools.quantities.Map`.
 
@@ -10,13 +10,12 @@
 # @Last modified time: 2018-11-14 12:03:58
 
 import distutils
-import os
 
-import astropy.io.fits
+import numpy as np
 
 import marvin
 from marvin.core.exceptions import MarvinError
-from marvin.utils.general import get_dapall_file, map_dapall
+from marvin.utils.general import get_dapall_table, map_dapall
 
 
 __all__ = ['DAPallMixIn']
@@ -68,24 +67,18 @@ class DAPallMixIn(object):
 
         daptype = self.bintype.name + '-' + self.template.name
 
-        dapall_path = get_dapall_file(self._drpver, self._dapver)
+        dapall_table = get_dapall_table(self._drpver, self._dapver)
 
-        assert dapall_path is not None, 'cannot build DAPall file.'
+        plateifu = np.char.strip(np.asarray(dapall_table['PLATEIFU']).astype(str))
+        daptypes = np.char.strip(np.asarray(dapall_table['DAPTYPE']).astype(str))
 
-        if not os.path.exists(dapall_path):
-            raise MarvinError('cannot find DAPall file in the system.')
+        rows = np.where((plateifu == self.plateifu) & (daptypes == daptype))[0]
 
-        dapall_hdu = astropy.io.fits.open(dapall_path)
+        assert len(rows) == 1, 'cannot find matching row in DAPall.'
 
-        header = dapall_hdu[0].header
-        dapall_table = dapall_hdu[-1].data
+        header = dapall_table.hdulist[0].header
 
-        dapall_row = dapall_table[(dapall_table['PLATEIFU'] == self.plateifu) &
-                                  (dapall_table['DAPTYPE'] == daptype)]
-
-        assert len(dapall_row) == 1, 'cannot find matching row in DAPall.'
-
-        return map_dapall(header, dapall_row[0])
+        return map_dapall(header, dapall_table.record(rows[0]))
 
     def _get_dapall_from_db(self):
         """Uses the DB to retrieve the DAPAll data."""
@@ -26,9 +26,10 @@ import marvin.tools.maps
 import marvin.tools.spaxel
 import marvin.utils.general.general
 from marvin.core.exceptions import MarvinError
+from marvin.core.memory_cache import ToolCache
 from marvin.tools.quantities import DataCube, Map, Spectrum
 from marvin.utils.datamodel.dap import Model, datamodel
-from marvin.utils.general import FuzzyDict, gunzip, check_versions
+from marvin.utils.general import FuzzyDict, check_versions
 
 from .core import MarvinToolsClass
 from .mixins import DAPallMixIn, GetApertureMixIn, NSAMixIn
@@ -99,12 +100,7 @@ class ModelCube(MarvinToolsClass, NSAMixIn, DAPallMixIn, GetApertureMixIn):
         self._shape = None
 
         # Model extensions
-        self._extension_data = {}
-        self._binned_flux = None
-        self._redcorr = None
-        self._full_fit = None
-        self._emline_fit = None
-        self._stellarcont_fit = None
+        self._extension_data = ToolCache()
 
         if self.data_origin == 'file':
             self._load_modelcube_from_file()
@@ -179,8 +175,7 @@ class ModelCube(MarvinToolsClass, NSAMixIn, DAPallMixIn, GetApertureMixIn):
             assert isinstance(self.data, fits.HDUList), 'data is not an HDUList object'
         else:
             try:
-                with gunzip(self.filename) as gg:
-                    self.data = fits.open(gg.name)
+                self._open_file()
             except IOError as err:
                 raise IOError('filename {0} cannot be found: {1}'.format(self.filename, err))
 
@@ -287,17 +282,22 @@ class ModelCube(MarvinToolsClass, NSAMixIn, DAPallMixIn, GetApertureMixIn):
     def _load_modelcube_from_api(self):
         """Initialises a model cube from the API."""
 
-        url = marvin.config.urlmap['api']['getModelCube']['url']
-        url_full = url.format(name=self.plateifu, bintype=self.bintype.name,
-                              template=self.template.name)
+        data = self._get_from_remote_cache('modelcube')
 
-        try:
-            response = self._toolInteraction(url_full)
-        except Exception as ee:
-            raise MarvinError('found a problem when checking if remote model cube '
-                              'exists: {0}'.format(str(ee)))
+        if data is None:
 
-        data = response.getData()
+            url = marvin.config.urlmap['api']['getModelCube']['url']
+            url_full = url.format(name=self.plateifu, bintype=self.bintype.name,
+                                  template=self.template.name)
+
+            try:
+                response = self._toolInteraction(url_full)
+            except Exception as ee:
+                raise MarvinError('found a problem when checking if remote model cube '
+                                  'exists: {0}'.format(str(ee)))
+
+            data = response.getData()
+            self._set_in_remote_cache(data, 'modelcube')
 
         self.header = fits.Header.fromstring(data['header'])
         self.wcs = WCS(fits.Header.fromstring(data['wcs_header']))
@@ -363,14 +363,56 @@ class ModelCube(MarvinToolsClass, NSAMixIn, DAPallMixIn, GetApertureMixIn):
             x=x, y=y, ra=ra, dec=dec,
             cube=cube, maps=maps, modelcube=self, **kwargs)
 
+    def getSpaxels(self, x=None, y=None, ra=None, dec=None,
+                   cube=False, maps=False, xyorig=None):
+        """Returns a :class:`~marvin.tools.spaxel.SpaxelBlock` for a list of coordinates.
+
+        Like `.getSpaxel` but the models for all the spaxels are extracted
+        at once into ``(N, nwave)`` arrays. `~marvin.tools.spaxel.Spaxel`
+        objects are only created when the block is indexed.
+
+        Parameters:
+            x,y (array):
+                The spaxel coordinates relative to ``xyorig``.
+            ra,dec (array):
+                The celestial coordinates of the spaxels.
+            xyorig ({'center', 'lower'}):
+                The reference point from which ``x`` and ``y`` are measured.
+                Defaults to ``marvin.config.xyorig``.
+            cube (`~marvin.tools.cube.Cube` or bool):
+                If ``True``, the block will include the DRP quantities from
+                the cube matching this ModelCube. A `~marvin.tools.cube.Cube`
+                object can also be passed.
+            maps (`~marvin.tools.maps.Maps` or bool):
+                As ``cube`` for the `~marvin.tools.maps.Maps`.
+
+        Returns:
+            block (`~marvin.tools.spaxel.SpaxelBlock`):
+                The block with the spaxels, in the same order as the inputs.
+
+        """
+
+        if cube is True:
+            cube = self.getCube()
+
+        if maps is True:
+            maps = self.getMaps()
+
+        return marvin.utils.general.general.getSpaxels(x=x, y=y, ra=ra, dec=dec,
+                                                       xyorig=xyorig, modelcube=self,
+                                                       cube=cube or None,
+                                                       maps=maps or None)
+
     def _get_extension_data(self, name, ext=None):
         """Returns the data from an extension."""
 
-        model = self.datamodel[name]
+        model = name if isinstance(name, Model) else self.datamodel[name]
         ext_name = model.fits_extension(ext)
 
-        if ext_name in self._extension_data:
+        try:
             return self._extension_data[ext_name]
+        except KeyError:
+            pass
 
         if self.data_origin == 'file':
             ext_data = self.data[model.fits_extension(ext)].data
@@ -382,22 +424,28 @@ class ModelCube(MarvinToolsClass, NSAMixIn, DAPallMixIn, GetApertureMixIn):
 
         elif self.data_origin == 'api':
 
-            params = {'release': self._release}
-            url = marvin.config.urlmap['api']['getModelCubeExtension']['url']
+            data = self._get_from_remote_cache('extension', ext_name)
 
-            try:
-                response = self._toolInteraction(
-                    url.format(name=self.plateifu,
-                               modelcube_extension=model.fits_extension(ext).lower(),
-                               bintype=self.bintype.name, template=self.template.name),
-                    params=params)
-            except Exception as ee:
-                raise MarvinError('found a problem when checking if remote '
-                                  'modelcube exists: {0}'.format(str(ee)))
+            if data is None:
+
+                params = {'release': self._release}
+                url = marvin.config.urlmap['api']['getModelCubeExtension']['url']
+
+                try:
+                    response = self._toolInteraction(
+                        url.format(name=self.plateifu,
+                                   modelcube_extension=model.fits_extension(ext).lower(),
+                                   bintype=self.bintype.name, template=self.template.name),
+                        params=params)
+                except Exception as ee:
+                    raise MarvinError('found a problem when checking if remote '
+                                      'modelcube exists: {0}'.format(str(ee)))
+
+                data = response.getData()
+                self._set_in_remote_cache(data, 'extension', ext_name)
 
-            data = response.getData()
             cube_ext_data = data['extension_data']
-            ext_data = np.array(cube_ext_data) if cube_ext_data is not None else None
+            ext_data = np.asarray(cube_ext_data) if cube_ext_data is not None else None
 
         self._extension_data[ext_name] = ext_data
 
@@ -483,6 +531,31 @@ class ModelCube(MarvinToolsClass, NSAMixIn, DAPallMixIn, GetApertureMixIn):
 
         return modelcube_quantities
 
+    def _get_spaxel_block_quantities(self, x, y):
+        """Returns a dictionary of `.SpaxelBlockQuantity` for a list of spaxels.
+
+        Each model extension is read once and indexed for all the ``x, y``
+        coordinates at the same time, producing ``(N, nwave)`` arrays.
+
+        """
+
+        modelcube_quantities = FuzzyDict({})
+
+        for dm in self.datamodel:
+
+            block = {'value': self._get_extension_data(dm),
+                     'ivar': self._get_extension_data(dm, 'ivar') if dm.has_ivar() else None,
+                     'mask': self._get_extension_data(dm, 'mask') if dm.has_mask() else None}
+
+            for key in block:
+                if block[key] is not None:
+                    block[key] = np.ascontiguousarray(np.asarray(block[key])[:, y, x].T)
+
+            modelcube_quantities[dm.full()] = marvin.tools.spaxel.SpaxelBlockQuantity(
+                value=block['value'], ivar=block['ivar'], mask=block['mask'], std=None)
+
+        return modelcube_quantities
+
     def get_binid(self, model=None):
         """Returns the binid map associated with a model.
 
@@ -537,26 +610,33 @@ class ModelCube(MarvinToolsClass, NSAMixIn, DAPallMixIn, GetApertureMixIn):
 
         elif self.data_origin == 'api':
 
-            params = {'release': self._release}
-            url = marvin.config.urlmap['api']['getModelCubeBinid']['url']
-
             extension = model.fits_extension().lower() if model is not None else 'flux'
 
-            try:
-                response = self._toolInteraction(
-                    url.format(name=self.plateifu,
-                               modelcube_extension=extension,
-                               bintype=self.bintype.name,
-                               template=self.template.name), params=params)
-            except Exception as ee:
-                raise MarvinError('found a problem when checking if remote '
-                                  'modelcube exists: {0}'.format(str(ee)))
+            data = self._get_from_remote_cache('binid', extension)
+
+            if data is None:
+
+                params = {'release': self._release}
+                url = marvin.config.urlmap['api']['getModelCubeBinid']['url']
+
+                try:
+                    response = self._toolInteraction(
+                        url.format(name=self.plateifu,
+                                   modelcube_extension=extension,
+                                   bintype=self.bintype.name,
+                                   template=self.template.name), params=params)
+                except Exception as ee:
+                    raise MarvinError('found a problem when checking if remote '
+                                      'modelcube exists: {0}'.format(str(ee)))
+
+                if response.results['error'] is not None:
+                    raise MarvinError('found a problem while getting the binid from API: {}'
+                                      .format(str(response.results['error'])))
 
-            if response.results['error'] is not None:
-                raise MarvinError('found a problem while getting the binid from API: {}'
-                                  .format(str(response.results['error'])))
+                data = response.getData()
+                self._set_in_remote_cache(data, 'binid', extension)
 
-            binid_map_data = np.array(response.getData()['binid'])
+            binid_map_data = np.asarray(data['binid'])
 
         binid_map = Map(binid_map_data, unit=binid_prop.unit)
         binid_map._datamodel = binid_prop
@@ -84,7 +84,7 @@ class DataCube(units.Quantity, QuantityMixIn):
             assert (isinstance(binid, np.ndarray) and
                     binid.shape == value.shape[1:]), 'invalid binid shape'
 
-        obj = units.Quantity(value, unit=unit, **kwargs)
+        obj = units.Quantity(value, unit=unit, copy=copy, **kwargs)
         obj = obj.view(cls)
         obj._set_unit(unit)
 
@@ -95,15 +95,18 @@ class DataCube(units.Quantity, QuantityMixIn):
         else:
             obj.wavelength = np.array(wavelength) * wavelength_unit
 
-        obj.ivar = np.array(ivar) if ivar is not None else None
-        obj.mask = np.array(mask) if mask is not None else None
-        obj.binid = np.array(binid) if binid is not None else None
+        # With copy=False, ivar, mask, and binid are views of the input arrays.
+        as_array = np.array if copy else np.asarray
+
+        obj.ivar = as_array(ivar) if ivar is not None else None
+        obj.mask = as_array(mask) if mask is not None else None
+        obj.binid = as_array(binid) if binid is not None else None
 
         obj.pixmask_flag = pixmask_flag
 
         if redcorr is not None:
             assert len(redcorr) == len(obj.wavelength), 'invalid length for redcorr.'
-            obj.redcorr = np.array(redcorr)
+            obj.redcorr = as_array(redcorr)
 
         return obj
 
@@ -15,6 +15,7 @@ from __future__ import absolute_import, division, print_function
 import operator
 import os
 import warnings
+from collections import OrderedDict
 from copy import deepcopy
 
 import astropy.units as units
@@ -81,16 +82,19 @@ class Map(units.Quantity, QuantityMixIn):
         if scale is not None:
             unit = units.CompositeUnit(unit.scale * scale, unit.bases, unit.powers)
 
-        obj = units.Quantity(np.array(array), unit=unit, dtype=dtype, copy=copy)
+        obj = units.Quantity(np.asarray(array), unit=unit, dtype=dtype, copy=copy)
         obj = obj.view(cls)
         obj._set_unit(unit)
 
         obj._maps = None
         obj._datamodel = None
 
-        obj.ivar = np.array(ivar) if ivar is not None else None
-        obj.mask = np.array(mask) if mask is not None else None
-        obj.binid = np.array(binid) if binid is not None else None
+        # With copy=False, ivar, mask, and binid are views of the input arrays.
+        as_array = np.array if copy else np.asarray
+
+        obj.ivar = as_array(ivar) if ivar is not None else None
+        obj.mask = as_array(mask) if mask is not None else None
+        obj.binid = as_array(binid) if binid is not None else None
 
         obj.pixmask_flag = pixmask_flag
 
@@ -215,12 +219,7 @@ class Map(units.Quantity, QuantityMixIn):
 
         assert prop.full() in datamodel, 'failed sanity check. Property does not match.'
 
-        if maps.data_origin == 'file':
-            value, ivar, mask = cls._get_map_from_file(maps, prop)
-        elif maps.data_origin == 'db':
-            value, ivar, mask = cls._get_map_from_db(maps, prop)
-        elif maps.data_origin == 'api':
-            value, ivar, mask = cls._get_map_from_api(maps, prop)
+        value, ivar, mask = cls._get_arrays(maps, [prop])[prop.full()]
 
         # Gets the binid array for this property.
         if prop.name != 'binid':
@@ -228,6 +227,100 @@ class Map(units.Quantity, QuantityMixIn):
         else:
             binid = None
 
+        return cls._from_arrays(maps, prop, value, ivar, mask, binid, dtype=dtype, copy=copy)
+
+    @classmethod
+    def bulk_from_maps(cls, maps, props, dtype=None, copy=True):
+        """Initialise a list of `.Map` from a `.~marvin.tools.maps.Maps`.
+
+        Equivalent to calling `.from_maps` for each property in ``props``,
+        but the binid maps and targeting flags are retrieved only once and,
+        for DB maps, the value, ivar, and mask of all the properties are
+        retrieved with a single query per table. If the extensions of
+        ``maps`` have been loaded with `~marvin.tools.maps.Maps.to_cube`, the
+        maps are created from them.
+
+        """
+
+        import marvin.tools.maps
+
+        assert isinstance(maps, marvin.tools.maps.Maps)
+
+        for prop in props:
+            assert isinstance(prop, Property)
+            assert prop.full() in maps.datamodel, 'failed sanity check. Property does not match.'
+
+        binids = OrderedDict((prop.binid.full(), prop.binid)
+                             for prop in props if prop.name != 'binid')
+        all_props = list(OrderedDict((prop.full(), prop)
+                                     for prop in list(props) + list(binids.values())).values())
+
+        arrays = cls._get_arrays(maps, all_props)
+
+        target_flags = maps.target_flags
+
+        binid_maps = {name: cls._from_arrays(maps, binid, *arrays[name], binid=None,
+                                             target_flags=target_flags, dtype=dtype, copy=copy)
+                      for name, binid in binids.items()}
+
+        map_list = []
+        for prop in props:
+            binid = binid_maps[prop.binid.full()] if prop.name != 'binid' else None
+            map_list.append(cls._from_arrays(maps, prop, *arrays[prop.full()], binid=binid,
+                                             target_flags=target_flags, dtype=dtype, copy=copy))
+
+        return map_list
+
+    @classmethod
+    def _get_arrays(cls, maps, props):
+        """Returns the value, ivar, and mask of a list of properties of ``maps``.
+
+        Returns a dictionary of ``(value, ivar, mask)`` keyed by the full name
+        of each property. The arrays are kept in the memory cache of ``maps``
+        (see `~marvin.core.memory_cache.MemoryCache`) and only the properties
+        not found in it, e.g., because they have been evicted, are retrieved
+        again. Arrays from the extensions loaded with
+        `~marvin.tools.maps.Maps.to_cube` are not cached.
+
+        """
+
+        if getattr(maps, '_extensions', None) is not None:
+            return {prop.full(): cls._get_map_from_extensions(maps, prop) for prop in props}
+
+        map_data = getattr(maps, '_map_data', None)
+        if map_data is None:
+            map_data = {}
+
+        arrays = {}
+        missing = []
+        for prop in props:
+            try:
+                arrays[prop.full()] = map_data[prop.full()]
+            except KeyError:
+                missing.append(prop)
+
+        if len(missing) == 0:
+            return arrays
+
+        if maps.data_origin == 'db':
+            retrieved = cls._get_maps_from_db(maps, missing)
+        elif maps.data_origin == 'file':
+            retrieved = {prop.full(): cls._get_map_from_file(maps, prop) for prop in missing}
+        elif maps.data_origin == 'api':
+            retrieved = {prop.full(): cls._get_map_from_api(maps, prop) for prop in missing}
+
+        for name, prop_arrays in retrieved.items():
+            map_data[name] = prop_arrays
+
+        arrays.update(retrieved)
+
+        return arrays
+
+    @classmethod
+    def _from_arrays(cls, maps, prop, value, ivar, mask, binid, target_flags=None,
+                     dtype=None, copy=True):
+        """Creates a `.Map` for a property of ``maps`` from its arrays."""
+
         unit = prop.unit
 
         obj = cls(value, unit=unit, ivar=ivar, mask=mask, binid=binid,
@@ -236,10 +329,11 @@ class Map(units.Quantity, QuantityMixIn):
         obj._datamodel = prop
         obj._maps = maps
 
-        obj.manga_target1 = maps.manga_target1
-        obj.manga_target2 = maps.manga_target2
-        obj.manga_target3 = maps.manga_target3
-        obj.target_flags = maps.target_flags
+        if target_flags is None:
+            target_flags = maps.target_flags
+
+        obj.manga_target1, obj.manga_target2, obj.manga_target3 = target_flags
+        obj.target_flags = target_flags
 
         obj.pixmask_flag = prop.pixmask_flag
 
@@ -261,10 +355,40 @@ class Map(units.Quantity, QuantityMixIn):
 
         return value, ivar, mask
 
+    @staticmethod
+    def _get_map_from_extensions(maps, prop):
+        """Initialise the `.Map` from the extensions loaded by `~marvin.tools.maps.Maps.to_cube`.
+
+        The returned arrays are views of the loaded extensions.
+
+        """
+
+        extensions = maps._extensions
+        idx = prop.channel.idx if prop.channel is not None else Ellipsis
+
+        value = extensions[prop.name][idx]
+        ivar = extensions[prop.name + '_ivar'][idx] if prop.ivar else None
+        mask = extensions[prop.name + '_mask'][idx] if prop.mask else None
+
+        return value, ivar, mask
+
     @staticmethod
     def _get_map_from_db(maps, prop):
         """Initialise the `.Map` from the DB."""
 
+        return Map._get_maps_from_db(maps, [prop])[prop.full()]
+
+    @staticmethod
+    def _get_maps_from_db(maps, props):
+        """Returns the value, ivar, and mask of a list of properties from the DB.
+
+        The columns of all the properties in the same table are retrieved
+        with a single query, and placed into preallocated arrays using the
+        ``x, y`` of each row. Returns a dictionary of ``(value, ivar, mask)``
+        keyed by the full name of each property.
+
+        """
+
         mdb = marvin.marvindb
 
         if not mdb.isdbconnected:
@@ -273,62 +397,87 @@ class Map(units.Quantity, QuantityMixIn):
         if sqlalchemy is None:
             raise marvin.core.exceptions.MarvinError('sqlalchemy required to access the local DB.')
 
-        assert prop.model is not None
-        table = getattr(mdb.dapdb, prop.model)
+        # Groups the properties by table.
+        tables = OrderedDict()
+        for prop in props:
+            assert prop.model is not None
+            tables.setdefault(prop.model, []).append(prop)
 
-        fullname_value = prop.db_column()
-        value = mdb.session.query(getattr(table, fullname_value)).filter(
-            table.file_pk == maps.data.pk).order_by(table.spaxel_index).all()
+        arrays = {}
 
-        shape = (int(np.sqrt(len(value))), int(np.sqrt(len(value))))
-        value = np.array(value).reshape(shape).T
+        for model, table_props in tables.items():
 
-        ivar = None
-        mask = None
+            table = getattr(mdb.dapdb, model)
 
-        if prop.ivar:
-            fullname_ivar = prop.db_column(ext='ivar')
-            ivar = mdb.session.query(getattr(table, fullname_ivar)).filter(
-                table.file_pk == maps.data.pk).order_by(table.spaxel_index).all()
-            ivar = np.array(ivar).reshape(shape).T
+            columns = []
+            for prop in table_props:
+                columns.append(prop.db_column())
+                if prop.ivar:
+                    columns.append(prop.db_column(ext='ivar'))
+                if prop.mask:
+                    columns.append(prop.db_column(ext='mask'))
+            columns = list(OrderedDict.fromkeys(columns))
 
-        if prop.mask:
-            fullname_mask = prop.db_column(ext='mask')
-            mask = mdb.session.query(getattr(table, fullname_mask)).filter(
-                table.file_pk == maps.data.pk).order_by(table.spaxel_index).all()
-            mask = np.array(mask).reshape(shape).T
+            rows = mdb.session.query(table.x, table.y,
+                                     *[getattr(table, column) for column in columns]).filter(
+                table.file_pk == maps.data.pk).all()
 
-        return value, ivar, mask
+            if len(rows) == 0:
+                raise marvin.core.exceptions.MarvinError(
+                    'no rows found in table {0!r} for this Maps'.format(model))
+
+            rows = np.array(rows, dtype=np.float64)
+            xx = rows[:, 0].astype(int)
+            yy = rows[:, 1].astype(int)
+
+            data = np.zeros((len(columns), ) + tuple(maps._shape), dtype=np.float64)
+            data[:, yy, xx] = rows[:, 2:].T
+
+            index = {column: ii for ii, column in enumerate(columns)}
+
+            for prop in table_props:
+                value = data[index[prop.db_column()]]
+                ivar = data[index[prop.db_column(ext='ivar')]] if prop.ivar else None
+                mask = data[index[prop.db_column(ext='mask')]].astype(int) if prop.mask else None
+                arrays[prop.full()] = (value, ivar, mask)
+
+        return arrays
 
     @staticmethod
     def _get_map_from_api(maps, prop):
         """Initialise the `.Map` from the API."""
 
-        url = marvin.config.urlmap['api']['getmap']['url']
+        data = maps._get_from_remote_cache('map', prop.full())
+
+        if data is None:
 
-        url_full = url.format(
-            **{'name': maps.plateifu,
-               'property_name': prop.name,
-               'channel': prop.channel.name if prop.channel else None,
-               'bintype': maps.bintype.name,
-               'template': maps.template.name})
+            url = marvin.config.urlmap['api']['getmap']['url']
 
-        try:
-            response = marvin.api.api.Interaction(url_full,
-                                                  params={'release': maps._release})
-        except Exception as ee:
-            raise marvin.core.exceptions.MarvinError(
-                'found a problem when getting the map: {0}'.format(str(ee)))
+            url_full = url.format(
+                **{'name': maps.plateifu,
+                   'property_name': prop.name,
+                   'channel': prop.channel.name if prop.channel else None,
+                   'bintype': maps.bintype.name,
+                   'template': maps.template.name})
 
-        data = response.getData()
+            try:
+                response = marvin.api.api.Interaction(url_full,
+                                                      params={'release': maps._release})
+            except Exception as ee:
+                raise marvin.core.exceptions.MarvinError(
+                    'found a problem when getting the map: {0}'.format(str(ee)))
 
-        if data is None:
-            raise marvin.core.exceptions.MarvinError(
-                'something went wrong. Error is: {0}'.format(response.results['error']))
+            data = response.getData()
+
+            if data is None:
+                raise marvin.core.exceptions.MarvinError(
+                    'something went wrong. Error is: {0}'.format(response.results['error']))
+
+            maps._set_in_remote_cache(data, 'map', prop.full())
 
-        value = np.array(data['value'])
-        ivar = np.array(data['ivar']) if data['ivar'] is not None else None
-        mask = np.array(data['mask']) if data['mask'] is not None else None
+        value = np.asarray(data['value'])
+        ivar = np.asarray(data['ivar']) if data['ivar'] is not None else None
+        mask = np.asarray(data['mask']) if data['mask'] is not None else None
 
         return value, ivar, mask
 
@@ -57,7 +57,10 @@ class Spectrum(Quantity, QuantityMixIn):
                 wavelength_unit=Angstrom, ivar=None, std=None,
                 mask=None, dtype=None, copy=True, pixmask_flag=None, **kwargs):
 
-        flux = np.array(flux)
+        # With copy=False, the flux, ivar, mask, and std are views of the input arrays.
+        as_array = np.array if copy else np.asarray
+
+        flux = as_array(flux)
 
         # If the scale is defined, creates a new composite unit with the input scale.
         if scale is not None:
@@ -67,12 +70,12 @@ class Spectrum(Quantity, QuantityMixIn):
         obj = obj.view(cls)
         obj._set_unit(unit)
 
-        obj.ivar = np.array(ivar) if ivar is not None else None
-        obj.mask = np.array(mask) if mask is not None else None
+        obj.ivar = as_array(ivar) if ivar is not None else None
+        obj.mask = as_array(mask) if mask is not None else None
 
         if std is not None:
             assert ivar is None, 'std and ivar cannot be used at the same time.'
-            obj._std = np.array(std)
+            obj._std = as_array(std)
 
         assert wavelength is not None, 'invalid wavelength'
 
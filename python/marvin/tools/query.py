@@ -24,6 +24,7 @@ from marvin import config, log
 from marvin.api.api import Interaction
 from marvin.core import marvin_pickle
 from marvin.core.exceptions import MarvinError, MarvinUserWarning
+from marvin.tools.file_query import FileQuery
 from marvin.tools.results import Results, remote_mode_only
 from marvin.utils.general import temp_setattr, getKeywordArgs
 from marvin.utils.datamodel.query import datamodel
@@ -103,8 +104,10 @@ class Query(object):
     specifying a string filter a string filter condition in a natural language SQL format,
     as well as, a list of desired parameters to return.
 
-    Query will use a local database if it finds on.  Otherwise a remote query uses
-    the API to run a query on the Utah Server and return the results.
+    Query will use a local database if it finds on.  Without a database, galaxy-level
+    queries are evaluated on the local DRPall and DAPall files, if available (see
+    `~marvin.tools.file_query.FileQuery`).  Otherwise a remote query uses the API to run
+    a query on the Utah Server and return the results.
 
     The Query returns a list of tupled parameters and passed them into the
     Marvin Results object.  The parameters are a combination of user-defined
@@ -146,19 +149,23 @@ class Query(object):
             If True, turns on the dogpile memcache caching of results. Default is True.
         verbose (bool):
             If True, turns on verbosity.
+        columnar (bool):
+            If True, the Results hold the rows as typed columns in a numpy structured
+            array, and only create the row tuples when needed.  Default is False.
 
     '''
 
     def __init__(self, search_filter=None, return_params=None, return_type=None, targets=None,
                  quality=None, mode=None, return_all=False, default_params=None, nexus='cube',
                  sort='mangaid', order='asc', caching=True, limit=100, count_threshold=1000,
-                 verbose=False, release=None):
+                 verbose=False, release=None, columnar=False):
 
         # basic parameters
         self.release = release or config.release
         self._drpver, self._dapver = config.lookUpVersions(release=self.release)
         self.mode = mode if mode is not None else config.mode
         self.data_origin = None
+        requested_mode = self.mode
 
         # main parameters
         self.search_filter = search_filter
@@ -181,6 +188,7 @@ class Query(object):
         self.count_threshold = count_threshold
         self.limit = limit
         self.verbose = verbose
+        self.columnar = columnar
 
         # add db specific parameters
         if config.db:
@@ -197,8 +205,16 @@ class Query(object):
 
         # initialize a query
         if self.data_origin == 'file':
-            raise MarvinError('Cannot currently query a file')
-        elif self.data_origin == 'db':
+            try:
+                self._init_file_query()
+            except MarvinError as e:
+                if requested_mode != 'auto':
+                    raise
+                log.debug('file query failed: {0}. Trying remote now.'.format(e))
+                self._do_remote()
+                self.params = []
+
+        if self.data_origin == 'db':
             self._init_local_query()
         elif self.data_origin == 'api':
             self._init_remote_query()
@@ -237,12 +253,23 @@ class Query(object):
     def _do_local(self):
         ''' Sets up to perform queries locally. '''
 
-        if not config.db:
-            warnings.warn('No local database found. Cannot perform queries.', MarvinUserWarning)
-            raise MarvinError('No local database found.  Query cannot be run in local mode')
-        else:
+        if config.db:
             self.mode = 'local'
             self.data_origin = 'db'
+        elif self._has_drpall():
+            self.mode = 'local'
+            self.data_origin = 'file'
+        else:
+            warnings.warn('No local database found. Cannot perform queries.', MarvinUserWarning)
+            raise MarvinError('No local database found.  Query cannot be run in local mode')
+
+    def _has_drpall(self):
+        ''' Checks if the DRPall file of the release is available locally '''
+
+        try:
+            return os.path.exists(config._getDrpAllPath(self._drpver))
+        except MarvinError:
+            return False
 
     def _do_remote(self):
         ''' Sets up to perform queries remotely. '''
@@ -268,6 +295,28 @@ class Query(object):
         # build the query
         self._build_query()
 
+    def _init_file_query(self):
+        ''' Initialize a query on the local DRPall and DAPall files '''
+
+        # target and quality flags are only applied by database and remote queries
+        for name in ['targets', 'quality']:
+            if getattr(self, name):
+                raise MarvinError('{0} cannot be queried from the DRPall or DAPall files'
+                                  .format(name))
+
+        # set default parameters
+        self._set_defaultparams()
+
+        # get user-defined input parameters
+        returns = self.return_params or []
+        returns = [returns] if not isinstance(returns, list) else returns
+
+        # resolve the parameters and check they can be queried from the files
+        self.query = FileQuery(search_filter=self.search_filter, params=self.params + returns,
+                               release=self.release, sort=self.sort, order=self.order)
+        self.return_params = [self.query.resolve(rp) for rp in returns]
+        self.params = self.query.params
+
     def _init_remote_query(self):
         ''' Initialize a remote API query '''
 
@@ -321,6 +370,8 @@ class Query(object):
             results = self._run_remote(start=start, end=end, query_type=query_type)
         elif self.data_origin == 'db':
             results = self._run_local(start=start, end=end, query_type=query_type)
+        elif self.data_origin == 'file':
+            results = self._run_file(start=start, end=end)
 
         return results
 
@@ -385,6 +436,87 @@ class Query(object):
 
         return final
 
+    def iter_rows(self, chunk=1000):
+        ''' Iterates over all the rows of the Query
+
+        Unlike `run`, which returns a page of results (or all of them, with
+        ``return_all``) loaded in memory, this streams the rows one at a time,
+        so that arbitrarily large queries can be processed in constant memory.
+        Locally, the rows are fetched from a server-side cursor, ``chunk`` rows
+        at a time.  Remotely, they are streamed from the ``/query/stream/`` route.
+
+        The rows are returned in the order set by ``sort`` and ``order``, and the
+        ``limit`` and ``count_threshold`` parameters are ignored.
+
+        Parameters:
+            chunk (int):
+                The number of rows to fetch from the database at a time.
+
+        Returns:
+            A generator over the rows of the query, as tuples in the order of
+            the query ``params``.
+
+        Example:
+            >>> q = Query(search_filter='nsa.z < 0.1', return_params=['cube.ra', 'cube.dec'])
+            >>> for row in q.iter_rows():
+            >>>     print(row)
+
+        See Also:
+            Results.iterate
+
+        '''
+
+        if self.data_origin == 'api':
+            return self._iter_remote(chunk=chunk)
+        elif self.data_origin == 'db':
+            return self._iter_local(chunk=chunk)
+        elif self.data_origin == 'file':
+            return self.query.iter_rows(chunk=chunk)
+
+    def _iter_remote(self, chunk=1000):
+        ''' Streams the rows of a remote Query '''
+
+        url = config.urlmap['api']['stream']['url']
+        params = {key: value for key, value in self._remote_params.items()
+                  if key not in ['start', 'end', 'query_type', 'return_all']}
+        params['limit'] = chunk
+
+        try:
+            ii = Interaction(route=url, params=params, send=False)
+            rows = ii.iterData()
+        except Exception as e:
+            raise MarvinError('API Query stream call failed: {0}'.format(e))
+
+        # the first row streamed is the list of parameters
+        for index, row in enumerate(rows):
+            if index == 0:
+                self.params = row
+                continue
+            yield tuple(row)
+
+    def _iter_local(self, chunk=1000):
+        ''' Streams the rows of a local Query from a server-side cursor '''
+
+        # Check for adding a sort
+        self._sort_query()
+
+        sql = str(self._get_sql(self.query))
+        conn = marvindb.db.engine.raw_connection()
+        try:
+            # a named cursor keeps the results on the server
+            cursor = conn.cursor('iter_cursor')
+            cursor.itersize = chunk
+            cursor.execute(sql)
+            while True:
+                rows = cursor.fetchmany(chunk)
+                if not rows:
+                    break
+                for row in rows:
+                    yield row
+            cursor.close()
+        finally:
+            conn.close()
+
     def _get_remote_parameters(self, interaction):
         ''' Retrieve or set parameters needed
 
@@ -487,6 +619,45 @@ class Query(object):
 
         return final
 
+    def _run_file(self, start=None, end=None):
+        ''' Run a Query on the local DRPall and DAPall files
+
+        Parameters:
+            start (int):
+                A starting index when slicing the query
+            end (int):
+                An ending index when slicing the query
+
+        Returns:
+            An instance of the :class:`~marvin.tools.query.results.Results`
+            class containing the results of your Query.
+
+        '''
+
+        # set the start time of query
+        starttime = datetime.datetime.now()
+
+        # evaluate the filter and get count
+        totalcount = self.query.count()
+
+        # slice the query and get the results
+        query = self._slice_query(start=start, end=end, totalcount=totalcount)
+        results = query.all()
+
+        # get the runtime
+        endtime = datetime.datetime.now()
+        self._run_time = (endtime - starttime)
+
+        # convert to Marvin Results
+        final = Results(results=results, query=query, count=self._count, mode=self.mode,
+                        data_origin=self.data_origin, returntype=self.return_type, queryobj=self,
+                        totalcount=totalcount, chunk=self.limit, runtime=self._run_time,
+                        start=self._start, end=self._end)
+
+        self._final_time = (datetime.datetime.now() - starttime)
+
+        return final
+
     def _sort_query(self):
         ''' Sort the SQLA query object by a given parameter '''
 
@@ -602,7 +773,7 @@ class Query(object):
         # self.totalcount = count if not self.totalcount else self.totalcount
 
         # check history
-        if marvindb.isdbconnected:
+        if self.data_origin == 'db' and marvindb.isdbconnected:
             __ = self._check_history(totalcount=totalcount)
 
         if count > self.count_threshold and self.return_all is False:
@@ -761,6 +932,8 @@ class Query(object):
         elif self.data_origin == 'api':
             sql = self.search_filter
             return sql
+        elif self.data_origin == 'file':
+            return self.search_filter if prop == 'filter' else str(self.query)
 
     @classmethod
     def get_available_params(cls, paramdisplay='best', release=None):
@@ -6,12 +6,14 @@
 
 from __future__ import print_function
 
+import concurrent.futures
 import copy
 import datetime
+import functools
 import json
 import os
 import warnings
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 from functools import wraps
 from operator import add
 
@@ -359,6 +361,11 @@ class Results(object):
             For paginated results, the starting index value of the results.  Defaults to 0.
         end (int):
             For paginated results, the ending index value of the resutls.  Defaults to start+chunk.
+        columnar (bool):
+            If True, holds the results as typed columns in a numpy structured array, rather
+            than as a list of ResultRows.  Column access (`getListOf`, `toArray`, `toTable`,
+            `toDataFrame`, `plot`) then does not create the rows, which are only created when
+            ``results`` is accessed.  Default is False.
 
     Attributes:
         count (int):  The count of objects in your current page of results
@@ -383,9 +390,10 @@ class Results(object):
     def __init__(self, results=None, mode=None, data_origin=None, release=None, count=None,
                  totalcount=None, runtime=None, response_time=None, chunk=None, start=None,
                  end=None, queryobj=None, query=None, search_filter=None, return_params=None,
-                 return_type=None, limit=None, params=None, **kwargs):
+                 return_type=None, limit=None, params=None, columnar=False, **kwargs):
 
         # basic parameters
+        self._data_index = None
         self.results = results
         self.mode = mode if mode else config.mode
         self.data_origin = data_origin
@@ -400,6 +408,7 @@ class Results(object):
         self.search_filter = self._queryobj.search_filter if self._queryobj else search_filter
         self.return_params = self._queryobj.return_params if self._queryobj else return_params
         self.limit = self._queryobj.limit if self._queryobj else limit
+        self.columnar = self._queryobj.columnar if self._queryobj else columnar
 
         # stat parameters
         self.datamodel = datamodel[self.release]
@@ -438,7 +447,7 @@ class Results(object):
         params = self._params + [p for p in other._params if p not in self._params]
         return Results(results=results, params=params, return_params=return_params, limit=self.limit,
                        search_filter=self.search_filter, count=len(results), totalcount=self.totalcount,
-                       release=self.release, mode=self.mode)
+                       release=self.release, mode=self.mode, columnar=self.columnar)
 
     def __radd__(self, other):
         return self.__add__(other)
@@ -446,6 +455,29 @@ class Results(object):
     def __repr__(self):
         return ('Marvin Results(query={0}, totalcount={1}, count={2}, mode={3})'.format(self.search_filter, self.totalcount, self.count, self.mode))
 
+    @property
+    def results(self):
+        ''' The current set of results, as a ResultSet of ResultRows
+
+        In columnar mode, the ResultSet is created from the columns the first
+        time it is accessed.  Changes made directly to it are not reflected in
+        the columns.
+
+        '''
+
+        if self._result_set is None and self._data is not None:
+            nt = marvintuple('ResultRow', self._data.dtype.names, results=self)
+            rows = [nt(*row) for row in self._data.tolist()]
+            self._result_set = ResultSet(rows, count=len(rows), total=self.totalcount,
+                                         index=self._data_index, results=self)
+
+        return self._result_set
+
+    @results.setter
+    def results(self, value):
+        self._result_set = value
+        self._data = None
+
     def showQuery(self):
         ''' Displays the literal SQL query used to generate the Results objects
 
@@ -460,8 +492,10 @@ class Results(object):
         # return the string query or compile the real query
         if isstr:
             return self.query
-        else:
+        elif hasattr(self.query, 'statement'):
             return str(self.query.statement.compile(compile_kwargs={'literal_binds': True}))
+        else:
+            return str(self.query)
 
     def _getRunTime(self):
         ''' Sets the query runtime as a datetime timedelta object '''
@@ -546,8 +580,13 @@ class Results(object):
         if self.mode == 'local':
             reverse = True if order == 'desc' else False
             self.getAll()
-            self.results.sort(remotename, reverse=reverse)
-            self.results = self.results[0:self.limit]
+            if self._data is not None:
+                indices = np.argsort(self._data[remotename], kind='mergesort')
+                indices = indices[::-1] if reverse else indices
+                self._set_data(self._data[indices[0:self.limit]], index=0)
+            else:
+                self.results.sort(remotename, reverse=reverse)
+                self.results = self.results[0:self.limit]
         elif self.mode == 'remote':
             # Fail if no route map initialized
             if not config.urlmap:
@@ -588,7 +627,10 @@ class Results(object):
             >>>   4-4602     1901      -9999.0
         '''
         try:
-            tabres = Table(rows=self.results, names=self.columns.full)
+            if self._data is not None:
+                tabres = Table(self._data, names=self.columns.full, copy=False)
+            else:
+                tabres = Table(rows=self.results, names=self.columns.full)
         except ValueError as e:
             raise MarvinError('Could not make astropy Table from results: {0}'.format(e))
         return tabres
@@ -707,13 +749,108 @@ class Results(object):
             3  1-22942   7992  12705  8.470360e+10  0.104958
             4  1-22948   7992   9102  1.023530e+11  0.119399
         '''
-        res = self.results.to_list() if self.results else []
+        if self._data is not None:
+            res = self._data
+        else:
+            res = self.results.to_list() if self.results else []
         try:
             dfres = pd.DataFrame(res)
         except (ValueError, NameError) as e:
             raise MarvinError('Could not make pandas dataframe from results: {0}'.format(e))
         return dfres
 
+    def toArray(self):
+        ''' Output the results as a numpy structured array
+
+        Each column of the results is a field of the array, named after the
+        remote name of the column.  In columnar mode, the array holding the
+        results is returned without a copy.
+
+        Returns:
+            A numpy structured array
+
+        Example:
+            >>> r = q.run()
+            >>> data = r.toArray()
+            >>> data['z']
+            array([0.0407447, 0.0378877, 0.0234253, 0.0185246])
+
+        '''
+
+        if self._data is not None:
+            return self._data
+
+        data = self._to_structured_array(self.results or [], self.columns.list_params('remote'))
+        if self.columnar:
+            self._set_data(data, index=self.results.index if self.results else None)
+
+        return data
+
+    @staticmethod
+    def _to_structured_array(rows, names):
+        ''' Converts a list of rows into a numpy structured array
+
+        Parameters:
+            rows (list):
+                A list of tuples, or of dictionaries keyed by the names
+            names (list):
+                The names of the columns
+
+        Returns:
+            A numpy structured array with one field per column
+
+        '''
+
+        if rows and isinstance(rows[0], dict):
+            columns = [[row[name] for row in rows] for name in names]
+        elif rows:
+            columns = list(zip(*rows))
+        else:
+            columns = [[] for name in names]
+
+        arrays = [np.asarray(column) for column in columns]
+        dtype = [(str(name), array.dtype, array.shape[1:]) for name, array in zip(names, arrays)]
+        data = np.empty(len(rows), dtype=dtype)
+        for name, array in zip(names, arrays):
+            data[str(name)] = array
+
+        return data
+
+    def _set_data(self, data, index=None):
+        ''' Sets the typed columns holding the results in columnar mode '''
+
+        self._data = data
+        self._data_index = index
+        self._result_set = None
+        self.count = len(data)
+
+    def _get_set_count(self):
+        ''' Returns the number of rows in the current set, without creating them '''
+
+        if self._data is not None:
+            return len(self._data)
+
+        return len(self.results) if self.results is not None else 0
+
+    @staticmethod
+    def _concatenate_data(first, second):
+        ''' Concatenates two structured arrays of results
+
+        The fields of the two arrays can have different types (e.g., strings
+        of different lengths), which are promoted to a common one.
+
+        '''
+
+        dtype = [(name, np.promote_types(first.dtype[name].base, second.dtype[name].base),
+                  first.dtype[name].shape) for name in first.dtype.names]
+
+        data = np.empty(len(first) + len(second), dtype=dtype)
+        for name in first.dtype.names:
+            data[name][:len(first)] = first[name]
+            data[name][len(first):] = second[name]
+
+        return data
+
     def _create_result_set(self, index=None, rows=None):
         ''' Creates a Marvin ResultSet
 
@@ -731,8 +868,14 @@ class Results(object):
         # grab the columns from the results
         self.columns = self.getColumns()
         ntnames = self.columns.list_params('remote')
-        # dynamically create a new ResultRow Class
         rows = rows if rows else self.results
+
+        # keep typed columns, the rows are only created when needed
+        if self.columnar:
+            self._set_data(self._to_structured_array(rows, ntnames), index=index)
+            return
+
+        # dynamically create a new ResultRow Class
         row_is_dict = isinstance(rows[0], dict)
         if not isinstance(rows, ResultSet):
             nt = marvintuple('ResultRow', ntnames, results=self)
@@ -835,6 +978,11 @@ class Results(object):
                 The instantiated Marvin Results class
         '''
         obj = marvin_pickle.restore(path, delete=delete)
+        # results pickled before the columnar mode
+        if 'results' in obj.__dict__:
+            obj.columnar = False
+            obj._data_index = None
+            obj.results = obj.__dict__.pop('results')
         obj.datamodel = datamodel[obj.release]
         obj._create_result_set()
         obj.getColumns()
@@ -991,6 +1139,12 @@ class Results(object):
             params = {'searchfilter': self.search_filter, 'format_type': 'list',
                       'return_all': True, 'returnparams': self.return_params}
             output = self._interaction(url, params, calltype='getList')
+        elif self._data is not None:
+            # only deal with current page, straight from the columns
+            column = self._data[self._check_column(name, 'remote')]
+            if to_ndarray:
+                return column
+            output = column.tolist()
         else:
             # only deal with current page
             output = self.results[name] if self.results.count > 1 else [self.results[name]]
@@ -1072,12 +1226,42 @@ class Results(object):
 
         return output
 
+    def iterate(self, chunk=1000):
+        ''' Iterates over the full set of results
+
+        Streams all the rows of the query one at a time, without storing them
+        in the Results, so that results too large for `loop` or `getAll` can be
+        processed in constant memory.  See `Query.iter_rows` for details.
+
+        Parameters:
+            chunk (int):
+                The number of rows to fetch from the database at a time
+
+        Returns:
+            A generator over all the rows of the query, as ResultRows
+
+        Example:
+            >>> r = q.run()
+            >>> for row in r.iterate():
+            >>>     print(row.mangaid, row.z)
+
+        '''
+
+        if not self._queryobj:
+            raise MarvinError('Cannot iterate over results without a Query')
+
+        rows = self._queryobj.iter_rows(chunk=chunk)
+        nt = marvintuple('ResultRow', self.columns.list_params('remote'), results=self)
+        for row in rows:
+            yield nt(*row)
+
     def loop(self, chunk=None):
         ''' Loop over the full set of results
 
         Starts a loop to collect all the results (in chunks)
         until the current count reaches the total number
-        of results.  Uses extendSet.
+        of results.  Uses extendSet.  All the results are kept in
+        memory; use `iterate` to stream through large results instead.
 
         Parameters:
             chunk (int):
@@ -1121,6 +1305,19 @@ class Results(object):
 
         '''
 
+        # in columnar mode, the columns of the next page are appended to the current ones
+        if self._data is not None:
+            olddata, oldindex = self._data, self._data_index
+            if start is not None:
+                self._get_subset(start, limit=chunk)
+            else:
+                self._get_next(chunk=chunk)
+            if self._data is not None:
+                self._set_data(self._concatenate_data(olddata, self._data), index=oldindex)
+            else:
+                self._set_data(olddata, index=oldindex)
+            return
+
         oldset = copy.copy(self.results)
         if start is not None:
             nextset = self.getSubset(start, limit=chunk)
@@ -1160,6 +1357,13 @@ class Results(object):
 
         '''
 
+        self._get_next(chunk=chunk)
+
+        return self.results
+
+    def _get_next(self, chunk=None):
+        ''' Retrieves the next chunk of results, without creating the rows in columnar mode '''
+
         if chunk and chunk < 0:
             warnings.warn('Chunk cannot be negative. Setting to {0}'.format(self.chunk), MarvinUserWarning)
             chunk = self.chunk
@@ -1171,7 +1375,7 @@ class Results(object):
         # This handles cases when the number of results is < total
         if self.totalcount == self.count:
             warnings.warn('You have all the results.  Cannot go forward', MarvinUserWarning)
-            return self.results
+            return
 
         # This handles the end edge case
         if newend > self.totalcount:
@@ -1200,13 +1404,11 @@ class Results(object):
 
         self.start = newstart
         self.end = newend
-        self.count = len(self.results)
+        self.count = self._get_set_count()
 
         if self.return_type:
             self.convertToTool(self.return_type)
 
-        return self.results
-
     def getPrevious(self, chunk=None):
         ''' Retrieve the previous chunk of results.
 
@@ -1278,7 +1480,7 @@ class Results(object):
 
         self.start = newstart
         self.end = newend
-        self.count = len(self.results)
+        self.count = self._get_set_count()
 
         if self.return_type:
             self.convertToTool(self.return_type)
@@ -1317,6 +1519,13 @@ class Results(object):
 
         '''
 
+        self._get_subset(start, limit=limit)
+
+        return self.results
+
+    def _get_subset(self, start, limit=None):
+        ''' Extracts a subset of results, without creating the rows in columnar mode '''
+
         if not limit:
             limit = self.chunk
 
@@ -1346,12 +1555,10 @@ class Results(object):
                       'sort': self.sortcol, 'order': self.order}
             self._interaction(url, params, calltype='getSubset', create_set=True, index=start)
 
-        self.count = len(self.results)
+        self.count = self._get_set_count()
         if self.return_type:
             self.convertToTool(self.return_type)
 
-        return self.results
-
     def getAll(self, force=False):
         ''' Retrieve all of the results of a query
 
@@ -1392,7 +1599,8 @@ class Results(object):
             self.count = self.totalcount
             print('Returned all {0} results'.format(self.totalcount))
 
-    def convertToTool(self, tooltype, mode='auto', limit=None):
+    def convertToTool(self, tooltype, mode='auto', limit=None, n_workers=None, executor=None,
+                      progress=False):
         ''' Converts the list of results into Marvin Tool objects
 
         Creates a list of Marvin Tool objects from a set of query results.
@@ -1400,6 +1608,11 @@ class Results(object):
         If the Query.returntype parameter is specified, then the Results object
         will automatically convert the results to the desired Tool on initialization.
 
+        Rows that refer to the same object (e.g., the same plateifu, bintype, and
+        template) share a single Tool instance, which is only created once.  Objects
+        that cannot be created are replaced by an error message, so that the
+        objects always match the order of the results.
+
         Parameters:
             tooltype (str):
                 The requested Marvin Tool object that the results are converted into.
@@ -1411,6 +1624,16 @@ class Results(object):
             mode (str):
                 The mode to use when attempting to convert to Tool. Default mode
                 is to use the mode internal to Results. (most often remote mode)
+            n_workers (int):
+                If larger than 1, the Tools are created in parallel using this many
+                workers.  Default is None, which creates them one after another.
+            executor (str or `concurrent.futures.Executor`):
+                The pool used to create the Tools in parallel.  Either ``'thread'``,
+                ``'process'``, or an existing executor.  If not set and ``n_workers``
+                is larger than 1, uses processes when loading local files and threads
+                otherwise.
+            progress (bool):
+                If True, prints the number of Tools created as they are completed.
 
         Example:
             >>> # Get the results from some query
@@ -1431,6 +1654,9 @@ class Results(object):
             >>>  <Marvin Cube (plateifu='7995-1902', mode='remote', data_origin='api')>,
             >>>  <Marvin Cube (plateifu='8000-1901', mode='remote', data_origin='api')>]
 
+            >>> # convert results to Marvin Maps, using 8 threads
+            >>> r.convertToTool('maps', n_workers=8, executor='thread')
+
         '''
 
         # set the desired tool type
@@ -1441,16 +1667,24 @@ class Results(object):
         # get the parameter list to check against
         paramlist = self.columns.full
 
+        rows = self.results[0:limit]
+        get_objects = functools.partial(self._get_objects, mode=mode, n_workers=n_workers,
+                                        executor=executor, progress=progress)
+
         print('Converting results to Marvin {0} objects'.format(tooltype.title()))
         if tooltype == 'cube':
-            self.objects = [self._get_object(Cube, plateifu=res.plateifu, mode=mode) for res in self.results[0:limit]]
-        elif tooltype == 'maps':
+            self.objects = get_objects([(Cube, {'plateifu': res.plateifu, 'mode': mode})
+                                        for res in rows])
+        elif tooltype in ['maps', 'modelcube']:
 
             isbin = 'bintype.name' in paramlist
             istemp = 'template.name' in paramlist
-            self.objects = []
 
-            for res in self.results[0:limit]:
+            if tooltype == 'modelcube':
+                assert self.release != 'MPL-4', "ModelCubes require a release of MPL-5 and up"
+
+            specs = []
+            for res in rows:
                 mapkwargs = {'mode': mode, 'plateifu': res.plateifu}
 
                 if isbin:
@@ -1461,7 +1695,9 @@ class Results(object):
                     tempval = res.template_name
                     mapkwargs['template_kin'] = tempval
 
-                self.objects.append(self._get_object(Maps, **mapkwargs))
+                specs.append((Maps if tooltype == 'maps' else ModelCube, mapkwargs))
+
+            self.objects = get_objects(specs)
         elif tooltype == 'spaxel':
 
             assert 'spaxelprop.x' in paramlist and 'spaxelprop.y' in paramlist, \
@@ -1469,38 +1705,87 @@ class Results(object):
 
             self.objects = []
 
-            tab = self.toTable()
-            uniq_plateifus = list(set(self.getListOf('plateifu')))
-
-            for plateifu in uniq_plateifus:
-                c = self._get_object(Cube, plateifu=plateifu, mode=mode)
-                univals = tab['cube.plateifu'] == plateifu
-                x = tab[univals]['spaxelprop.x'].tolist()
-                y = tab[univals]['spaxelprop.y'].tolist()
-                spaxels = c[y, x]
-                self.objects.extend(spaxels)
+            # group the spaxel coordinates by plateifu, in order of appearance
+            xname = self.columns['spaxelprop.x'].remote
+            yname = self.columns['spaxelprop.y'].remote
+            coords = OrderedDict()
+            for res in self.results:
+                xy = coords.setdefault(res.plateifu, ([], []))
+                xy[0].append(getattr(res, xname))
+                xy[1].append(getattr(res, yname))
+
+            cubes = get_objects([(Cube, {'plateifu': plateifu, 'mode': mode})
+                                 for plateifu in coords])
+
+            for c, (x, y) in zip(cubes, coords.values()):
+                if isinstance(c, six.string_types):
+                    self.objects.extend([c] * len(x))
+                else:
+                    self.objects.extend(c[y, x])
         elif tooltype == 'rss':
-            self.objects = [self._get_object(RSS, plateifu=res.plateifu, mode=mode) for res in self.results[0:limit]]
-        elif tooltype == 'modelcube':
+            self.objects = get_objects([(RSS, {'plateifu': res.plateifu, 'mode': mode})
+                                        for res in rows])
 
-            isbin = 'bintype.name' in paramlist
-            istemp = 'template.name' in paramlist
-            self.objects = []
+    @staticmethod
+    def _get_executor(executor, n_workers, mode):
+        ''' Returns an executor for the requested parallelism, or None to run serially '''
 
-            assert self.release != 'MPL-4', "ModelCubes require a release of MPL-5 and up"
+        if executor is None:
+            if not n_workers or n_workers <= 1:
+                return None
+            uses_files = mode == 'local' and not (marvin.marvindb and marvin.marvindb.isdbconnected)
+            executor = 'process' if uses_files else 'thread'
 
-            for res in self.results[0:limit]:
-                mapkwargs = {'mode': mode, 'plateifu': res.plateifu}
+        if executor == 'thread':
+            return concurrent.futures.ThreadPoolExecutor(max_workers=n_workers)
+        elif executor == 'process':
+            return concurrent.futures.ProcessPoolExecutor(max_workers=n_workers)
+        elif isinstance(executor, concurrent.futures.Executor):
+            return executor
 
-                if isbin:
-                    binval = res.bintype_name
-                    mapkwargs['bintype'] = binval
+        raise MarvinError('executor must be "thread", "process", or a concurrent.futures.Executor')
 
-                if istemp:
-                    tempval = res.template_name
-                    mapkwargs['template_kin'] = tempval
+    def _get_objects(self, specs, mode='auto', n_workers=None, executor=None, progress=False):
+        ''' Creates the Marvin objects for a list of (class, kwargs), preserving their order
+
+        Identical specifications are only instantiated once.  If ``n_workers`` or
+        ``executor`` are set, the objects are created in parallel.
+
+        '''
+
+        keys = [(obj.__name__, tuple(sorted(kwargs.items()))) for obj, kwargs in specs]
+        unique = OrderedDict()
+        for key, spec in zip(keys, specs):
+            unique.setdefault(key, spec)
+
+        pool = self._get_executor(executor, n_workers, mode)
+        total = len(unique)
+
+        if pool is None:
+            instances = []
+            for obj, kwargs in unique.values():
+                instances.append(self._get_object(obj, **kwargs))
+                if progress:
+                    print('Created {0}/{1} objects'.format(len(instances), total), end='\r')
+        else:
+            try:
+                futures = [pool.submit(self._get_object, obj, **kwargs)
+                           for obj, kwargs in unique.values()]
+                if progress:
+                    for ii, __ in enumerate(concurrent.futures.as_completed(futures)):
+                        print('Created {0}/{1} objects'.format(ii + 1, total), end='\r')
+                instances = [future.result() for future in futures]
+            finally:
+                # only shut down the pools we have created
+                if pool is not executor:
+                    pool.shutdown()
+
+        if progress:
+            print()
+
+        created = dict(zip(unique.keys(), instances))
 
-                self.objects.append(self._get_object(ModelCube, **mapkwargs))
+        return [created[key] for key in keys]
 
     @staticmethod
     def _get_object(obj, **kwargs):
@@ -1581,8 +1866,8 @@ class Results(object):
             x_data = self.getListOf(x_name, return_all=True)
             y_data = self.getListOf(y_name, return_all=True)
         else:
-            x_data = self.results[x_name]
-            y_data = self.results[y_name]
+            x_data = self.getListOf(x_name, to_ndarray=self.columnar)
+            y_data = self.getListOf(y_name, to_ndarray=self.columnar)
 
         with turn_off_ion(show_plot=show_plot):
             output = marvin.utils.plot.scatter.plot(x_data, y_data, xlabel=x_col, ylabel=y_col, **kwargs)
@@ -1645,7 +1930,7 @@ class Results(object):
         if self.count != self.totalcount:
             data = self.getListOf(name, return_all=True)
         else:
-            data = self.results[name]
+            data = self.getListOf(name, to_ndarray=self.columnar)
 
         # xhist, fig, ax_hist_x = output
         with turn_off_ion(show_plot=show_plot):
@@ -203,7 +203,7 @@ class RSS(MarvinToolsClass, NSAMixIn, list):
             assert isinstance(data, fits.HDUList), 'data is not an HDUList object'
         else:
             try:
-                self.data = fits.open(self.filename)
+                self._open_file(fits.open)
             except (IOError, OSError) as err:
                 raise OSError('filename {0} cannot be found: {1}'.format(self.filename, err))
 
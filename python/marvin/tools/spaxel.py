@@ -12,6 +12,7 @@
 
 from __future__ import absolute_import, division, print_function
 
+import collections
 import inspect
 import itertools
 import warnings
@@ -34,6 +35,11 @@ from marvin.utils.general.structs import FuzzyDict
 breadcrumb = MarvinBreadCrumb()
 
 
+#: Arrays for a quantity in a `.SpaxelBlock`. The first axis runs over spaxels.
+SpaxelBlockQuantity = collections.namedtuple('SpaxelBlockQuantity',
+                                             ['value', 'ivar', 'mask', 'std'])
+
+
 class DataModel(object):
     """A single object that holds the DRP and DAP datamodel."""
 
@@ -286,6 +292,11 @@ class Spaxel(object):
         for tool in ['cube', 'maps', 'modelcube']:
             self._load_tool(tool, force=(force is not None and force == tool))
 
+        self._finalise_load()
+
+    def _finalise_load(self):
+        """Sets the coordinates, versions, and datamodel once the quantities are loaded."""
+
         self._set_radec()
         self.loaded = True
 
@@ -382,3 +393,294 @@ class Spaxel(object):
             qual_flags.append(self.datamodel.dap.bitmasks['MANGA_DAPQUAL'])
 
         return qual_flags
+
+
+class SpaxelBlock(object):
+    """An array-backed collection of spaxels extracted in a single pass.
+
+    Instead of instantiating one `.Spaxel` per set of coordinates, a
+    `.SpaxelBlock` stores the quantities for all the requested spaxels as
+    arrays in which the first axis runs over the spaxels. Each datacube in the
+    `~marvin.tools.cube.Cube` and each model in the
+    `~marvin.tools.modelcube.ModelCube` is stored as a `.SpaxelBlockQuantity`
+    of ``(N, nwave)`` arrays, while the `~marvin.tools.maps.Maps` properties
+    are stored as ``(N, nprop)`` arrays, with one column per property.
+
+    The arrays are filled with a single fancy-indexing pass per extension.
+    `.Spaxel` objects are only created when the block is indexed or iterated
+    over, and are cached after that.
+
+    A `.SpaxelBlock` is normally created by calling ``getSpaxels`` on a
+    `~marvin.tools.cube.Cube`, `~marvin.tools.maps.Maps`, or
+    `~marvin.tools.modelcube.ModelCube`.
+
+    Parameters:
+        x,y (array):
+            The 0-indexed ``x`` and ``y`` coordinates of the spaxels.
+        cube (`~marvin.tools.cube.Cube` or None):
+            The cube from which the DRP quantities will be extracted.
+        maps (`~marvin.tools.maps.Maps` or None):
+            The maps from which the DAP properties will be extracted.
+        modelcube (`~marvin.tools.modelcube.ModelCube` or None):
+            The model cube from which the DAP models will be extracted.
+
+    Attributes:
+        cube_quantities (`~marvin.utils.general.structs.FuzzyDict`):
+            A dictionary of `.SpaxelBlockQuantity` for each datacube and
+            spectrum in the `~marvin.tools.cube.Cube`. Spectra that do not
+            depend on the spaxel are stored once, as 1D arrays.
+        maps_quantities (`.SpaxelBlockQuantity` or None):
+            The ``(N, nprop)`` value, ivar, and mask arrays for all the
+            `~marvin.tools.maps.Maps` properties. Properties without ivar
+            or mask have ``NaN`` and ``0`` in the corresponding columns.
+        maps_columns (list):
+            The full names of the properties in ``maps_quantities``, in
+            column order.
+        modelcube_quantities (`~marvin.utils.general.structs.FuzzyDict`):
+            As ``cube_quantities`` for the models in the
+            `~marvin.tools.modelcube.ModelCube`.
+
+    Example:
+
+        >>> cube = Cube(plateifu='8485-1901')
+        >>> block = cube.getSpaxels(x=[10, 11, 12], y=[15, 15, 15], xyorig='lower')
+        >>> block.flux.value.shape
+        (3, 4563)
+        >>> block[0]
+        <Marvin Spaxel (plateifu=8485-1901, x=10, y=15; x_cen=-7, y_cen=-2, loaded=cube)>
+
+    """
+
+    def __init__(self, x, y, cube=None, maps=None, modelcube=None):
+
+        if cube is None and maps is None and modelcube is None:
+            raise MarvinError('no inputs defined.')
+
+        self.x = np.atleast_1d(np.asarray(x, dtype=int))
+        self.y = np.atleast_1d(np.asarray(y, dtype=int))
+
+        assert self.x.ndim == 1 and self.x.shape == self.y.shape, \
+            'x and y must be 1D arrays of the same size.'
+
+        self._cube = cube
+        self._maps = maps
+        self._modelcube = modelcube
+
+        for attr in ['mangaid', 'plateifu', 'release', 'bintype', 'template']:
+            value = getattr(cube, attr, None) or \
+                getattr(maps, attr, None) or \
+                getattr(modelcube, attr, None)
+            setattr(self, attr, value)
+
+        self.cube_quantities = FuzzyDict({})
+        self.maps_quantities = None
+        self.maps_columns = []
+        self.modelcube_quantities = FuzzyDict({})
+
+        if cube is not None:
+            self.cube_quantities = cube._get_spaxel_block_quantities(self.x, self.y)
+
+        if maps is not None:
+            self.maps_columns, self.maps_quantities = \
+                maps._get_spaxel_block_quantities(self.x, self.y)
+
+        if modelcube is not None:
+            self.modelcube_quantities = modelcube._get_spaxel_block_quantities(self.x, self.y)
+
+        # Spaxels that have already been created by indexing the block.
+        self._spaxels = {}
+
+    def __repr__(self):
+
+        tools = np.array(['cube', 'maps', 'modelcube'])
+        load_idx = np.where([self._cube is not None, self._maps is not None,
+                             self._modelcube is not None])[0]
+
+        return ('<Marvin SpaxelBlock (plateifu={0.plateifu}, n_spaxels={1}, '
+                'loaded={2})>'.format(self, len(self), '/'.join(tools[load_idx])))
+
+    def __len__(self):
+
+        return len(self.x)
+
+    def __getattr__(self, value):
+
+        _getattr = super(SpaxelBlock, self).__getattribute__
+
+        for tool_quantity_dict in ['cube_quantities', 'modelcube_quantities']:
+            if value in _getattr(tool_quantity_dict):
+                return _getattr(tool_quantity_dict)[value]
+
+        if value in _getattr('maps_columns'):
+            return self.get_property(value)
+
+        return _getattr(value)
+
+    def __dir__(self):
+
+        class_members = list(list(zip(*inspect.getmembers(self.__class__)))[0])
+        instance_attr = list(self.__dict__.keys())
+
+        items = list(self.cube_quantities.keys()) + list(self.modelcube_quantities.keys())
+        items += self.maps_columns + class_members + instance_attr
+
+        return sorted(items)
+
+    def __getitem__(self, idx):
+
+        if isinstance(idx, slice):
+            return [self[ii] for ii in range(*idx.indices(len(self)))]
+
+        idx = int(idx)
+        if idx < 0:
+            idx += len(self)
+
+        if idx < 0 or idx >= len(self):
+            raise IndexError('spaxel index out of range.')
+
+        if idx not in self._spaxels:
+            self._spaxels[idx] = self._create_spaxel(idx)
+
+        return self._spaxels[idx]
+
+    def __iter__(self):
+
+        for idx in range(len(self)):
+            yield self[idx]
+
+    def get_property(self, property_name):
+        """Returns a `.SpaxelBlockQuantity` with the ``(N,)`` columns for a property.
+
+        Parameters:
+            property_name (str or `~marvin.utils.datamodel.dap.Property`):
+                The full name of the property (e.g.,
+                ``'emline_gflux_ha_6564'``). Fuzzy matching is used if the
+                name is not an exact match.
+
+        """
+
+        if self.maps_quantities is None:
+            raise MarvinError('this SpaxelBlock has not been loaded with a Maps.')
+
+        property_name = str(property_name)
+        if property_name not in self.maps_columns:
+            property_name = self._maps.datamodel[property_name].full()
+
+        column = self.maps_columns.index(property_name)
+
+        return SpaxelBlockQuantity(value=self.maps_quantities.value[:, column],
+                                   ivar=self.maps_quantities.ivar[:, column],
+                                   mask=self.maps_quantities.mask[:, column],
+                                   std=None)
+
+    def _create_spaxel(self, idx):
+        """Creates a loaded `.Spaxel` from the row ``idx`` of the block."""
+
+        spaxel = Spaxel(self.x[idx], self.y[idx],
+                        cube=self._cube if self._cube is not None else False,
+                        maps=self._maps if self._maps is not None else False,
+                        modelcube=self._modelcube if self._modelcube is not None else False,
+                        lazy=True)
+
+        if self._cube is not None:
+            spaxel.cube_quantities = self._get_cube_row(idx)
+            spaxel._parent_shape = self._cube._shape
+        else:
+            spaxel._cube = None
+
+        if self._maps is not None:
+            spaxel.maps_quantities = self._get_maps_row(idx, spaxel)
+            spaxel._parent_shape = self._maps._shape
+        else:
+            spaxel._maps = None
+
+        if self._modelcube is not None:
+            spaxel.modelcube_quantities = self._get_modelcube_row(idx, spaxel)
+            spaxel._parent_shape = self._modelcube._shape
+        else:
+            spaxel._modelcube = None
+
+        spaxel._finalise_load()
+
+        return spaxel
+
+    def _get_cube_row(self, idx):
+        """Returns the cube quantities for the spaxel in row ``idx``."""
+
+        from marvin.tools.quantities import Spectrum
+
+        cube_quantities = FuzzyDict({})
+        datamodel = self._cube.datamodel
+
+        for dm in datamodel.datacubes + datamodel.spectra:
+
+            block_quantity = self.cube_quantities.get(dm.name, None)
+
+            if block_quantity is None:
+                cube_quantities[dm.name] = None
+                continue
+
+            # Spectra do not depend on the spaxel and are stored only once.
+            is_datacube = dm in datamodel.datacubes
+
+            def _row(array):
+                if array is None:
+                    return None
+                return array[idx] if is_datacube else array
+
+            cube_quantities[dm.name] = Spectrum(_row(block_quantity.value),
+                                                ivar=_row(block_quantity.ivar),
+                                                mask=_row(block_quantity.mask),
+                                                std=_row(block_quantity.std),
+                                                wavelength=self._cube._wavelength,
+                                                unit=dm.unit,
+                                                pixmask_flag=dm.pixmask_flag)
+
+        return cube_quantities
+
+    def _get_maps_row(self, idx, spaxel):
+        """Returns the maps quantities for the spaxel in row ``idx``."""
+
+        from marvin.tools.quantities import AnalysisProperty
+
+        maps_quantities = FuzzyDict({})
+
+        value = self.maps_quantities.value[idx]
+        ivar = self.maps_quantities.ivar[idx]
+        mask = self.maps_quantities.mask[idx]
+
+        for column, dm in enumerate(self._maps.datamodel):
+
+            quantity = AnalysisProperty(value[column], unit=dm.unit,
+                                        ivar=ivar[column] if dm.has_ivar() else None,
+                                        mask=mask[column] if dm.has_mask() else None,
+                                        pixmask_flag=dm.pixmask_flag)
+            quantity._init_bin(spaxel=spaxel, parent=self._maps, datamodel=dm)
+
+            maps_quantities[dm.full()] = quantity
+
+        return maps_quantities
+
+    def _get_modelcube_row(self, idx, spaxel):
+        """Returns the modelcube quantities for the spaxel in row ``idx``."""
+
+        from marvin.tools.quantities import Spectrum
+
+        modelcube_quantities = FuzzyDict({})
+
+        for dm in self._modelcube.datamodel:
+
+            block_quantity = self.modelcube_quantities[dm.full()]
+
+            quantity = Spectrum(block_quantity.value[idx],
+                                ivar=block_quantity.ivar[idx]
+                                if block_quantity.ivar is not None else None,
+                                mask=block_quantity.mask[idx]
+                                if block_quantity.mask is not None else None,
+                                wavelength=self._modelcube._wavelength,
+                                unit=dm.unit, pixmask_flag=dm.pixmask_flag)
+            quantity._init_bin(spaxel=spaxel, parent=self._modelcube, datamodel=dm)
+
+            modelcube_quantities[dm.full()] = quantity
+
+        return modelcube_quantities
@@ -11,9 +11,20 @@
 from __future__ import absolute_import, division, print_function
 
 import copy
+import hashlib
+import os
+import pickle
+import threading
+import warnings
 from collections import OrderedDict
 import six
+import marvin
 from marvin import config
+from marvin.core.exceptions import MarvinUserWarning
+
+
+# Serialises the building of the lazy datamodels.
+_build_lock = threading.RLock()
 
 
 class MetaDataModel(type):
@@ -26,8 +37,104 @@ class MetaDataModel(type):
         return super(MetaDataModel, cls).__new__(cls, name, parents, dict)
 
 
+class LazyDataModel(object):
+    ''' A placeholder for a datamodel that is built the first time it is accessed
+
+    If ``config.datamodel_cache_dir`` is set and ``sources`` are provided, the
+    built datamodel is pickled to that directory and, in later sessions, loaded
+    from it instead of being built again. The snapshot is rebuilt if any of the
+    ``sources`` or the version of Marvin change.
+
+    Parameters:
+        release (str):
+            The release of the datamodel.
+        builder (callable):
+            A function that takes no arguments and returns the datamodel.
+        aliases (list):
+            The aliases of the release.
+        sources (list):
+            The files in which the datamodel is defined.
+        kind (str):
+            The name of the datamodel class, used to name the snapshot.
+
+    '''
+
+    def __init__(self, release, builder, aliases=None, sources=None, kind=None):
+
+        self.release = release
+        self.builder = builder
+        self.aliases = aliases or []
+        self.sources = sources or []
+        self.kind = kind or 'DataModel'
+
+    def __repr__(self):
+
+        return '<LazyDataModel release={0!r}>'.format(self.release)
+
+    @property
+    def snapshot_path(self):
+        ''' The path of the snapshot of the datamodel, or None if disabled '''
+
+        if not config.datamodel_cache_dir or not self.sources:
+            return None
+
+        signature = [marvin.__version__, self.kind, self.release]
+        for source in self.sources:
+            stat = os.stat(source)
+            signature.append((os.path.basename(source), stat.st_mtime, stat.st_size))
+
+        digest = hashlib.md5(repr(signature).encode('utf-8')).hexdigest()
+
+        return os.path.join(os.path.expanduser(config.datamodel_cache_dir),
+                            '{0}-{1}-{2}.pkl'.format(self.kind, self.release, digest))
+
+    def build(self):
+        ''' Returns the datamodel, loading it from its snapshot if possible '''
+
+        path = self.snapshot_path
+
+        if path is not None and os.path.exists(path):
+            try:
+                with open(path, 'rb') as ff:
+                    return pickle.load(ff)
+            except Exception:
+                # The snapshot is corrupt or incompatible. Builds it again.
+                pass
+
+        model = self.builder()
+
+        if path is not None:
+            try:
+                self._save(model, path)
+            except Exception as ee:
+                warnings.warn('cannot save snapshot of datamodel {0!r}: {1}'
+                              .format(self.release, ee), MarvinUserWarning)
+
+        return model
+
+    @staticmethod
+    def _save(model, path):
+
+        dirname = os.path.dirname(path)
+        if not os.path.exists(dirname):
+            os.makedirs(dirname)
+
+        # Writes to a temporary file first, so that concurrent readers never
+        # see a partial snapshot.
+        tmp_path = '{0}.{1}.tmp'.format(path, os.getpid())
+        with open(tmp_path, 'wb') as ff:
+            pickle.dump(model, ff, protocol=pickle.HIGHEST_PROTOCOL)
+        os.rename(tmp_path, path)
+
+
 class DataModelList(six.with_metaclass(MetaDataModel, OrderedDict)):
-    ''' Base Class for a list of DataModels '''
+    ''' Base Class for a list of DataModels
+
+    Datamodels can be added with `.add_lazy_datamodel`, in which case they are
+    only built when first accessed. Accessing a release by name or alias only
+    builds that release; iterating over the values builds all of them.
+
+    '''
 
     def __init__(self, models=None):
 
@@ -48,22 +155,86 @@ class DataModelList(six.with_metaclass(MetaDataModel, OrderedDict)):
     def __getitem__(self, release):
         """Returns model based on release and aliases."""
 
+        key = self._get_key(release)
+        if key is None:
+            raise KeyError('cannot find release or alias {0!r}'.format(release))
+
+        model = dict.__getitem__(self, key)
+
+        if isinstance(model, LazyDataModel):
+            with _build_lock:
+                model = dict.__getitem__(self, key)
+                if isinstance(model, LazyDataModel):
+                    model = model.build()
+                    self[key] = model
+
+        return model
+
+    def _get_key(self, release):
+        """Returns the release for a release or alias, without building the datamodel."""
+
         if release in self.keys():
-            return super(DataModelList, self).__getitem__(release)
+            return release
 
-        for model in self.values():
-            if release in model.aliases:
-                return model
+        # Uses dict.__getitem__ so that the lazy datamodels are not built.
+        for key in self.keys():
+            if release in dict.__getitem__(self, key).aliases:
+                return key
 
-        raise KeyError('cannot find release or alias {0!r}'.format(release))
+        return None
 
     def __contains__(self, value):
-        ''' Returns True based on release/aliases using getitem '''
+        ''' Returns True based on release/aliases '''
+
+        return self._get_key(value) is not None
+
+    def get(self, release, default=None):
+        """Returns model based on release and aliases, or ``default``."""
+
         try:
-            self[value]
-            return True
+            return self[release]
         except KeyError:
-            return False
+            return default
+
+    def values(self):
+        """Returns all the datamodels, building those that are lazy."""
+
+        return [self[key] for key in self.keys()]
+
+    def items(self):
+        """Returns all the releases and datamodels, building those that are lazy."""
+
+        return [(key, self[key]) for key in self.keys()]
+
+    def add_lazy_datamodel(self, release, builder, aliases=None, sources=None):
+        """Adds a datamodel that is only built the first time it is accessed.
+
+        Parameters:
+            release (str):
+                The release of the datamodel. Used as key.
+            builder (callable):
+                A function that takes no arguments and returns the datamodel.
+                The release and aliases of the datamodel must match
+                ``release`` and ``aliases``.
+            aliases (list):
+                The aliases of the release.
+            sources (list):
+                The files in which the datamodel is defined. If set, the
+                datamodel can be saved to ``config.datamodel_cache_dir``
+                (see `.LazyDataModel`).
+
+        """
+
+        lazy = LazyDataModel(release, builder, aliases=aliases, sources=sources,
+                             kind=self.base_name)
+        OrderedDict.__setitem__(self, release, lazy)
+
+    @property
+    def loaded(self):
+        """The releases whose datamodels have been built."""
+
+        return [key for key in self.keys()
+                if not isinstance(dict.__getitem__(self, key), LazyDataModel)]
 
     def __repr__(self):
 
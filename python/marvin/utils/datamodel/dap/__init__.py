@@ -1,13 +1,35 @@
+import glob
+import importlib
+import os
 
 from .base import *
 
-from .MPL4 import MPL4
-from .MPL5 import MPL5
-from .MPL6 import MPL6
-from .MPL7 import MPL7
-from .MPL8 import MPL8
-from .MPL9 import MPL9
 
-# Defines the list of datamodels.
-datamodel = DAPDataModelList([MPL4, MPL5, MPL6, MPL7, MPL8, MPL9])
+# The files that define the datamodels. A change to any of them invalidates the snapshots.
+_sources = sorted(glob.glob(os.path.join(os.path.dirname(__file__), '*.py')))
 
+
+def _get_builder(name):
+    """Returns a function that imports the module ``name`` and returns its datamodel."""
+
+    def builder():
+        return getattr(importlib.import_module('.' + name, __name__), name)
+
+    return builder
+
+
+# Defines the list of datamodels. Each one is built, by importing its module, the first time
+# it is accessed. Note that MPL7 to MPL9 are defined from the previous datamodels.
+datamodel = DAPDataModelList()
+datamodel.add_lazy_datamodel('1.1.1', _get_builder('MPL4'), aliases=['MPL-4', 'MPL4'],
+                             sources=_sources)
+datamodel.add_lazy_datamodel('2.0.2', _get_builder('MPL5'), aliases=['MPL-5', 'MPL5'],
+                             sources=_sources)
+datamodel.add_lazy_datamodel('2.1.3', _get_builder('MPL6'), aliases=['MPL-6', 'MPL6'],
+                             sources=_sources)
+datamodel.add_lazy_datamodel('2.2.1', _get_builder('MPL7'),
+                             aliases=['MPL-7', 'MPL7', 'DR15', 'DR16'], sources=_sources)
+datamodel.add_lazy_datamodel('2.3.0', _get_builder('MPL8'), aliases=['MPL-8', 'MPL8'],
+                             sources=_sources)
+datamodel.add_lazy_datamodel('2.4.1', _get_builder('MPL9'), aliases=['MPL-9', 'MPL9'],
+                             sources=_sources)
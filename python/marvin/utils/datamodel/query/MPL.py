@@ -29,12 +29,22 @@ from .base import QueryDataModel
 def groups():
     return copy.deepcopy(query_params)
 
+
+def build_datamodel(release, aliases, exclude):
+    ''' Builds the query datamodel for a release '''
+    return QueryDataModel(release=release, groups=groups(), aliases=aliases, exclude=exclude,
+                          dapdm=datamodel[release])
+
+
 # exclude the DAP tables
 daptables = ['modelcube', 'modelspaxel', 'redcorr']
 if not config._allow_DAP_queries:
     # add the spaxelprop table to list of things to remove
     daptables.append('spaxelprop')
 
+# The release, aliases, and tables to exclude of each query datamodel. The datamodels
+# are built with build_datamodel.
+
 # MPL-4
 
 # list of tables to exclude
@@ -43,7 +53,7 @@ BASE_EXCLUDE = ['anime', 'catalogue', 'pipeline', 'maskbit', 'hdu', 'query', 'us
 
 EXCLUDE = daptables + ['obsinfo', 'dapall'] + BASE_EXCLUDE
 
-MPL4 = QueryDataModel(release='MPL-4', groups=groups(), aliases=['MPL4', 'v1_5_1', '1.1.1'], exclude=EXCLUDE, dapdm=datamodel['MPL-4'])
+releases = [('MPL-4', ['MPL4', 'v1_5_1', '1.1.1'], EXCLUDE)]
 
 
 # MPL-5
@@ -55,7 +65,7 @@ if not config._allow_DAP_queries:
 dapset = set(daptables) if config._allow_DAP_queries else set()
 EX5 = set(EXCLUDE) - dapset | set(['executionplan', 'current_default'])
 
-MPL5 = QueryDataModel(release='MPL-5', groups=groups(), aliases=['MPL5', 'v2_0_2', '2.0.1'], exclude=EX5, dapdm=datamodel['MPL-5'])
+releases.append(('MPL-5', ['MPL5', 'v2_0_2', '2.0.1'], EX5))
 
 
 # MPL-6
@@ -63,26 +73,24 @@ MPL5 = QueryDataModel(release='MPL-5', groups=groups(), aliases=['MPL5', 'v2_0_2
 # list of tables to exclude
 EX6 = set(EX5) - set(['obsinfo', 'dapall'])
 
-MPL6 = QueryDataModel(release='MPL-6', groups=groups(), aliases=['MPL6', 'v2_3_1', '2.1.3'], exclude=EX6, dapdm=datamodel['MPL-6'])
+releases.append(('MPL-6', ['MPL6', 'v2_3_1', '2.1.3'], EX6))
 
 # MPL-7
 
-MPL7 = QueryDataModel(release='MPL-7', groups=groups(), aliases=['MPL7', 'v2_4_3', '2.2.0'], exclude=EX6, dapdm=datamodel['MPL-7'])
+releases.append(('MPL-7', ['MPL7', 'v2_4_3', '2.2.0'], EX6))
 
 # DR15
 
-DR15 = QueryDataModel(release='DR15', groups=groups(), aliases=['DR15', 'v2_4_3', '2.2.0'], exclude=EX6, dapdm=datamodel['DR15'])
+releases.append(('DR15', ['DR15', 'v2_4_3', '2.2.0'], EX6))
 
 # MPL-8
 
-MPL8 = QueryDataModel(release='MPL-8', groups=groups(),
-                      aliases=['MPL8', 'v2_5_3', '2.3.0'], exclude=EX6, dapdm=datamodel['MPL-8'])
+releases.append(('MPL-8', ['MPL8', 'v2_5_3', '2.3.0'], EX6))
 
 # DR16
 
-DR16 = QueryDataModel(release='DR16', groups=groups(), aliases=['DR15', 'v2_4_3', '2.2.0'], exclude=EX6, dapdm=datamodel['DR16'])
+releases.append(('DR16', ['DR15', 'v2_4_3', '2.2.0'], EX6))
 
 # MPL-9
 
-MPL9 = QueryDataModel(release='MPL-9', groups=groups(),
-                      aliases=['MPL9', 'v2_7_1', '2.4.1'], exclude=EX6, dapdm=datamodel['MPL-9'])
+releases.append(('MPL-9', ['MPL9', 'v2_7_1', '2.4.1'], EX6))
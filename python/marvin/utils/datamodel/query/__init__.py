@@ -10,21 +10,20 @@
 
 from __future__ import print_function, division, absolute_import
 
-from .base import QueryDataModelList
-from .MPL import MPL4, MPL5, MPL6, MPL7, DR15, MPL8, DR16, MPL9
-
-mpllist = [MPL4, MPL5, MPL6, MPL7, DR15, MPL8, DR16, MPL9]
+import functools
 
-# Defines the list of datamodels.
-datamodel = QueryDataModelList(mpllist)
+from .base import QueryDataModelList
+from .MPL import build_datamodel, releases
 
 # Group the datamodel properties for each release
 GRPDICT = {'Emission': 'spaxelprop.emline', 'Kinematic': 'spaxelprop.stellar', 'Spectral Indices': 'spaxelprop.specindex',
            'NSA Catalog': 'nsa.'}
 
-for mpl in mpllist:
-    # if mpl.release not in config._allowed_releases:
-    #     continue
+
+def _build_grouped_datamodel(release, aliases, exclude):
+    ''' Builds the query datamodel for a release and groups its parameters '''
+
+    mpl = build_datamodel(release, aliases, exclude)
 
     mpl.regroup(GRPDICT)
     # add header meta
@@ -42,3 +41,13 @@ for mpl in mpllist:
     # add an misc. group
     mpl.add_group('Other')
     mpl.add_to_group('Other')
+
+    return mpl
+
+
+# Defines the list of datamodels. Each one is built the first time it is accessed.
+datamodel = QueryDataModelList()
+for release, aliases, exclude in releases:
+    datamodel.add_lazy_datamodel(
+        release, functools.partial(_build_grouped_datamodel, release, aliases, exclude),
+        aliases=aliases)
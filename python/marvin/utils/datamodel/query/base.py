@@ -453,15 +453,34 @@ class QueryFuzzyList(FuzzyList):
 
     def __getattr__(self, value):
 
-        mapped_values = [super(QueryFuzzyList, self).__getattribute__('mapper')(item)
-                         for item in self]
-        stripped_values = strip_mapped(self)
+        # Special attributes are never parameters (and are looked up, e.g., when copying).
+        if value.startswith('__') and value.endswith('__'):
+            return super(QueryFuzzyList, self).__getattribute__(value)
+
+        stripped_values = super(QueryFuzzyList, self).__getattribute__('_get_stripped_index')()
 
         if value in stripped_values:
-            return self[mapped_values[stripped_values.index(value)]]
+            return self[stripped_values[value]]
 
         return super(QueryFuzzyList, self).__getattribute__(value)
 
+    def _get_stripped_index(self):
+        ''' Returns a dictionary of the stripped mapped names to the mapped names
+
+        Cached until the list is modified.
+
+        '''
+
+        cache = self._get_cache()
+
+        if 'stripped' not in cache:
+            stripped_values = {}
+            for mapped, stripped in zip(self._get_index()[0], strip_mapped(self)):
+                stripped_values.setdefault(stripped, mapped)
+            cache['stripped'] = stripped_values
+
+        return cache['stripped']
+
     def index(self, value):
         param = self == value
         index = [i for i, item in enumerate(self) if item is param]
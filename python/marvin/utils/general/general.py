@@ -22,16 +22,13 @@ import warnings
 from builtins import range
 from collections import OrderedDict
 from functools import wraps
-from pkg_resources import parse_version
 
-import matplotlib.pyplot as plt
 import numpy as np
-import PIL
+import six
 from astropy import table, wcs
+from astropy.io import fits
 from astropy.units.quantity import Quantity
 from brain.core.exceptions import BrainError
-from flask_jwt_extended import get_jwt_identity
-from scipy.interpolate import griddata
 
 import marvin
 from marvin import log
@@ -60,16 +57,20 @@ except ImportError:
 # General utilities
 __all__ = ('convertCoords', 'parseIdentifier', 'mangaid2plateifu', 'findClosestVector',
            'getWCSFromPng', 'convertImgCoords', 'getSpaxelXY',
-           'downloadList', 'getSpaxel', 'get_drpall_row', 'getDefaultMapPath',
+           'downloadList', 'getSpaxel', 'getSpaxels', 'get_drpall_row', 'getDefaultMapPath',
            'getDapRedux', 'get_nsa_data', '_check_file_parameters',
            'invalidArgs', 'missingArgs', 'getRequiredArgs', 'getKeywordArgs',
            'isCallableWithArgs', 'map_bins_to_column', '_sort_dir',
            'get_dapall_file', 'temp_setattr', 'map_dapall', 'turn_off_ion', 'memory_usage',
            'validate_jwt', 'target_status', 'target_is_observed', 'get_drpall_file',
            'target_is_mastar', 'get_plates', 'get_manga_image', 'check_versions',
-           'get_drpall_table')
+           'get_drpall_table', 'get_drpall_index', 'DrpallIndex', 'mangaids2plateifus',
+           'get_drpall_rows', 'targets_are_mastar', 'LazyTable', 'get_dapall_table',
+           'get_table_memory_usage')
 
 drpTable = {}
+drpFullTable = {}
+dapTable = {}
 
 
 def validate_jwt(f):
@@ -77,6 +78,8 @@ def validate_jwt(f):
 
     @wraps(f)
     def wrapper(*args, **kwargs):
+        from flask_jwt_extended import get_jwt_identity
+
         current_user = get_jwt_identity()
 
         if not current_user:
@@ -143,10 +146,85 @@ def getSpaxel(cube=True, maps=True, modelcube=True,
 
     # TODO: for now let's put these imports here, but we should fix the
     # circular imports soon.
+    import marvin.tools.spaxel
+
+    xx, yy, isScalar = _get_spaxel_indices(cube=cube, maps=maps, modelcube=modelcube,
+                                           x=x, y=y, ra=ra, dec=dec, xyorig=xyorig)
+
+    _spaxels = []
+    for ii in range(len(xx)):
+        _spaxels.append(
+            marvin.tools.spaxel.Spaxel(xx[ii], yy[ii],
+                                       cube=cube, maps=maps, modelcube=modelcube, **kwargs))
+
+    if len(_spaxels) == 1 and isScalar:
+        return _spaxels[0]
+    else:
+        return _spaxels
+
+
+def getSpaxels(cube=None, maps=None, modelcube=None,
+               x=None, y=None, ra=None, dec=None, xyorig=None):
+    """Returns a |spaxelblock| with the spaxels matching certain coordinates.
+
+    Similar to `.getSpaxel` but, instead of instantiating a |spaxel| for
+    each set of coordinates, returns a single |spaxelblock| in which the
+    quantities for all the spaxels are stored as arrays, filled with a single
+    fancy-indexing pass per extension. This function is intended to be called
+    by the ``getSpaxels`` method of :class:`~marvin.tools.cube.Cube`,
+    :class:`~marvin.tools.maps.Maps`, and
+    :class:`~marvin.tools.modelcube.ModelCube`.
+
+    Parameters:
+        cube (:class:`~marvin.tools.cube.Cube` or None)
+            The :class:`~marvin.tools.cube.Cube` from which the DRP quantities
+            will be extracted. If None, no DRP quantities will be extracted.
+        maps (:class:`~marvin.tools.maps.Maps` or None)
+            As ``cube`` but for the :class:`~marvin.tools.maps.Maps`.
+        modelcube (:class:`~marvin.tools.modelcube.ModelCube` or None)
+            As ``cube`` but for the :class:`~marvin.tools.modelcube.ModelCube`.
+        x,y (int or array):
+            The spaxel coordinates relative to ``xyorig``.
+        ra,dec (float or array):
+            The coordinates of the spaxels. The closest spaxels to those
+            coordinates will be returned.
+        xyorig ({'center', 'lower'}):
+            The reference point from which ``x`` and ``y`` are measured.
+            Defaults to ``marvin.config.xyorig``.
+
+    Returns:
+        block (|spaxelblock|):
+            The block of spaxels, in the same order as the input coordinates.
+
+    .. |spaxelblock| replace:: :class:`~marvin.tools.spaxel.SpaxelBlock`
+    .. |spaxel| replace:: :class:`~marvin.tools.spaxel.Spaxel`
+
+    """
+
+    import marvin.tools.spaxel
+
+    assert cube is not None or maps is not None or modelcube is not None, \
+        'Either cube, maps, or modelcube needs to be specified.'
+
+    xx, yy, __ = _get_spaxel_indices(cube=cube or False, maps=maps or False,
+                                     modelcube=modelcube or False,
+                                     x=x, y=y, ra=ra, dec=dec, xyorig=xyorig)
+
+    return marvin.tools.spaxel.SpaxelBlock(xx, yy, cube=cube, maps=maps, modelcube=modelcube)
+
+
+def _get_spaxel_indices(cube=False, maps=False, modelcube=False,
+                        x=None, y=None, ra=None, dec=None, xyorig=None):
+    """Returns the 0-indexed ``x, y`` spaxel coordinates for a set of inputs.
+
+    Shared by `.getSpaxel` and `.getSpaxels`. Returns a tuple with the arrays
+    of ``x`` and ``y`` coordinates and whether the input was a scalar.
+
+    """
+
     import marvin.tools.cube
     import marvin.tools.maps
     import marvin.tools.modelcube
-    import marvin.tools.spaxel
 
     # Checks that the cube and maps data are correct
     assert cube or maps or modelcube, \
@@ -198,19 +276,10 @@ def getSpaxel(cube=True, maps=True, modelcube=True,
         ww = modelcube.wcs if inputMode == 'sky' else None
         cube_shape = modelcube._shape
 
-    iCube, jCube = zip(convertCoords(coords, wcs=ww, shape=cube_shape,
-                                     mode=inputMode, xyorig=xyorig).T)
+    iCube, jCube = convertCoords(coords, wcs=ww, shape=cube_shape,
+                                 mode=inputMode, xyorig=xyorig).T
 
-    _spaxels = []
-    for ii in range(len(iCube[0])):
-        _spaxels.append(
-            marvin.tools.spaxel.Spaxel(jCube[0][ii], iCube[0][ii],
-                                       cube=cube, maps=maps, modelcube=modelcube, **kwargs))
-
-    if len(_spaxels) == 1 and isScalar:
-        return _spaxels[0]
-    else:
-        return _spaxels
+    return jCube, iCube, isScalar
 
 
 def convertCoords(coords, mode='sky', wcs=None, xyorig='center', shape=None):
@@ -343,24 +412,18 @@ def mangaid2plateifu(mangaid, mode='auto', drpall=None, drpver=None):
 
     if mode == 'drpall':
 
-        # Get the drpall table from cache or fresh
-        drpall_table = get_drpall_table(drpver=drpver, drpall=drpall)
-
-        mangaids = np.array([mm.strip() for mm in drpall_table['mangaid']])
-
-        plateifus = drpall_table[np.where(mangaids == mangaid)]
+        # Get the drpall index from cache or fresh
+        plateifus = get_drpall_index(drpver=drpver, drpall=drpall).get_plateifus(mangaid)
 
         if len(plateifus) > 1:
             warnings.warn('more than one plate-ifu found for mangaid={0}. '
                           'Using the one with the highest SN2.'.format(mangaid),
                           MarvinUserWarning)
-            plateifus = plateifus[
-                [np.argmax(plateifus['bluesn2'] + plateifus['redsn2'])]]
 
         if len(plateifus) == 0:
             raise ValueError('no plate-ifus found for mangaid={0}'.format(mangaid))
 
-        return plateifus['plateifu'][0]
+        return plateifus[0]
 
     elif mode == 'db':
 
@@ -421,6 +484,39 @@ def mangaid2plateifu(mangaid, mode='auto', drpall=None, drpver=None):
             'mangaid={0} either local or remotely.'.format(mangaid))
 
 
+def mangaids2plateifus(mangaids, drpall=None, drpver=None):
+    """Return the plate-ifus for a list of mangaids, using the drpall file.
+
+    The bulk version of `mangaid2plateifu` with ``mode='drpall'``. If more
+    than one plate-ifu is available for a mangaid, the one with the higher
+    SN2 is used.
+
+    Parameters:
+        mangaids (list):
+            The mangaids for which the plate-ifus will be returned.
+        drpall (str or None):
+            The path to the drpall file to use. If None, the file in
+            ``config.drpall`` will be used.
+        drpver (str or None):
+            The DRP version to use. If None, the one in ``config.drpver`` will
+            be used.
+
+    Returns:
+        plateifus (list):
+            The plate-ifu for each mangaid, or ``None`` if it is not found.
+
+    """
+
+    index = get_drpall_index(drpver=drpver, drpall=drpall)
+
+    plateifus = []
+    for mangaid in mangaids:
+        mangaid_plateifus = index.get_plateifus(mangaid)
+        plateifus.append(mangaid_plateifus[0] if len(mangaid_plateifus) > 0 else None)
+
+    return plateifus
+
+
 def findClosestVector(point, arr_shape=None, pixel_shape=None, xyorig=None):
     """Find the closest array coordinates from pixel coordinates.
 
@@ -471,6 +567,7 @@ def findClosestVector(point, arr_shape=None, pixel_shape=None, xyorig=None):
     # make 2d array of array indices in absolute or (our) relative coordindates
     arrinds = np.mgrid[x1:x2, y1:y2].swapaxes(0, 2).swapaxes(0, 1)
     # interpolate a new 2d pixel coordinate array
+    from scipy.interpolate import griddata
     final = griddata(points, values, arrinds)
 
     # find minimum array vector closest to input coordinate point
@@ -511,6 +608,7 @@ def getWCSFromPng(filename=None, image=None):
     pngwcs = None
 
     if filename and not image:
+        import PIL.Image
         try:
             image = PIL.Image.open(filename)
         except Exception as e:
@@ -944,19 +1042,37 @@ def get_drpall_file(drpall=None, drpver=None):
 def get_drpall_row(plateifu, drpver=None, drpall=None):
     """Returns a dictionary from drpall matching the plateifu."""
 
-    # get the drpall table
-    drpall_table = get_drpall_table(drpver=drpver, drpall=drpall, hdu='MANGA')
-    in_table = plateifu in drpall_table['plateifu']
-    # check the mastar extension
-    if not in_table:
-        drpall_table = get_drpall_table(drpver=drpver, drpall=drpall, hdu='MASTAR')
-        in_table = plateifu in drpall_table['plateifu']
-        if not in_table:
-            raise ValueError('No results found for {0} in drpall table'.format(plateifu))
+    # find the row in the drpall index
+    location = get_drpall_index(drpver=drpver, drpall=drpall).locate(plateifu)
+    if location is None:
+        raise ValueError('No results found for {0} in drpall table'.format(plateifu))
+
+    hdu, row = location
+    drpall_table = get_drpall_table(drpver=drpver, drpall=drpall, hdu=hdu, lazy=True)
+
+    return drpall_table[row]
+
+
+def get_drpall_rows(plateifus, drpver=None, drpall=None):
+    """Returns a list of the rows from drpall matching a list of plateifus.
+
+    Plate-ifus not found in the drpall file return ``None``.
+
+    """
 
-    row = drpall_table[drpall_table['plateifu'] == plateifu]
+    index = get_drpall_index(drpver=drpver, drpall=drpall)
 
-    return row[0]
+    rows = []
+    for plateifu in plateifus:
+        location = index.locate(plateifu)
+        if location is None:
+            rows.append(None)
+        else:
+            hdu, row = location
+            drpall_table = get_drpall_table(drpver=drpver, drpall=drpall, hdu=hdu, lazy=True)
+            rows.append(drpall_table[row])
+
+    return rows
 
 
 def _db_row_to_dict(row, remove_columns=False):
@@ -1376,6 +1492,24 @@ def get_dapall_file(drpver, dapver):
     return dapall_path
 
 
+def get_dapall_table(drpver, dapver):
+    """Returns the DAPall table for ``(drpver, dapver)`` as a `LazyTable`.
+
+    The table is cached, and its columns are only read when accessed.
+
+    """
+
+    if (drpver, dapver) not in dapTable:
+
+        dapall_path = get_dapall_file(drpver, dapver)
+        if not dapall_path or not os.path.exists(dapall_path):
+            raise MarvinError('cannot find DAPall file in the system.')
+
+        dapTable[(drpver, dapver)] = LazyTable(dapall_path, hdu=-1)
+
+    return dapTable[(drpver, dapver)]
+
+
 @contextlib.contextmanager
 def turn_off_ion(show_plot=True):
     ''' Turns off the Matplotlib plt interactive mode
@@ -1396,6 +1530,8 @@ def turn_off_ion(show_plot=True):
 
     '''
 
+    import matplotlib.pyplot as plt
+
     plt_was_interactive = plt.isinteractive()
     if not show_plot and plt_was_interactive:
         plt.ioff()
@@ -1664,11 +1800,193 @@ def target_is_mastar(plateifu, drpver=None, drpall=None):
 
     '''
 
-    row = get_drpall_row(plateifu, drpver=drpver, drpall=drpall)
-    return row['srvymode'] == 'APOGEE lead'
+    return get_drpall_index(drpver=drpver, drpall=drpall).is_mastar(plateifu)
 
 
-def get_drpall_table(drpver=None, drpall=None, hdu='MANGA'):
+def targets_are_mastar(plateifus, drpver=None, drpall=None):
+    ''' Check if a list of targets are bright-time MaStar targets
+
+    The bulk version of :func:`target_is_mastar`.
+
+    Parameters:
+        plateifus (list):
+            The plateifus of the targets
+        drpver (str):
+            The drpver version to check against
+        drpall (str):
+            The drpall file path
+
+    Returns:
+        A list of booleans, True for the MaStar targets
+
+    '''
+
+    index = get_drpall_index(drpver=drpver, drpall=drpall)
+    return [index.is_mastar(plateifu) for plateifu in plateifus]
+
+
+class LazyTable(object):
+    ''' A FITS binary table whose columns are only read when accessed
+
+    The file is opened memory-mapped the first time it is needed, and each
+    column is copied into memory only when it is accessed, as an astropy
+    ``Column``. Loaded columns are shared between all the `LazyTable`
+    instances of identical tables (same ``DATASUM``, or same file if the
+    table has no checksum), e.g., the drpall files of releases with the same
+    DRP version. Indexing with an integer, slice, or array returns the
+    selected rows as an astropy ``Row`` or ``Table``.
+
+    Parameters:
+        path (str):
+            The path to the FITS file.
+        hdu (str or int):
+            The name or index of the binary table HDU.
+
+    '''
+
+    def __init__(self, path, hdu=1):
+
+        self.path = path
+        self.hdu = hdu
+        self._hdulist = None
+        self._key = None
+
+    def __repr__(self):
+        return '<LazyTable (path={0!r}, hdu={1!r}, n_loaded={2}/{3})>'.format(
+            self.path, self.hdu, len(self.loaded_columns), len(self.colnames))
+
+    @property
+    def hdulist(self):
+        ''' The memory-mapped ``HDUList`` of the file '''
+
+        if self._hdulist is None:
+            self._hdulist = fits.open(self.path, memmap=True)
+
+        return self._hdulist
+
+    @property
+    def header(self):
+        ''' The header of the table HDU '''
+
+        return self.hdulist[self.hdu].header
+
+    @property
+    def colnames(self):
+        ''' The names of the columns, read from the header '''
+
+        return self.hdulist[self.hdu].columns.names
+
+    @property
+    def key(self):
+        ''' The key identifying the contents of the table '''
+
+        if self._key is None:
+            header = self.header
+            if header.get('DATASUM', None):
+                self._key = ('DATASUM', header['DATASUM'], header['NAXIS1'], header['NAXIS2'])
+            else:
+                stat = os.stat(self.path)
+                self._key = (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime, self.hdu)
+
+        return self._key
+
+    @property
+    def loaded_columns(self):
+        ''' The names of the columns already loaded in memory '''
+
+        return [name for name in self.colnames if (self.key, name) in _tableColumns]
+
+    @property
+    def nbytes(self):
+        ''' The memory used by the loaded columns, in bytes '''
+
+        return sum(_tableColumns[(self.key, name)].nbytes for name in self.loaded_columns)
+
+    def __len__(self):
+        return self.header['NAXIS2']
+
+    def __contains__(self, name):
+        return name in self.colnames
+
+    def __getitem__(self, item):
+
+        if isinstance(item, six.string_types):
+            return self._get_column(item)
+
+        data = self.hdulist[self.hdu].data
+
+        if isinstance(item, (int, np.integer)):
+            item = range(len(self))[item]
+            return table.Table(data[item:item + 1])[0]
+
+        return table.Table(data[item])
+
+    def _get_column(self, name):
+        ''' Returns a column, loading it if needed '''
+
+        # Column names in FITS files are case insensitive
+        if name not in self.colnames:
+            names = [colname for colname in self.colnames if colname.lower() == name.lower()]
+            if len(names) == 0:
+                raise KeyError(name)
+            name = names[0]
+
+        key = (self.key, name)
+
+        if key not in _tableColumns:
+            values = np.array(self.hdulist[self.hdu].data[name])
+            _tableColumns[key] = table.Column(values, name=name)
+            log.debug('loaded column {0!r} of {1} ({2} bytes)'.format(
+                name, os.path.basename(self.path), values.nbytes))
+
+        return _tableColumns[key]
+
+    def record(self, row):
+        ''' Returns a row as a ``FITS_record``, without loading any column '''
+
+        return self.hdulist[self.hdu].data[row]
+
+    def to_table(self, columns=None):
+        ''' Returns an astropy ``Table`` with some or all the columns '''
+
+        columns = columns if columns is not None else self.colnames
+
+        return table.Table([self[name] for name in columns])
+
+    def close(self):
+        ''' Closes the file. The loaded columns are kept in memory '''
+
+        if self._hdulist is not None:
+            self._hdulist.close()
+            self._hdulist = None
+
+
+_tableColumns = {}
+
+
+def get_table_memory_usage():
+    ''' Returns the memory used by the loaded drpall and DAPall columns
+
+    Returns:
+        A dictionary with the number of bytes of the columns loaded for the
+        drpall table of each ``drpver`` and the DAPall table of each
+        ``(drpver, dapver)``. Columns shared by several releases are counted
+        for each of them.
+
+    '''
+
+    usage = {'drpall': {}, 'dapall': {}}
+
+    for drpver, tables in drpTable.items():
+        usage['drpall'][drpver] = sum(lazy_table.nbytes for lazy_table in tables.values())
+
+    for versions, lazy_table in dapTable.items():
+        usage['dapall'][versions] = lazy_table.nbytes
+
+    return usage
+
+
+def get_drpall_table(drpver=None, drpall=None, hdu='MANGA', lazy=False):
     ''' Gets the drpall table
 
     Gets the drpall table either from cache or loads it. For releases
@@ -1683,9 +2001,13 @@ def get_drpall_table(drpver=None, drpall=None, hdu='MANGA'):
             The full path to the drpall table. Defaults to current marvin release.
         hdu (str):
             The name of the HDU to read in.  Default is 'MANGA'
+        lazy (bool):
+            If True, returns a `LazyTable`, whose columns are read from the
+            memory-mapped file only when accessed. Default is False.
 
     Returns:
-        An Astropy Table
+        An astropy ``Table`` with the full drpall table, or a `LazyTable`
+        if ``lazy=True``
     '''
 
     from marvin import config
@@ -1703,16 +2025,230 @@ def get_drpall_table(drpver=None, drpall=None, hdu='MANGA'):
     if drpver not in drpTable:
         drpTable[drpver] = {}
 
-    # check for hdu
+    # check for hdu. Columns are only read when accessed.
     hduext = hdu if check_versions(drpver, 'v2_5_3') else 'MANGA'
-    if hdu not in drpTable[drpver]:
+    if hduext not in drpTable[drpver]:
         drpall = drpall if drpall else config._getDrpAllPath(drpver=drpver)
-        data = {hduext: table.Table.read(drpall, hdu=hduext)}
-        drpTable[drpver].update(data)
+        drpTable[drpver][hduext] = LazyTable(drpall, hdu=hduext)
 
     drpall_table = drpTable[drpver][hduext]
 
-    return drpall_table
+    if lazy:
+        return drpall_table
+
+    # the full table is built from the loaded columns the first time it is requested
+    if (drpver, hduext) not in drpFullTable:
+        drpFullTable[(drpver, hduext)] = drpall_table.to_table()
+
+    return drpFullTable[(drpver, hduext)]
+
+
+class DrpallIndex(object):
+    ''' An index of the rows of a drpall file by plate-ifu and mangaid
+
+    Maps each plate-ifu and each mangaid to its row in the drpall table, so
+    that targets can be looked up without scanning the table. For MPL-8 and
+    up, plate-ifus are looked up first in the MANGA extension and then in the
+    MASTAR extension; mangaids are only looked up in the MANGA extension.
+
+    The index keeps the plate-ifu, mangaid, SN2, and MaStar flag of each row,
+    and can be saved to and loaded from a ``.npz`` file (see
+    ``config.drpall_index_dir``) so that `mangaid2plateifu` and
+    `target_is_mastar` do not need to read the drpall file at all.
+
+    Parameters:
+        columns (dict):
+            A dictionary, keyed by HDU name, of dictionaries with the
+            ``plateifu``, ``mangaid``, ``sn2``, and ``is_mastar`` arrays of
+            each HDU.
+        drpver (str):
+            The DRP version of the drpall file.
+        drpall (str):
+            The path to the drpall file.
+
+    '''
+
+    _columns = ['plateifu', 'mangaid', 'sn2', 'is_mastar']
+
+    def __init__(self, columns, drpver=None, drpall=None):
+
+        self.drpver = drpver
+        self.drpall = drpall
+        self.columns = columns
+
+        self._plateifu = {}
+        self._mangaid = {}
+
+        for hdu in reversed(list(columns)):
+            for row, plateifu in enumerate(columns[hdu]['plateifu']):
+                self._plateifu[plateifu] = (hdu, row)
+
+        if 'MANGA' in columns:
+            for row, mangaid in enumerate(columns['MANGA']['mangaid']):
+                self._mangaid.setdefault(mangaid, []).append(row)
+
+    def __repr__(self):
+        return '<DrpallIndex (drpver={0!r}, n_plateifus={1})>'.format(self.drpver,
+                                                                      len(self._plateifu))
+
+    def __contains__(self, plateifu):
+        return plateifu in self._plateifu
+
+    @classmethod
+    def from_table(cls, drpver, drpall):
+        ''' Builds the index from the drpall table '''
+
+        hdus = ['MANGA', 'MASTAR'] if check_versions(drpver, 'v2_5_3') else ['MANGA']
+
+        columns = OrderedDict()
+        for hdu in hdus:
+            drpall_table = get_drpall_table(drpver=drpver, drpall=drpall, hdu=hdu, lazy=True)
+            sn2 = np.asarray(drpall_table['bluesn2'], dtype=np.float64) + \
+                np.asarray(drpall_table['redsn2'], dtype=np.float64)
+            if 'srvymode' in drpall_table.colnames:
+                is_mastar = np.char.strip(np.asarray(drpall_table['srvymode']).astype(str))
+                is_mastar = is_mastar == 'APOGEE lead'
+            else:
+                is_mastar = np.zeros(len(drpall_table), dtype=bool)
+            columns[hdu] = {
+                'plateifu': np.char.strip(np.asarray(drpall_table['plateifu']).astype(str)),
+                'mangaid': np.char.strip(np.asarray(drpall_table['mangaid']).astype(str)),
+                'sn2': sn2,
+                'is_mastar': is_mastar}
+
+        return cls(columns, drpver=drpver, drpall=drpall)
+
+    @staticmethod
+    def _file_signature(drpall):
+        ''' Returns the modification time and size of the drpall file '''
+
+        stat = os.stat(drpall)
+        return np.array([stat.st_mtime, stat.st_size], dtype=np.float64)
+
+    def save(self, path):
+        ''' Saves the index to a ``.npz`` file '''
+
+        arrays = {'hdus': np.array(list(self.columns)),
+                  'signature': self._file_signature(self.drpall)}
+        for hdu in self.columns:
+            for column in self._columns:
+                arrays['{0}_{1}'.format(hdu, column)] = self.columns[hdu][column]
+
+        dirname = os.path.dirname(path)
+        if dirname and not os.path.exists(dirname):
+            os.makedirs(dirname)
+
+        # Writes to a temporary file first, so that concurrent readers never
+        # see a partial index.
+        tmp_path = '{0}.{1}.tmp.npz'.format(path, os.getpid())
+        np.savez(tmp_path, **arrays)
+        os.rename(tmp_path, path)
+
+    @classmethod
+    def load(cls, path, drpver, drpall):
+        ''' Loads an index saved with `.save`
+
+        Returns ``None`` if the index does not exist or the drpall file has
+        changed since it was saved.
+
+        '''
+
+        if not os.path.exists(path):
+            return None
+
+        with np.load(path, allow_pickle=False) as data:
+            if not np.array_equal(data['signature'], cls._file_signature(drpall)):
+                return None
+            columns = OrderedDict(
+                (hdu, {column: data['{0}_{1}'.format(hdu, column)] for column in cls._columns})
+                for hdu in data['hdus'].tolist())
+
+        return cls(columns, drpver=drpver, drpall=drpall)
+
+    def locate(self, plateifu):
+        ''' Returns the HDU and row of ``plateifu``, or ``None`` if not found '''
+
+        return self._plateifu.get(plateifu, None)
+
+    def get_plateifus(self, mangaid):
+        ''' Returns the plate-ifus for ``mangaid``, sorted by decreasing SN2 '''
+
+        rows = self._mangaid.get(mangaid.strip(), [])
+        columns = self.columns['MANGA']
+
+        rows = sorted(rows, key=lambda row: columns['sn2'][row], reverse=True)
+
+        return [columns['plateifu'][row] for row in rows]
+
+    def is_mastar(self, plateifu):
+        ''' Returns True if ``plateifu`` is a MaStar target '''
+
+        location = self.locate(plateifu)
+        if location is None:
+            raise ValueError('No results found for {0} in drpall table'.format(plateifu))
+
+        hdu, row = location
+
+        return bool(self.columns[hdu]['is_mastar'][row])
+
+
+drpIndex = {}
+
+
+def get_drpall_index(drpver=None, drpall=None):
+    ''' Gets the index of the drpall file
+
+    Returns the `DrpallIndex` for a drpall file, building it only once per
+    session. If ``config.drpall_index_dir`` is set, the index is loaded from
+    that directory, or built and saved there if it does not exist or the
+    drpall file has changed.
+
+    Parameters:
+        drpver (str):
+            The DRP release version to load.  Defaults to current marvin release
+        drpall (str):
+            The full path to the drpall table. Defaults to current marvin release.
+
+    Returns:
+        A `DrpallIndex`
+
+    '''
+
+    from marvin import config
+
+    config_drpver, __ = config.lookUpVersions()
+    drpver = drpver if drpver else config_drpver
+    drpall = drpall if drpall else config._getDrpAllPath(drpver=drpver)
+
+    key = (drpver, os.path.realpath(drpall))
+    if key in drpIndex:
+        return drpIndex[key]
+
+    get_drpall_file(drpall=drpall, drpver=drpver)
+
+    index = None
+    path = None
+
+    if config.drpall_index_dir:
+        path = os.path.join(config.drpall_index_dir, '{0}-{1}.npz'.format(
+            os.path.splitext(os.path.basename(drpall))[0], drpver))
+        try:
+            index = DrpallIndex.load(path, drpver, drpall)
+        except Exception as ee:
+            warnings.warn('failed loading the drpall index: {0}'.format(ee), MarvinUserWarning)
+
+    if index is None:
+        index = DrpallIndex.from_table(drpver, drpall)
+        if path is not None:
+            try:
+                index.save(path)
+            except (IOError, OSError) as ee:
+                warnings.warn('failed saving the drpall index: {0}'.format(ee),
+                              MarvinUserWarning)
+
+    drpIndex[key] = index
+
+    return index
 
 
 def get_plates(drpver=None, drpall=None, release=None):
@@ -1735,7 +2271,7 @@ def get_plates(drpver=None, drpall=None, release=None):
     if release:
         drpver, __ = marvin.config.lookUpVersions(release)
 
-    drpall_table = get_drpall_table(drpver=drpver, drpall=drpall)
+    drpall_table = get_drpall_table(drpver=drpver, drpall=drpall, lazy=True)
     plates = list(set(drpall_table['plate']))
     return plates
 
@@ -1755,6 +2291,8 @@ def check_versions(version1, version2):
         A boolean indicating if version1 is >= version2
     '''
 
+    from pkg_resources import parse_version
+
     return parse_version(version1) >= parse_version(version2)
 
 
@@ -19,24 +19,99 @@ import marvin
 from marvin.extern.yanny import yanny
 
 
-# Stores the maskbits yanny file structure so that we don't need to open it more than once.
-_maskbits_from_yanny = None
+# Stores the compiled maskbit schemas so that we don't need to load them more than once.
+_maskbit_schemas = None
+
+# Interned MaskbitSchema objects, by flag name.
+_schemas = {}
+
+
+def _compile_maskbit_schemas(path_par, path_npz=None):
+    """Parses the yanny file with the maskbit schemas and compiles them to arrays.
+
+    Parameters:
+        path_par (str):
+            The path to the ``sdssMaskbits.par`` file.
+        path_npz (str or None):
+            If set, the path of the ``.npz`` file to which the compiled schemas
+            are saved, along with the modification time and size of
+            ``path_par``.
+
+    Returns:
+        dict: ``flag``, ``bit``, ``label``, and ``description`` arrays.
+    """
+
+    maskbits = yanny(path_par, np=True)['MASKBITS']
+
+    schemas = {'flag': np.array(maskbits['flag'], dtype=str),
+               'bit': np.array(maskbits['bit'], dtype=np.int64),
+               'label': np.array(maskbits['label'], dtype=str),
+               'description': np.array(maskbits['description'], dtype=str)}
+
+    if path_npz is not None:
+        stat = os.stat(path_par)
+        signature = np.array([stat.st_mtime, stat.st_size], dtype=np.float64)
+
+        # Writes to a temporary file first, so that concurrent readers never
+        # see a partial file.
+        tmp_path = '{0}.{1}.tmp.npz'.format(path_npz, os.getpid())
+        try:
+            np.savez_compressed(tmp_path, signature=signature, **schemas)
+            os.rename(tmp_path, path_npz)
+        except (IOError, OSError):
+            # The package data may not be writable. The schemas are then
+            # compiled once per session.
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    return schemas
+
+
+def _load_compiled_maskbit_schemas(path_par, path_npz):
+    """Loads the compiled maskbit schemas.
+
+    Returns ``None`` if ``path_npz`` does not exist or ``path_par`` has been
+    modified since it was compiled.
+
+    """
+
+    if not os.path.exists(path_npz):
+        return None
+
+    stat = os.stat(path_par)
+
+    try:
+        with np.load(path_npz, allow_pickle=False) as data:
+            if not np.array_equal(data['signature'], [stat.st_mtime, stat.st_size]):
+                return None
+            return {key: data[key] for key in ['flag', 'bit', 'label', 'description']}
+    except Exception:
+        return None
 
 
 def _read_maskbit_schemas():
-    """Read all available SDSS maskbit schemas from yanny file.
+    """Read all available SDSS maskbit schemas.
+
+    The schemas are read from ``data/sdssMaskbits.npz``, which is compiled
+    from the ``data/sdssMaskbits.par`` yanny file the first time it is needed
+    and again whenever the yanny file changes.
 
     Returns:
-        Record Array: all bits for all schemas.
+        dict: ``flag``, ``bit``, ``label``, and ``description`` arrays with
+        all bits for all schemas.
     """
 
-    global _maskbits_from_yanny
+    global _maskbit_schemas
+
+    if _maskbit_schemas is None:
+        path_par = os.path.join(os.path.dirname(marvin.__file__), 'data', 'sdssMaskbits.par')
+        path_npz = os.path.splitext(path_par)[0] + '.npz'
 
-    if _maskbits_from_yanny is None:
-        path_maskbits = os.path.join(os.path.dirname(marvin.__file__), 'data', 'sdssMaskbits.par')
-        _maskbits_from_yanny = yanny(path_maskbits, np=True)
+        _maskbit_schemas = _load_compiled_maskbit_schemas(path_par, path_npz)
+        if _maskbit_schemas is None:
+            _maskbit_schemas = _compile_maskbit_schemas(path_par, path_npz)
 
-    return _maskbits_from_yanny['MASKBITS']
+    return _maskbit_schemas
 
 
 def get_available_maskbits():
@@ -46,7 +121,95 @@ def get_available_maskbits():
         list: Names of available maskbits.
     """
     maskbits = _read_maskbit_schemas()
-    return sorted(set([it[0] for it in maskbits]))
+    return sorted(set(maskbits['flag'].tolist()))
+
+
+def _get_lookup_tables(bits, labels):
+    """Returns the lookup tables for the ``bits`` and ``labels`` of a schema.
+
+    A dictionary with the ``bits`` and ``labels`` arrays (in the order of the
+    schema) and the ``label_to_bit`` and ``bit_to_label`` mappings. If a label
+    or bit is repeated, the first one is used.
+
+    """
+
+    bits = np.asarray(bits, dtype=np.int64)
+    labels = np.asarray(labels, dtype=object)
+
+    return {'bits': bits,
+            'labels': labels,
+            'label_to_bit': dict(zip(labels[::-1].tolist(), bits[::-1].tolist())),
+            'bit_to_label': dict(zip(bits[::-1].tolist(), labels[::-1].tolist()))}
+
+
+class MaskbitSchema(object):
+    """The schema of a maskbit from ``sdssMaskbits.par``.
+
+    A read-only schema shared by all the `Maskbit` instances with the same
+    name (see `get_maskbit_schema`). The DataFrame representation is only
+    created when first accessed.
+
+    Parameters:
+        name (str):
+            Name of the maskbit.
+        bits, labels, descriptions (array):
+            The bits, labels, and descriptions of the schema.
+    """
+
+    def __init__(self, name, bits, labels, descriptions):
+
+        self.name = name
+        self.bits = bits
+        self.labels = labels
+        self.descriptions = descriptions
+
+        self._dataframe = None
+        self._lookup = None
+
+    def __repr__(self):
+        return '<MaskbitSchema {0!r} nbits={1}>'.format(self.name, len(self.bits))
+
+    def __reduce__(self):
+        # Copies and unpickled schemas are the interned ones.
+        return (get_maskbit_schema, (self.name,))
+
+    @property
+    def dataframe(self):
+        """The schema as a DataFrame with ``bit``, ``label``, and ``description`` columns."""
+
+        if self._dataframe is None:
+            self._dataframe = pd.DataFrame({'bit': self.bits,
+                                            'label': self.labels,
+                                            'description': self.descriptions},
+                                           columns=['bit', 'label', 'description'])
+
+        return self._dataframe
+
+    @property
+    def lookup(self):
+        """The lookup tables of the schema."""
+
+        if self._lookup is None:
+            self._lookup = _get_lookup_tables(self.bits, self.labels)
+
+        return self._lookup
+
+
+def get_maskbit_schema(name):
+    """Returns the shared `MaskbitSchema` for the maskbit ``name``.
+
+    The schema is empty if ``name`` is not in ``sdssMaskbits.par``.
+
+    """
+
+    if name not in _schemas:
+        maskbits = _read_maskbit_schemas()
+        selected = maskbits['flag'] == name
+        _schemas[name] = MaskbitSchema(name, maskbits['bit'][selected],
+                                       maskbits['label'][selected],
+                                       maskbits['description'][selected])
+
+    return _schemas[name]
 
 
 def get_manga_target(flag_id, bitmasks, header):
@@ -79,7 +242,8 @@ class Maskbit(object):
 
     Parameters:
         schema (DataFrame):
-            Maskbit schema.
+            Maskbit schema. If ``None``, the schema ``name`` from
+            ``sdssMaskbits.par`` is used.
         name (str):
             Name of maskbit.
         description (str):
@@ -89,7 +253,8 @@ class Maskbit(object):
     def __init__(self, name, schema=None, description=None):
 
         self.name = name
-        self.schema = schema if schema is not None else self._load_schema(name)
+        self._lookup = None
+        self.schema = schema
         self.description = description if description is not None else None
         self.mask = None
 
@@ -100,20 +265,50 @@ class Maskbit(object):
             labels = 'shape={}'.format(self.mask.shape)
         return '<Maskbit {0!r} {1}>'.format(self.name, labels)
 
-    def _load_schema(self, flag_name):
-        """Load SDSS Maskbit schema from yanny file.
+    @property
+    def schema(self):
+        """The schema of the maskbit, as a DataFrame."""
 
-        Parameters:
-            flag_name (str):
-                Name of flag.
+        if self._schema is None:
+            return self._maskbit_schema.dataframe
+
+        return self._schema
+
+    @schema.setter
+    def schema(self, value):
+
+        self._schema = value
+        self._maskbit_schema = get_maskbit_schema(self.name) if value is None else None
+
+    def _get_lookup(self):
+        """Returns the lookup tables of the schema.
+
+        For schemas from ``sdssMaskbits.par`` these are shared by all the
+        instances. For custom schemas they are computed once and recomputed
+        only if the schema is replaced.
 
-        Returns:
-            DataFrame: Schema of flag.
         """
-        maskbits = _read_maskbit_schemas()
-        flag = maskbits[maskbits['flag'] == flag_name]
 
-        return pd.DataFrame(flag[['bit', 'label', 'description']])
+        if self._schema is None:
+            return self._maskbit_schema.lookup
+
+        if self._lookup is None or self._lookup[0] is not self._schema:
+            self._lookup = (self._schema,
+                            _get_lookup_tables(self._schema.bit.values,
+                                               self._schema.label.values))
+
+        return self._lookup[1]
+
+    def _get_values(self, values):
+        """Returns ``values``, or the mask if ``None``, as an integer array."""
+
+        assert (self.mask is not None) or (values is not None), 'Must provide values.'
+
+        values = np.asarray(self.mask if values is None else values)
+        if values.dtype.kind not in 'iu':
+            values = values.astype(np.int64)
+
+        return values
 
     @property
     def bits(self):
@@ -174,39 +369,41 @@ class Maskbit(object):
 
         return bits_set
 
-    def _get_uniq_bits(self, values):
-        ''' Return a dictionary of unique bits
+    def bit_planes(self, values=None):
+        """Returns which bits of the schema are set for each mask value.
+
+        The bits are computed with vectorised shifts, without looping over
+        the values.
 
         Parameters:
-            values (list):
-                A flattened list of mask values
+            values (int or array):
+                Mask values. If ``None``, apply to entire
+                ``Maskbit.mask`` array.  Default is ``None``.
 
         Returns:
-            dict:
-                A unique dictionary of {mask value: bit list} as {key: value}
-        '''
-        uniqvals = set(values)
-        vdict = {v: self._value_to_bits(v, self.schema.bit.values) for v in uniqvals}
-        return vdict
+            array:
+                Boolean array of shape ``values.shape + (nbits,)``, where
+                element ``[..., ii]`` is ``True`` if the ``ii``-th bit of the
+                schema (``schema.bit[ii]``) is set.
 
-    def _get_uniq_labels(self, values):
-        ''' Return a dictionary of unique labels
+        Example:
+            >>> maps = Maps(plateifu='8485-1901')
+            >>> ha = maps['emline_gflux_ha_6564']
+            >>> ha.pixmask.bit_planes().shape
+            (34, 34, 31)
+        """
 
-        Parameters:
-            values (list):
-                A flattened list of mask values
+        values = self._get_values(values)
+        bits = self._get_lookup()['bits'].astype(values.dtype)
 
-        Returns:
-            dict:
-                A unique dictionary of {mask value: labels list} as {key: value}
-        '''
-        uniqbits = self._get_uniq_bits(values)
-        uniqlabels = {k: self.schema.label[self.schema.bit.isin(v)].values.tolist() for k, v in uniqbits.items()}
-        return uniqlabels
+        return (np.right_shift(values[..., np.newaxis], bits) & 1).astype(bool)
 
     def _get_a_set(self, values, convert_to='bits'):
         ''' Convert mask values to a list of either bit or label sets.
 
+        The bits of each unique value are decoded once, from its bit planes,
+        and the lists are then broadcast back to the shape of ``values``.
+
         Parameters:
             values (int or array):
                 Mask values. If ``None``, apply to entire
@@ -219,28 +416,24 @@ class Maskbit(object):
                 Bits/Labels that are set.
 
         '''
-        assert (self.mask is not None) or (values is not None), 'Must provide values.'
 
-        values = np.array(self.mask) if values is None else np.array(values)
-        ndim = values.ndim
-        shape = values.shape
+        values = self._get_values(values)
 
-        assert ndim <= 3, '`value` must be int, 1-D array, 2-D array, or 3-D array.'
+        assert values.ndim <= 3, '`value` must be int, 1-D array, 2-D array, or 3-D array.'
 
-        flatmask = values.flatten()
+        lookup = self._get_lookup()
+        column = lookup['bits'] if convert_to == 'bits' else lookup['labels']
 
-        if convert_to == 'bits':
-            uniqvals = self._get_uniq_bits(flatmask)
-        elif convert_to == 'labels':
-            uniqvals = self._get_uniq_labels(flatmask)
+        uniqvals, inverse = np.unique(values, return_inverse=True)
 
-        vallist = list(map(lambda x: uniqvals[x], flatmask))
-        if ndim > 0:
-            vals_set = np.reshape(vallist, shape).tolist()
-        else:
-            vals_set = vallist[0]
+        uniqsets = np.empty(len(uniqvals), dtype=object)
+        for ii, plane in enumerate(self.bit_planes(uniqvals)):
+            uniqsets[ii] = column[plane].tolist()
+
+        if values.ndim == 0:
+            return uniqsets[0]
 
-        return vals_set
+        return uniqsets[inverse.reshape(values.shape)].tolist()
 
     def _value_to_bits(self, value, bits_all):
         """Convert mask value to a list of bits.
@@ -297,7 +490,7 @@ class Maskbit(object):
         """
         # Base condition
         if isinstance(nested, (int, np.integer)):
-            return self.schema.label[self.schema.bit == nested].values[0]
+            return self._get_lookup()['bit_to_label'][int(nested)]
 
         return [self._bits_to_labels(it) for it in nested]
 
@@ -323,13 +516,10 @@ class Maskbit(object):
         if isinstance(labels, str):
             labels = [labels]
 
-        bit_values = []
-        for label in labels:
-            bit = self.schema.bit[self.schema.label == label]
-            if not bit.empty:
-                bit_values.append(bit.values[0])
+        label_to_bit = self._get_lookup()['label_to_bit']
+        bit_values = set(label_to_bit[label] for label in labels if label in label_to_bit)
 
-        return np.sum([2**value for value in bit_values])
+        return sum(1 << bit for bit in bit_values)
 
     def labels_to_bits(self, labels):
         """Convert bit labels into bits.
@@ -350,14 +540,22 @@ class Maskbit(object):
             >>> ha.pixmask.labels_to_value(['NOCOV', 'LOWCOV'])
             [0, 1]
         """
-        return self.values_to_bits(self.labels_to_value(labels))
+        if isinstance(labels, str):
+            labels = [labels]
+
+        lookup = self._get_lookup()
+        labels = set(labels)
+
+        return sorted(set(bit for bit, label in zip(lookup['bits'].tolist(),
+                                                    lookup['labels'].tolist())
+                          if label in labels))
 
     def get_mask(self, labels, mask=None, dtype=int):
         """Create mask from a list of labels.
 
-        If ``dtype`` is ``int``, then ``get_mask`` can effectively
-        perform an OR or AND operation.  However, if ``dtype`` is
-        ``bool``, then ``get_mask`` does an OR.
+        If ``dtype`` is numeric (e.g., ``int``), then ``get_mask`` can
+        effectively perform an OR or AND operation.  However, if ``dtype``
+        is ``bool``, then ``get_mask`` does an OR.
 
         Parameters:
             labels (str or list):
@@ -366,7 +564,7 @@ class Maskbit(object):
                 User-defined mask. If ``None``, use ``self.mask``.
                 Default is ``None``.
             dtype:
-                Output dtype, which must be either ``int`` or ``bool``.
+                Output dtype (e.g., ``int``, ``bool``, or ``np.uint8``).
                 Default is ``int``.
 
         Returns:
@@ -386,20 +584,18 @@ class Maskbit(object):
                    [ True,  True,  True, ...,  True,  True,  True]], dtype=bool)
         """
 
-        assert dtype in [int, bool], '``dtype`` must be either ``int`` or ``bool``.'
-
         if isinstance(labels, str):
             labels = [labels]
 
-        schema_labels = self.schema.label.tolist()
+        label_to_bit = self._get_lookup()['label_to_bit']
         for label in labels:
-            if label not in schema_labels:
+            if label not in label_to_bit:
                 raise ValueError('label {0!r} not found in the maskbit schema.'.format(label))
 
-        bits = self.labels_to_bits(labels)
-        mask = mask if mask is not None else self.mask
+        mask = np.asarray(mask if mask is not None else self.mask)
 
-        if len(bits) == 0:
-            return np.zeros(mask.shape, dtype=np.int)
+        # The bits are disjoint, so OR-ing them into a single value and masking
+        # with it is equivalent to summing the mask for each bit.
+        masked = np.bitwise_and(mask, self.labels_to_value(labels))
 
-        return np.sum([mask & 2**bit for bit in bits], axis=0).astype(dtype)
+        return masked.astype(dtype)
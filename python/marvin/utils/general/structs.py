@@ -22,8 +22,8 @@ from fuzzywuzzy import fuzz as fuzz_fuzz
 from fuzzywuzzy import process as fuzz_proc
 
 
-__ALL__ = ['FuzzyDict', 'Dotable', 'DotableCaseInsensitive', 'get_best_fuzzy',
-           'FuzzyList', 'string_folding_wrapper', 'gunzip']
+__ALL__ = ['FuzzyDict', 'LazyFuzzyDict', 'FuzzyMemo', 'Dotable', 'DotableCaseInsensitive',
+           'get_best_fuzzy', 'FuzzyList', 'string_folding_wrapper', 'gunzip']
 
 
 class Dotable(dict):
@@ -114,8 +114,55 @@ def get_best_fuzzy(value, choices, min_score=75, scorer=fuzz_fuzz.WRatio, return
     return best if return_score else best[0]
 
 
+# The maximum number of fuzzy matches memoised by each FuzzyDict or FuzzyList.
+FUZZY_MEMO_SIZE = 256
+
+
+class FuzzyMemo(OrderedDict):
+    """A bounded, least-recently-used memo of fuzzy matches.
+
+    Maps each searched value to its best match or, if the match failed, to the
+    message of the `ValueError` raised, so that neither is computed twice.
+
+    Parameters:
+        maxsize (int):
+            The maximum number of values memoised.
+    """
+
+    def __init__(self, maxsize=FUZZY_MEMO_SIZE):
+
+        self.maxsize = maxsize
+        OrderedDict.__init__(self)
+
+    def match(self, value, func):
+        """Returns ``func(value)``, calling ``func`` only if ``value`` is not memoised."""
+
+        try:
+            best, error = self.pop(value)
+        except KeyError:
+            try:
+                best, error = func(value), None
+            except ValueError as ee:
+                best, error = None, str(ee)
+
+        # Reinserts the value as the most recently used.
+        self[value] = (best, error)
+        while len(self) > self.maxsize:
+            self.popitem(last=False)
+
+        if error is not None:
+            raise ValueError(error)
+
+        return best
+
+
 class FuzzyDict(OrderedDict):
-    """A dotable dictionary that uses fuzzywuzzy to select the key."""
+    """A dotable dictionary that uses fuzzywuzzy to select the key.
+
+    Keys are matched exactly first. Fuzzy matches are memoised until keys
+    are added or removed.
+
+    """
 
     def __getattr__(self, value):
         if '__' in value:
@@ -127,21 +174,128 @@ class FuzzyDict(OrderedDict):
         if not isinstance(value, six.string_types):
             return self.values()[value]
 
-        if value in self.keys():
+        if dict.__contains__(self, value):
             return dict.__getitem__(self, value)
 
-        best = get_best_fuzzy(value, self.keys())
+        return dict.__getitem__(self, self._get_best_fuzzy(value))
+
+    def _get_best_fuzzy(self, value):
+        """Returns the key that best matches ``value``."""
+
+        memo = self.__dict__.get('_fuzzy_memo')
+        if memo is None:
+            memo = self.__dict__['_fuzzy_memo'] = FuzzyMemo()
+
+        return memo.match(value, lambda value: get_best_fuzzy(value, list(self.keys())))
+
+    def _reset_memo(self):
+        """Clears the memoised fuzzy matches."""
 
-        return dict.__getitem__(self, best)
+        self.__dict__.pop('_fuzzy_memo', None)
 
     def __dir__(self):
 
         return list(self.keys())
 
+    # Methods that add or remove keys clear the memoised matches.
+
+    def __setitem__(self, key, *args):
+        if not dict.__contains__(self, key):
+            self._reset_memo()
+        return OrderedDict.__setitem__(self, key, *args)
+
+    def __delitem__(self, *args):
+        self._reset_memo()
+        return OrderedDict.__delitem__(self, *args)
+
+    def pop(self, *args):
+        self._reset_memo()
+        return OrderedDict.pop(self, *args)
+
+    def popitem(self, *args, **kwargs):
+        self._reset_memo()
+        return OrderedDict.popitem(self, *args, **kwargs)
+
+    def setdefault(self, *args):
+        self._reset_memo()
+        return OrderedDict.setdefault(self, *args)
+
+    def update(self, *args, **kwargs):
+        self._reset_memo()
+        return OrderedDict.update(self, *args, **kwargs)
+
+    def clear(self):
+        self._reset_memo()
+        return OrderedDict.clear(self)
+
+
+class _LazyValue(object):
+    """Wraps the function that creates a value of a `.LazyFuzzyDict`."""
+
+    def __init__(self, func):
+        self.func = func
+
+
+class LazyFuzzyDict(FuzzyDict):
+    """A `.FuzzyDict` whose values can be created on first access.
+
+    `.set_lazy` stores a function, without arguments, that returns the value
+    for a key. The function is called, and its result stored, the first time
+    the key is accessed. Pickling or copying the dictionary creates all the
+    values.
+
+    """
+
+    def set_lazy(self, key, func):
+        """Sets a function that will create the value for ``key``."""
+
+        FuzzyDict.__setitem__(self, key, _LazyValue(func))
+
+    def _resolve(self, key):
+        """Returns the value for ``key``, creating it if needed."""
+
+        value = dict.__getitem__(self, key)
+
+        if isinstance(value, _LazyValue):
+            value = value.func()
+            OrderedDict.__setitem__(self, key, value)
+
+        return value
+
+    def __getitem__(self, value):
+
+        if not isinstance(value, six.string_types):
+            return self._resolve(list(self.keys())[value])
+
+        if dict.__contains__(self, value):
+            return self._resolve(value)
+
+        return self._resolve(self._get_best_fuzzy(value))
+
+    def get(self, key, default=None):
+
+        return self._resolve(key) if dict.__contains__(self, key) else default
+
+    def values(self):
+
+        return [self._resolve(key) for key in list(self.keys())]
+
+    def items(self):
+
+        return [(key, self._resolve(key)) for key in list(self.keys())]
+
+    def __reduce__(self):
+
+        return (FuzzyDict, (self.items(), ))
+
 
 class FuzzyList(list):
     """A list that uses fuzzywuzzy to select the item.
 
+    The list keeps an index of the mapped names of its items, so that exact
+    matches do not need a fuzzy search, and memoises the fuzzy matches. Both
+    are discarded when the list is modified.
+
     Parameters:
         the_list (list):
             The list on which we will do fuzzy searching.
@@ -154,23 +308,74 @@ class FuzzyList(list):
         self.use_fuzzy = use_fuzzy if use_fuzzy else get_best_fuzzy
 
         list.__init__(self, the_list)
+        self._reset_cache()
 
     def mapper(self, item):
         """The function that maps each item to the querable string."""
 
         return str(item)
 
-    def __eq__(self, value):
+    def _get_cache(self):
+        """Returns a dictionary of cached values, which is cleared if the list changes."""
+
+        cache = self.__dict__.get('_fuzzy_cache')
+        if cache is None:
+            cache = self.__dict__['_fuzzy_cache'] = {}
+
+        return cache
+
+    def _reset_cache(self):
+        """Clears the index of mapped names and the memoised fuzzy matches."""
+
+        self.__dict__.pop('_fuzzy_cache', None)
+
+    def _get_index(self):
+        """Returns the mapped names of the items and a dictionary of their positions."""
+
+        cache = self._get_cache()
+
+        if 'index' not in cache:
+            names = [self.mapper(item) for item in self]
+            positions = {}
+            for ii, name in enumerate(names):
+                positions.setdefault(name, ii)
+            cache['index'] = (names, positions)
+
+        return cache['index']
 
-        self_values = [self.mapper(item) for item in self]
+    def _fuzzy(self, value, names):
 
         try:
-            best = self.use_fuzzy(value, self_values)
+            return self.use_fuzzy(value, names)
         except ValueError:
             # Second pass, using underscores.
-            best = self.use_fuzzy(value.replace(' ', '_'), self_values)
+            return self.use_fuzzy(value.replace(' ', '_'), names)
 
-        return self[self_values.index(best)]
+    def _find(self, value):
+        """Returns the position of the item whose mapped name best matches ``value``."""
+
+        names, positions = self._get_index()
+
+        if not isinstance(value, six.string_types):
+            return names.index(self._fuzzy(value, names))
+
+        if value in positions:
+            position = positions[value]
+        else:
+            cache = self._get_cache()
+            memo = cache.setdefault('memo', FuzzyMemo())
+            position = positions[memo.match(value, lambda value: self._fuzzy(value, names))]
+
+        # Rebuilds the index if an item has been renamed since it was created.
+        if self.mapper(list.__getitem__(self, position)) != names[position]:
+            self._reset_cache()
+            return self._find(value)
+
+        return position
+
+    def __eq__(self, value):
+
+        return list.__getitem__(self, self._find(value))
 
     def __contains__(self, value):
 
@@ -178,7 +383,7 @@ class FuzzyList(list):
             return super(FuzzyList, self).__contains__(value)
 
         try:
-            self.__eq__(value)
+            self._find(value)
             return True
         except ValueError:
             return False
@@ -192,17 +397,66 @@ class FuzzyList(list):
 
     def __getattr__(self, value):
 
-        self_values = [super(FuzzyList, self).__getattribute__('mapper')(item)
-                       for item in self]
+        # Special attributes are never items (and are looked up, e.g., when copying).
+        if value.startswith('__') and value.endswith('__'):
+            return super(FuzzyList, self).__getattribute__(value)
+
+        names, positions = super(FuzzyList, self).__getattribute__('_get_index')()
 
-        if value in self_values:
+        if value in positions:
             return self[value]
 
         return super(FuzzyList, self).__getattribute__(value)
 
     def __dir__(self):
 
-        return [self.mapper(item) for item in self]
+        return list(self._get_index()[0])
+
+    # Methods that modify the list clear the index and memoised matches.
+
+    def __setitem__(self, *args):
+        self._reset_cache()
+        return list.__setitem__(self, *args)
+
+    def __delitem__(self, *args):
+        self._reset_cache()
+        return list.__delitem__(self, *args)
+
+    def __iadd__(self, other):
+        self._reset_cache()
+        return list.__iadd__(self, other)
+
+    def __imul__(self, other):
+        self._reset_cache()
+        return list.__imul__(self, other)
+
+    def append(self, *args):
+        self._reset_cache()
+        return list.append(self, *args)
+
+    def extend(self, *args):
+        self._reset_cache()
+        return list.extend(self, *args)
+
+    def insert(self, *args):
+        self._reset_cache()
+        return list.insert(self, *args)
+
+    def remove(self, *args):
+        self._reset_cache()
+        return list.remove(self, *args)
+
+    def pop(self, *args):
+        self._reset_cache()
+        return list.pop(self, *args)
+
+    def sort(self, *args, **kwargs):
+        self._reset_cache()
+        return list.sort(self, *args, **kwargs)
+
+    def reverse(self):
+        self._reset_cache()
+        return list.reverse(self)
 
 
 class OrderedDefaultDict(FuzzyDict):
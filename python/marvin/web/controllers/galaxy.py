@@ -123,40 +123,67 @@ def getWebSpectrum(cube, x, y, xyorig=None, byradec=False):
     return webspec, specmsg, badspots
 
 
+def _format_webmap(maps, data, parameter, name):
+    ''' Format a map for the web '''
+
+    # correct the stellar_sigma or emline_gsigma maps
+    if parameter == 'stellar_sigma' or parameter == 'emline_gsigma':
+        try:
+            data = data.inst_sigma_correction()
+        except MarvinError as e:
+            pass
+        else:
+            name = 'Corrected {0}'.format(name)
+
+    webmap = {'values': [it.tolist() for it in data.value],
+              'ivar': [it.tolist() for it in data.ivar] if data.ivar is not None else None,
+              'mask': [it.tolist() for it in data.mask] if data.mask is not None else None}
+    mapmsg = "{0}: {1}-{2}".format(name, maps.bintype, maps.template)
+    return webmap, mapmsg
+
+
+def _get_webmap_name(parameter, channel):
+    ''' Get the name of a web map '''
+    if channel:
+        return '{0}_{1}'.format(parameter.lower(), channel)
+    else:
+        return '{0}'.format(parameter.lower())
+
+
 def getWebMap(cube, parameter='emline_gflux', channel='ha_6564',
               bintype=None, template=None):
     ''' Get and format a map for the web '''
-    if channel:
-        name = '{0}_{1}'.format(parameter.lower(), channel)
-    else:
-        name = '{0}'.format(parameter.lower())
+    name = _get_webmap_name(parameter, channel)
 
-    webmap = None
     try:
         maps = cube.getMaps(plateifu=cube.plateifu, mode='local',
                             bintype=bintype, template=template)
         data = maps.getMap(parameter, channel=channel)
+        webmap, mapmsg = _format_webmap(maps, data, parameter, name)
+    except Exception as e:
+        webmap, mapmsg = None, 'Could not get map: {0}'.format(e)
+    return webmap, mapmsg
 
-        # correct the stellar_sigma or emline_gsigma maps
-        if parameter == 'stellar_sigma' or parameter == 'emline_gsigma':
-            try:
-                data = data.inst_sigma_correction()
-            except MarvinError as e:
-                pass
-            else:
-                name = 'Corrected {0}'.format(name)
 
+def getWebMaps(cube, parameters, bintype=None, template=None):
+    ''' Get and format a list of maps for the web
+
+    parameters - list of (parameter, channel) tuples
+
+    Retrieves all the maps at once with Maps.getMaps.  If that fails, gets
+    each map with getWebMap so that the message of each failed map is kept.
+    '''
+    try:
+        maps = cube.getMaps(plateifu=cube.plateifu, mode='local',
+                            bintype=bintype, template=template)
+        names = [_get_webmap_name(parameter, channel) for parameter, channel in parameters]
+        data = maps.getMaps(names)
+        return [_format_webmap(maps, mapdata, parameter, name)
+                for (parameter, __), name, mapdata in zip(parameters, names, data)]
     except Exception as e:
-        mapmsg = 'Could not get map: {0}'.format(e)
-    else:
-        vals = data.value
-        ivar = data.ivar
-        mask = data.mask
-        webmap = {'values': [it.tolist() for it in data.value],
-                  'ivar': [it.tolist() for it in data.ivar] if data.ivar is not None else None,
-                  'mask': [it.tolist() for it in data.mask] if data.mask is not None else None}
-        mapmsg = "{0}: {1}-{2}".format(name, maps.bintype, maps.template)
-    return webmap, mapmsg
+        return [getWebMap(cube, parameter=parameter, channel=channel,
+                          bintype=bintype, template=template)
+                for parameter, channel in parameters]
 
 
 def buildMapDict(cube, params, dapver, bintemp=None):
@@ -175,17 +202,22 @@ def buildMapDict(cube, params, dapver, bintemp=None):
     mapdict = []
     params = params if isinstance(params, list) else [params]
 
+    parameters = []
     for param in params:
         param = str(param)
         try:
             parameter, channel = param.split(':')
         except ValueError as e:
             parameter, channel = (param, None)
-        webmap, mapmsg = getWebMap(cube, parameter=parameter, channel=channel,
-                                   bintype=bintype, template=temp)
+        parameters.append((parameter, channel))
+
+    webmaps = getWebMaps(cube, parameters, bintype=bintype, template=temp)
+
+    # The schema lookup tables are computed once for all the maps.
+    mask = Maskbit('MANGA_DAPPIXMASK')
 
+    for (parameter, channel), (webmap, mapmsg) in zip(parameters, webmaps):
         plotparams = datamodel[dapver].get_plot_params(prop=parameter)
-        mask = Maskbit('MANGA_DAPPIXMASK')
         baddata_labels = [it for it in plotparams['bitmasks'] if it != 'NOCOV']
         baddata_bits = {it.lower(): int(mask.labels_to_bits(it)[0]) for it in baddata_labels}
         plotparams['bits'] = {'nocov': int(mask.labels_to_bits('NOCOV')[0]),